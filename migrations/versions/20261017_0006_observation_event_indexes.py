@@ -0,0 +1,44 @@
+"""observation event filter indexes
+
+Revision ID: 20261017_0006
+Revises: 20260227_0005
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "20261017_0006"
+down_revision = "20260227_0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Back the SQL filters and (created_at, event_id) keyset pages of list_observation_events / trace replay.
+    # The scans seek and order by index but are not index-only: pages fetch full rows from the heap.
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_observation_event_trace_created "
+        "ON governance.observation_event(trace_id, created_at, event_id);"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_observation_event_task_created "
+        "ON governance.observation_event(task_id, created_at, event_id);"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_observation_event_type_created "
+        "ON governance.observation_event(event_type, created_at, event_id);"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_observation_event_created "
+        "ON governance.observation_event(created_at, event_id);"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS governance.idx_observation_event_created;")
+    op.execute("DROP INDEX IF EXISTS governance.idx_observation_event_type_created;")
+    op.execute("DROP INDEX IF EXISTS governance.idx_observation_event_task_created;")
+    op.execute("DROP INDEX IF EXISTS governance.idx_observation_event_trace_created;")
@@ -0,0 +1,152 @@
+"""range-partition observation and audit event tables by created_at
+
+Revision ID: 20261017_0007
+Revises: 20261017_0006
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "20261017_0007"
+down_revision = "20261017_0006"
+branch_labels = None
+depends_on = None
+
+
+# (table, columns DDL, key column, granularity, periods created ahead)
+_TABLES = (
+    (
+        "governance.observation_event",
+        """
+            event_id VARCHAR(64) NOT NULL,
+            trace_id VARCHAR(128) NOT NULL,
+            span_id VARCHAR(128),
+            source_service VARCHAR(64) NOT NULL,
+            event_type VARCHAR(64) NOT NULL,
+            status VARCHAR(32) NOT NULL,
+            severity VARCHAR(16) NOT NULL,
+            task_id VARCHAR(64),
+            workpackage_id VARCHAR(128),
+            ruleset_id VARCHAR(64),
+            payload_json JSONB NOT NULL DEFAULT '{}'::jsonb,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+        """,
+        "event_id",
+        "day",
+        7,
+    ),
+    (
+        "governance.observation_metric",
+        """
+            metric_id VARCHAR(64) NOT NULL,
+            metric_name VARCHAR(128) NOT NULL,
+            metric_value DOUBLE PRECISION NOT NULL,
+            labels_json JSONB NOT NULL DEFAULT '{}'::jsonb,
+            window_start TIMESTAMPTZ,
+            window_end TIMESTAMPTZ,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+        """,
+        "metric_id",
+        "day",
+        7,
+    ),
+    (
+        "audit.event_log",
+        """
+            event_id VARCHAR(64) NOT NULL,
+            event_type VARCHAR(64) NOT NULL,
+            caller VARCHAR(128) NOT NULL,
+            payload JSONB NOT NULL DEFAULT '{}'::jsonb,
+            related_change_id VARCHAR(64),
+            created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+        """,
+        "event_id",
+        "week",
+        4,
+    ),
+)
+
+_INDEXES = {
+    "governance.observation_event": (
+        "CREATE INDEX IF NOT EXISTS idx_observation_event_trace_created ON governance.observation_event(trace_id, created_at, event_id);",
+        "CREATE INDEX IF NOT EXISTS idx_observation_event_task_created ON governance.observation_event(task_id, created_at, event_id);",
+        "CREATE INDEX IF NOT EXISTS idx_observation_event_type_created ON governance.observation_event(event_type, created_at, event_id);",
+        "CREATE INDEX IF NOT EXISTS idx_observation_event_created ON governance.observation_event(created_at, event_id);",
+    ),
+    "governance.observation_metric": (
+        "CREATE INDEX IF NOT EXISTS idx_observation_metric_name_created ON governance.observation_metric(metric_name, created_at);",
+    ),
+    "audit.event_log": (
+        "CREATE INDEX IF NOT EXISTS idx_event_log_change_created ON audit.event_log(related_change_id, created_at);",
+    ),
+}
+
+
+def _index_name(statement: str) -> str:
+    return statement.split("EXISTS ", 1)[1].split(" ", 1)[0]
+
+
+def _rename_to_legacy(table: str) -> None:
+    schema, name = table.split(".")
+    op.execute(f"ALTER TABLE {table} RENAME TO {name}_legacy;")
+    op.execute(f"ALTER INDEX IF EXISTS {schema}.{name}_pkey RENAME TO {name}_legacy_pkey;")
+    for statement in _INDEXES[table]:
+        op.execute(f"DROP INDEX IF EXISTS {schema}.{_index_name(statement)};")
+
+
+def _move_rows_from_legacy(table: str) -> None:
+    op.execute(f"INSERT INTO {table} SELECT * FROM {table}_legacy;")
+    # For the downgrade the legacy table is the partitioned parent; its partitions go with it.
+    op.execute(f"DROP TABLE {table}_legacy;")
+
+
+def upgrade() -> None:
+    for table, columns, key, granularity, ahead in _TABLES:
+        _rename_to_legacy(table)
+        op.execute(f"CREATE TABLE {table} ({columns}) PARTITION BY RANGE (created_at);")
+        step = 7 if granularity == "week" else 1
+        # Rows older than the current period land in one history partition; the partition
+        # maintenance job keeps creating upcoming periods and expires partitions past retention.
+        op.execute(
+            f"""
+            DO $$
+            DECLARE
+              period_start date := date_trunc('{granularity}', now() AT TIME ZONE 'UTC')::date;
+              lower_bound date;
+            BEGIN
+              EXECUTE format(
+                'CREATE TABLE {table}_p_history PARTITION OF {table} FOR VALUES FROM (MINVALUE) TO (%L)',
+                period_start::timestamp AT TIME ZONE 'UTC'
+              );
+              FOR i IN 0..{ahead} LOOP
+                lower_bound := period_start + i * {step};
+                EXECUTE format(
+                  'CREATE TABLE {table}_p%s PARTITION OF {table} FOR VALUES FROM (%L) TO (%L)',
+                  to_char(lower_bound, 'YYYYMMDD'),
+                  lower_bound::timestamp AT TIME ZONE 'UTC',
+                  (lower_bound + {step})::timestamp AT TIME ZONE 'UTC'
+                );
+              END LOOP;
+            END $$;
+            """
+        )
+        op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT;")
+        _move_rows_from_legacy(table)
+        op.execute(f"ALTER TABLE {table} ADD PRIMARY KEY ({key}, created_at);")
+        for statement in _INDEXES[table]:
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    for table, columns, key, _, _ in _TABLES:
+        _rename_to_legacy(table)
+        op.execute(f"CREATE TABLE {table} ({columns});")
+        _move_rows_from_legacy(table)
+        op.execute(f"ALTER TABLE {table} ADD PRIMARY KEY ({key});")
+        if table == "governance.observation_event":
+            # Restore the 20261017_0006 indexes.
+            for statement in _INDEXES[table]:
+                op.execute(statement)
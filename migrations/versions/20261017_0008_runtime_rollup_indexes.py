@@ -0,0 +1,32 @@
+"""runtime rollup join indexes
+
+Revision ID: 20261017_0008
+Revises: 20261017_0007
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "20261017_0008"
+down_revision = "20261017_0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Back the windowed task_run -> raw_record -> canonical_record aggregates of the runtime dashboards.
+    op.execute("CREATE INDEX IF NOT EXISTS idx_task_run_created ON governance.task_run(created_at);")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_raw_record_batch ON governance.raw_record(batch_id);")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_canonical_record_raw "
+        "ON governance.canonical_record(raw_id) INCLUDE (confidence, strategy, ruleset_version);"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS governance.idx_canonical_record_raw;")
+    op.execute("DROP INDEX IF EXISTS governance.idx_raw_record_batch;")
+    op.execute("DROP INDEX IF EXISTS governance.idx_task_run_created;")
@@ -0,0 +1,96 @@
+"""maintained manual review queue
+
+Revision ID: 20261017_0009
+Revises: 20261017_0008
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "20261017_0009"
+down_revision = "20261017_0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # One row per raw record that needs (or had) a manual decision; GovernanceRepository keeps it in
+    # step with result, review and task status writes.
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS governance.review_queue (
+            raw_id VARCHAR(64) PRIMARY KEY,
+            task_id VARCHAR(64) NOT NULL,
+            raw_text TEXT NOT NULL DEFAULT '',
+            canon_text TEXT NOT NULL DEFAULT '',
+            confidence DOUBLE PRECISION NOT NULL DEFAULT 0,
+            strategy VARCHAR(64) NOT NULL DEFAULT '',
+            task_status VARCHAR(32) NOT NULL DEFAULT '',
+            review_status VARCHAR(32),
+            reviewer VARCHAR(128),
+            review_comment TEXT,
+            reviewed_at TIMESTAMPTZ,
+            task_created_at TIMESTAMPTZ,
+            task_updated_at TIMESTAMPTZ NOT NULL,
+            canonical_updated_at TIMESTAMPTZ,
+            pending BOOLEAN NOT NULL,
+            risk_level VARCHAR(16) NOT NULL,
+            stage VARCHAR(32) NOT NULL,
+            refreshed_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+        );
+        """
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_review_queue_order "
+        "ON governance.review_queue(pending DESC, confidence ASC, task_updated_at DESC, raw_id ASC);"
+    )
+    op.execute("CREATE INDEX IF NOT EXISTS idx_review_queue_task ON governance.review_queue(task_id);")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_review_raw_latest "
+        "ON governance.review(raw_id, (COALESCE(reviewed_at, updated_at, created_at)) DESC);"
+    )
+    op.execute(
+        """
+        INSERT INTO governance.review_queue (
+            raw_id, task_id, raw_text, canon_text, confidence, strategy, task_status,
+            review_status, reviewer, review_comment, reviewed_at, task_created_at, task_updated_at,
+            canonical_updated_at, pending, risk_level, stage
+        )
+        SELECT DISTINCT ON (raw.raw_id)
+            raw.raw_id, tr.task_id, COALESCE(raw.raw_text, ''), COALESCE(canon.canon_text, ''),
+            COALESCE(canon.confidence, 0), COALESCE(canon.strategy, ''), COALESCE(tr.status, ''),
+            rl.review_status, rl.reviewer, rl.comment, rl.reviewed_at, tr.created_at,
+            COALESCE(tr.updated_at, tr.created_at, NOW()), canon.updated_at,
+            rl.review_status IS NULL,
+            CASE
+                WHEN rl.review_status IS NOT NULL THEN 'low'
+                WHEN UPPER(tr.status) = 'FAILED' OR COALESCE(canon.confidence, 0) < 0.6 OR canon.strategy = 'human_rejected' THEN 'high'
+                WHEN COALESCE(canon.confidence, 0) < 0.85 THEN 'medium'
+                ELSE 'low'
+            END,
+            CASE WHEN rl.review_status IS NULL THEN '待人工确认' ELSE '已人工决策' END
+        FROM governance.task_run tr
+        JOIN governance.raw_record raw ON raw.batch_id = tr.batch_id
+        JOIN governance.canonical_record canon ON canon.raw_id = raw.raw_id
+        LEFT JOIN LATERAL (
+            SELECT rv.review_status, rv.reviewer, rv.comment, rv.reviewed_at
+            FROM governance.review rv
+            WHERE rv.raw_id = raw.raw_id
+            ORDER BY COALESCE(rv.reviewed_at, rv.updated_at, rv.created_at) DESC
+            LIMIT 1
+        ) rl ON TRUE
+        WHERE canon.strategy IN ('human_required', 'human_rejected', 'low_confidence')
+           OR COALESCE(canon.confidence, 0) < 0.85
+           OR tr.status IN ('SUCCEEDED', 'REVIEWED')
+        ORDER BY raw.raw_id, tr.updated_at DESC
+        ON CONFLICT (raw_id) DO NOTHING;
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS governance.idx_review_raw_latest;")
+    op.execute("DROP TABLE IF EXISTS governance.review_queue;")
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import re
+from typing import Optional
+
+from packages.address_core.normalize import normalize_text
+from packages.address_core.parse import parse_normalized
+from packages.address_core.types import AnalyzedAddress
+
+
+_INVALID_ROAD_RE = re.compile(r"(不存在路\d+号)")
+
+
+def analyze_address(raw_text: str, normalized: Optional[str] = None) -> AnalyzedAddress:
+    """Normalize and parse a record exactly once; every later stage reads from the result.
+
+    Callers that already hold the normalized text (e.g. dedup) pass it in to skip
+    the normalization step.
+    """
+    raw = str(raw_text or "")
+    text = normalize_text(raw) if normalized is None else normalized
+    if not text:
+        return AnalyzedAddress(raw_text=raw, normalized="")
+
+    parsed, spans = parse_normalized(text)
+    invalid_road = _INVALID_ROAD_RE.search(text)
+    if invalid_road:
+        spans["invalid_road"] = invalid_road.span(1)
+    return AnalyzedAddress(raw_text=raw, normalized=text, parsed=parsed, spans=spans)
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List
+
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(str(os.getenv(name) or default))
+    except ValueError:
+        return default
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker over a sliding window of call outcomes.
+
+    The circuit opens once the window holds at least ``min_calls`` outcomes and the
+    failure rate reaches ``failure_rate``. After the open period one probe is let
+    through (half-open); a failed probe doubles the open period up to ``max_open_sec``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        window_size: int = 20,
+        min_calls: int = 5,
+        failure_rate: float = 0.5,
+        open_sec: float = 5.0,
+        max_open_sec: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self._window: Deque[bool] = deque(maxlen=max(1, window_size))
+        self._min_calls = max(1, min_calls)
+        self._failure_rate = failure_rate
+        self._base_open_sec = open_sec
+        self._max_open_sec = max_open_sec
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._open_sec = open_sec
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._last_error = ""
+        self._transitions: Deque[Dict[str, Any]] = deque(maxlen=20)
+
+    @classmethod
+    def from_env(cls, name: str) -> "CircuitBreaker":
+        return cls(
+            name,
+            window_size=int(_env_float("ADDRESS_TRUSTED_FENGTU_BREAKER_WINDOW", 20)),
+            min_calls=int(_env_float("ADDRESS_TRUSTED_FENGTU_BREAKER_MIN_CALLS", 5)),
+            failure_rate=_env_float("ADDRESS_TRUSTED_FENGTU_BREAKER_FAILURE_RATE", 0.5),
+            open_sec=_env_float("ADDRESS_TRUSTED_FENGTU_BREAKER_OPEN_SEC", 5.0),
+            max_open_sec=_env_float("ADDRESS_TRUSTED_FENGTU_BREAKER_MAX_OPEN_SEC", 300.0),
+        )
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    @property
+    def last_error(self) -> str:
+        return self._last_error
+
+    def _transition(self, new_state: str, reason: str) -> None:
+        # Caller holds the lock.
+        if new_state == self._state:
+            return
+        self._transitions.append(
+            {"at": time.time(), "from": self._state, "to": new_state, "reason": reason}
+        )
+        self._state = new_state
+        if new_state == OPEN:
+            self._opened_at = self._clock()
+        if new_state == CLOSED:
+            self._window.clear()
+            self._open_sec = self._base_open_sec
+
+    def allow(self) -> bool:
+        """Whether a call may go out now; in half-open only one probe is admitted."""
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if self._state == OPEN:
+                if self._clock() - self._opened_at < self._open_sec:
+                    return False
+                self._transition(HALF_OPEN, "open_period_elapsed")
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._probe_in_flight = False
+                self._transition(CLOSED, "probe_succeeded")
+                return
+            self._window.append(True)
+
+    def record_failure(self, error: str) -> None:
+        with self._lock:
+            self._last_error = str(error or "error")
+            if self._state == HALF_OPEN:
+                self._probe_in_flight = False
+                self._open_sec = min(self._open_sec * 2, self._max_open_sec)
+                self._transition(OPEN, f"probe_failed:{self._last_error}")
+                return
+            self._window.append(False)
+            failures = self._window.count(False)
+            if len(self._window) >= self._min_calls and failures / len(self._window) >= self._failure_rate:
+                self._transition(OPEN, f"failure_rate:{failures}/{len(self._window)}:{self._last_error}")
+
+    def reset(self, reason: str = "manual_reset") -> None:
+        with self._lock:
+            self._probe_in_flight = False
+            self._transition(CLOSED, reason)
+            self._window.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            failures = self._window.count(False)
+            retry_in = 0.0
+            if self._state == OPEN:
+                retry_in = max(0.0, self._open_sec - (self._clock() - self._opened_at))
+            return {
+                "name": self.name,
+                "state": self._state,
+                "window_calls": len(self._window),
+                "window_failures": failures,
+                "open_sec": round(self._open_sec, 3),
+                "retry_in_sec": round(retry_in, 3),
+                "last_error": self._last_error,
+                "transitions": list(self._transitions),
+            }
+
+
+class BreakerRegistry:
+    """Lazily created breakers keyed by name (one per trusted interface)."""
+
+    def __init__(self, factory: Callable[[str], CircuitBreaker] = CircuitBreaker.from_env) -> None:
+        self._factory = factory
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> CircuitBreaker:
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(name)
+                if breaker is None:
+                    breaker = self._factory(name)
+                    self._breakers[name] = breaker
+        return breaker
+
+    def all(self) -> List[CircuitBreaker]:
+        with self._lock:
+            return list(self._breakers.values())
+
+    def reset_all(self, reason: str = "manual_reset") -> None:
+        for breaker in self.all():
+            breaker.reset(reason)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._breakers.clear()
@@ -1,19 +1,38 @@
 from __future__ import annotations
 
-from typing import Dict, Set
+from typing import Dict, Set, Tuple
 
+from packages.address_core.analyze import analyze_address
 from packages.address_core.normalize import normalize_text
+from packages.address_core.types import AnalyzedAddress
 
 
 def dedup_records(records: list[Dict[str, str]]) -> list[Dict[str, str]]:
+    return [item for item, _ in dedup_normalized(records)]
+
+
+def dedup_key(item: Dict[str, str], normalized: str) -> str:
+    return normalized or str(item.get("raw_text", "") or "").strip() or str(item.get("raw_id", "") or "")
+
+
+def dedup_normalized(records: list[Dict[str, str]]) -> list[Tuple[Dict[str, str], str]]:
+    """First record per dedup key with its normalized text; nothing is parsed."""
     seen: Set[str] = set()
-    unique_records: list[Dict[str, str]] = []
+    unique_records: list[Tuple[Dict[str, str], str]] = []
     for item in records:
         raw_text = str(item.get("raw_text", "") or "")
         normalized = normalize_text(raw_text) if raw_text else ""
-        key = normalized or raw_text.strip() or str(item.get("raw_id", "") or "")
+        key = dedup_key(item, normalized)
         if key in seen:
             continue
         seen.add(key)
-        unique_records.append(item)
+        unique_records.append((item, normalized))
     return unique_records
+
+
+def dedup_analyzed(records: list[Dict[str, str]]) -> list[Tuple[Dict[str, str], AnalyzedAddress]]:
+    # Only unique records are parsed; duplicates stop after normalization.
+    return [
+        (item, analyze_address(str(item.get("raw_text", "") or ""), normalized=normalized))
+        for item, normalized in dedup_normalized(records)
+    ]
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+LEVELS = ("province", "city", "district")
+
+# Trie nodes are plain dicts keyed by character; the empty key holds the payload of
+# names ending at that node (a character key is never empty).
+_TERMINAL = ""
+
+
+def _default_gazetteer_path() -> Path:
+    return Path(__file__).resolve().parent / "dictionaries" / "admin_division_gazetteer.json"
+
+
+@dataclass(frozen=True)
+class AdminDivision:
+    adcode: str
+    name: str
+    level: str
+    parent_adcode: str = ""
+
+
+class Gazetteer:
+    """Prefix trie over admin-division names and aliases.
+
+    Lookups walk at most ``depth`` characters from the start position, so the cost
+    depends on the text, not on how many divisions are loaded.
+    """
+
+    def __init__(self) -> None:
+        self._root: Dict[str, Any] = {}
+        self._by_adcode: Dict[str, AdminDivision] = {}
+        self._by_name: Dict[str, List[AdminDivision]] = {}
+        self.depth = 0
+
+    @classmethod
+    def from_admin_division(cls, rows: Iterable[Dict[str, Any]]) -> "Gazetteer":
+        """Build from ``trust_data.admin_division``-shaped rows (adcode/name/level/parent_adcode/name_aliases)."""
+        gazetteer = cls()
+        for row in rows:
+            level = str(row.get("level") or "").strip()
+            name = str(row.get("name") or "").strip()
+            if level not in LEVELS or not name:
+                continue
+            division = AdminDivision(
+                adcode=str(row.get("adcode") or name),
+                name=name,
+                level=level,
+                parent_adcode=str(row.get("parent_adcode") or ""),
+            )
+            gazetteer.add(division, aliases=row.get("name_aliases") or [])
+        return gazetteer
+
+    @classmethod
+    def from_json(cls, path: Path) -> "Gazetteer":
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        rows = payload.get("admin_division") if isinstance(payload, dict) else payload
+        return cls.from_admin_division(rows or [])
+
+    def __len__(self) -> int:
+        return len(self._by_adcode)
+
+    def add(self, division: AdminDivision, aliases: Iterable[str] = ()) -> None:
+        self._by_adcode[division.adcode] = division
+        self._by_name.setdefault(division.name, []).append(division)
+        self._insert(division.name, division, False)
+        for alias in aliases:
+            value = str(alias or "").strip()
+            # Single-character abbreviations (苏/浙) are too ambiguous for prefix resolution.
+            if len(value) >= 2 and value != division.name:
+                self._insert(value, division, True)
+
+    def _insert(self, key: str, division: AdminDivision, is_alias: bool) -> None:
+        node = self._root
+        for char in key:
+            node = node.setdefault(char, {})
+        node.setdefault(_TERMINAL, []).append((division, is_alias))
+        self.depth = max(self.depth, len(key))
+
+    def prefix_matches(self, text: str, pos: int = 0) -> List[Tuple[int, AdminDivision, bool]]:
+        """All ``(end, division, is_alias)`` whose key starts at ``pos``, shortest first."""
+        hits: List[Tuple[int, AdminDivision, bool]] = []
+        node = self._root
+        index = pos
+        limit = min(len(text), pos + self.depth)
+        while index < limit:
+            node = node.get(text[index])
+            if node is None:
+                break
+            index += 1
+            for division, is_alias in node.get(_TERMINAL, ()):
+                hits.append((index, division, is_alias))
+        return hits
+
+    def longest_prefix(
+        self,
+        text: str,
+        pos: int = 0,
+        *,
+        level: str = "",
+        include_aliases: bool = False,
+    ) -> Optional[Tuple[AdminDivision, int]]:
+        best: Optional[Tuple[AdminDivision, int]] = None
+        for end, division, is_alias in self.prefix_matches(text, pos):
+            if is_alias and not include_aliases:
+                continue
+            if level and division.level != level:
+                continue
+            best = (division, end)
+        return best
+
+    def parent(self, division: AdminDivision) -> Optional[AdminDivision]:
+        return self._by_adcode.get(division.parent_adcode) if division.parent_adcode else None
+
+    def is_municipality(self, name: str) -> bool:
+        levels = {item.level for item in self._by_name.get(name, [])}
+        return "province" in levels and "city" in levels
+
+    def unique_parent_name(self, name: str, level: str) -> str:
+        """Parent name of ``name`` at ``level``, or "" when unknown or ambiguous (e.g. 朝阳区)."""
+        parents: set[str] = set()
+        for item in self._by_name.get(name, []):
+            parent = self.parent(item) if item.level == level else None
+            if parent is not None:
+                parents.add(parent.name)
+        return parents.pop() if len(parents) == 1 else ""
+
+
+_LOCK = threading.Lock()
+_SHARED: Optional[Gazetteer] = None
+
+
+def get_gazetteer() -> Gazetteer:
+    """Process-wide gazetteer, built once from ``ADDRESS_GAZETTEER_PATH`` or the bundled fixture."""
+    global _SHARED
+    if _SHARED is None:
+        with _LOCK:
+            if _SHARED is None:
+                configured = str(os.getenv("ADDRESS_GAZETTEER_PATH") or "").strip()
+                _SHARED = Gazetteer.from_json(Path(configured) if configured else _default_gazetteer_path())
+    return _SHARED
+
+
+def set_gazetteer(gazetteer: Optional[Gazetteer]) -> None:
+    """Install a gazetteer (e.g. built from trust_data.admin_division rows); ``None`` reloads lazily."""
+    global _SHARED
+    with _LOCK:
+        _SHARED = gazetteer
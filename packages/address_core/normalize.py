@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import re
+from packages.address_core.gazetteer import get_gazetteer
 
 
 _ALIASES = {
@@ -9,36 +9,49 @@ _ALIASES = {
     "幢": "栋",
 }
 
-_CITY_PROVINCE_PREFIX = {
-    "深圳市": "广东省",
-    "苏州市": "江苏省",
-    "武汉市": "湖北省",
-    "随州市": "湖北省",
-}
-
-_MUNICIPALITIES = ("北京市", "上海市", "天津市", "重庆市")
+_REPLACEMENTS = (*_ALIASES.items(), ("（", "("), ("）", ")"))
 
 
 def normalize_text(raw_text: str) -> str:
-    text = raw_text.strip().replace("　", " ")
-    text = re.sub(r"\s+", "", text)
-    for key, value in _ALIASES.items():
-        text = text.replace(key, value)
-    text = text.replace("（", "(").replace("）", ")")
+    text = _normalize_chars(raw_text)
     text = _normalize_prefix(text)
     return text
 
 
+def normalize_texts(raw_texts: list[str]) -> list[str]:
+    # Character-level rewrites run once over the joined batch, split back on NUL.
+    joined = _normalize_chars("\x00".join(raw_texts))
+    parts = joined.split("\x00")
+    if len(parts) != len(raw_texts):
+        return [normalize_text(text) for text in raw_texts]
+    return [_normalize_prefix(text) for text in parts]
+
+
+def _normalize_chars(text: str) -> str:
+    # str.split() drops the same Unicode whitespace as r"\s+" (full-width space included).
+    text = "".join(text.split())
+    for key, value in _REPLACEMENTS:
+        text = text.replace(key, value)
+    return text
+
+
 def _normalize_prefix(text: str) -> str:
+    # Longest-prefix lookup in the shared gazetteer trie; cost is bounded by name length.
+    gazetteer = get_gazetteer()
+    matches = gazetteer.prefix_matches(text)
+    if not matches:
+        return text
+    end, division, is_alias = matches[-1]
+
     # Municipalities may appear once in raw text; normalize to province+city form.
-    for city in _MUNICIPALITIES:
-        if text.startswith(city):
-            if text.startswith(f"{city}{city}"):
-                return text
-            return f"{city}{text}"
+    if not is_alias and gazetteer.is_municipality(division.name):
+        if text.startswith(division.name, end):
+            return text
+        return f"{division.name}{text}"
 
     # For non-municipality city-leading inputs, prepend province when missing.
-    for city, province in _CITY_PROVINCE_PREFIX.items():
-        if text.startswith(city):
+    if division.level == "city":
+        province = gazetteer.unique_parent_name(division.name, "city")
+        if province:
             return f"{province}{text}"
     return text
@@ -1,9 +1,23 @@
 from __future__ import annotations
 
 import re
-from typing import Dict
+from typing import Dict, Iterable, List, Tuple
 
-from packages.address_core.normalize import normalize_text
+from packages.address_core.gazetteer import get_gazetteer
+from packages.address_core.normalize import normalize_text, normalize_texts
+
+
+# Regex fallback per admin level when the gazetteer does not know the name.
+_HEAD_PATTERNS = (
+    ("province", re.compile(r"北京市|上海市|天津市|重庆市|[^省]{2,8}省")),
+    ("city", re.compile(r"[^市区县]{1,10}市")),
+    ("district", re.compile(r"[^区县市]{1,12}(?:区|县|市)")),
+)
+_ROAD_RE = re.compile(r"[^0-9号]{1,20}(?:大道|大街|路|街道|街|道)")
+# Digit runs end in at most one suffix, so a single scan finds the first match of each field.
+_NUMBERED_RE = re.compile(r"\d+(号|栋|单元|室)")
+# Ordered as the historical field order; callers list ``parsed.keys()`` into evidence.
+_NUMBERED_FIELDS = (("号", "house_no"), ("栋", "building"), ("单元", "unit"), ("室", "room"))
 
 
 def parse_components(normalized_text: str) -> Dict[str, str]:
@@ -11,46 +25,92 @@ def parse_components(normalized_text: str) -> Dict[str, str]:
     text = normalize_text(str(normalized_text or ""))
     if not text:
         return {}
+    return _parse_fields(text)
 
-    result: Dict[str, str] = {}
-    remaining = text
 
-    province_match = re.match(r"^(北京市|上海市|天津市|重庆市|[^省]{2,8}省)", remaining)
-    if province_match:
-        province = province_match.group(1)
-        result["province"] = province
-        remaining = remaining[len(province) :]
+def parse_components_batch(texts: Iterable[str]) -> List[Dict[str, str]]:
+    """Parse many raw texts in one pass; output matches ``[parse_components(t) for t in texts]``."""
+    raw_texts = [str(raw or "") for raw in texts]
+    # Duplicate inputs are parsed once per batch.
+    distinct = list(dict.fromkeys(raw_texts))
+    memo: Dict[str, Dict[str, str]] = {}
+    for raw, text in zip(distinct, normalize_texts(distinct)):
+        memo[raw] = _parse_fields(text) if text else {}
+    return [dict(memo[raw]) for raw in raw_texts]
 
-    city_match = re.match(r"^([^市区县]{1,10}市)", remaining)
-    if city_match:
-        city = city_match.group(1)
-        result["city"] = city
-        remaining = remaining[len(city) :]
 
-    district_match = re.match(r"^([^区县市]{1,12}(?:区|县|市))", remaining)
-    if district_match:
-        district = district_match.group(1)
-        result["district"] = district
-        remaining = remaining[len(district) :]
+def parse_normalized(text: str) -> Tuple[Dict[str, str], Dict[str, Tuple[int, int]]]:
+    """Parse already-normalized text, returning fields and their spans in ``text``."""
+    spans, offset = _resolve_head(text)
+    result = _head_fields(text, spans)
 
-    road_match = re.search(r"([^0-9号]{1,20}(?:大道|大街|路|街道|街|道))", remaining)
-    if road_match:
-        result["road"] = road_match.group(1)
+    road = _ROAD_RE.search(text, offset)
+    if road:
+        result["road"] = road.group()
+        spans["road"] = road.span()
 
-    house_match = re.search(r"(\d+号)", remaining)
-    if house_match:
-        result["house_no"] = house_match.group(1)
+    numbered: Dict[str, re.Match[str]] = {}
+    for matched in _NUMBERED_RE.finditer(text, offset):
+        numbered.setdefault(matched.group(1), matched)
+    for suffix, field_name in _NUMBERED_FIELDS:
+        matched = numbered.get(suffix)
+        if matched:
+            result[field_name] = matched.group()
+            spans[field_name] = matched.span()
 
-    building_match = re.search(r"(\d+栋)", remaining)
-    if building_match:
-        result["building"] = building_match.group(1)
+    return result, spans
 
-    unit_match = re.search(r"(\d+单元)", remaining)
-    if unit_match:
-        result["unit"] = unit_match.group(1)
 
-    room_match = re.search(r"(\d+室)", remaining)
-    if room_match:
-        result["room"] = room_match.group(1)
+def _parse_fields(text: str) -> Dict[str, str]:
+    # Span-free variant of parse_normalized for the per-record and batch entry points.
+    spans, offset = _resolve_head(text)
+    result = _head_fields(text, spans)
 
+    road = _ROAD_RE.search(text, offset)
+    if road:
+        result["road"] = road.group()
+
+    numbered: Dict[str, str] = {}
+    for matched in _NUMBERED_RE.finditer(text, offset):
+        numbered.setdefault(matched.group(1), matched.group())
+    for suffix, field_name in _NUMBERED_FIELDS:
+        value = numbered.get(suffix)
+        if value:
+            result[field_name] = value
     return result
+
+
+def _resolve_head(text: str) -> Tuple[Dict[str, Tuple[int, int]], int]:
+    # Province/city/district are consumed left to right; known names resolve by
+    # longest prefix in the gazetteer trie, unknown ones through the regex fallback.
+    gazetteer = get_gazetteer()
+    spans: Dict[str, Tuple[int, int]] = {}
+    offset = 0
+    for field_name, pattern in _HEAD_PATTERNS:
+        hit = gazetteer.longest_prefix(text, offset, level=field_name)
+        if hit:
+            end = hit[1]
+        else:
+            matched = pattern.match(text, offset)
+            if not matched:
+                continue
+            end = matched.end()
+        spans[field_name] = (offset, end)
+        offset = end
+    return spans, offset
+
+
+def _head_fields(text: str, spans: Dict[str, Tuple[int, int]]) -> Dict[str, str]:
+    values = {field_name: text[start:end] for field_name, (start, end) in spans.items()}
+    # Back-fill missing ancestors (district -> city -> province) when the gazetteer
+    # resolves them unambiguously; back-filled fields carry no span.
+    gazetteer = get_gazetteer()
+    if "district" in values and "city" not in values:
+        city = gazetteer.unique_parent_name(values["district"], "district")
+        if city:
+            values["city"] = city
+    if "city" in values and "province" not in values:
+        province = gazetteer.unique_parent_name(values["city"], "city")
+        if province:
+            values["province"] = province
+    return {field_name: values[field_name] for field_name, _ in _HEAD_PATTERNS if field_name in values}
@@ -1,114 +1,353 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+import asyncio
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from hashlib import blake2b
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
 
-from packages.address_core.dedup import dedup_records
-from packages.address_core.match import recall_candidates
+from packages.address_core.analyze import analyze_address
+from packages.address_core.dedup import dedup_analyzed, dedup_key, dedup_normalized
+from packages.address_core.match import recall_candidates_many
 from packages.address_core.normalize import normalize_text
-from packages.address_core.parse import parse_components
-from packages.address_core.score import score_confidence
+from packages.address_core.score import score_address
+from packages.address_core.types import AnalyzedAddress, MatchCandidate
 
 
-def _query_trust_enhancement(
+EXECUTION_MODES = ("sequential", "threads", "processes", "asyncio")
+
+
+# (domain, single-name method, bulk method, extra query kwargs)
+_TRUST_DOMAINS = (
+    ("admin_division", "query_admin_division", "query_admin_division_many", {"parent_hint": None}),
+    ("road", "query_road", "query_road_many", {"adcode_hint": None}),
+    ("poi", "query_poi", "query_poi_many", {"adcode_hint": None, "top_k": 5}),
+)
+
+Mapper = Callable[[Callable[[Any], Any], List[Any]], Any]
+TrustOutcome = Tuple[list[dict[str, Any]], Exception | None]
+
+
+def _trust_query_names(parsed: Dict[str, str]) -> Dict[str, str]:
+    admin_name = str(parsed.get("district") or parsed.get("city") or parsed.get("province") or "").strip()
+    road_name = str(parsed.get("road") or "").strip()
+    return {"admin_division": admin_name, "road": road_name, "poi": road_name or admin_name}
+
+
+def _resolve_trust_names(
+    trust_provider: Any,
+    namespace: str,
+    domain: str,
+    names: List[str],
+    mapper: Mapper,
+) -> Dict[str, Any]:
+    """Resolve distinct names for one domain to ``{name: rows | exception}``."""
+    _, single, bulk, extra = next(item for item in _TRUST_DOMAINS if item[0] == domain)
+    if hasattr(trust_provider, bulk):
+        try:
+            found = getattr(trust_provider, bulk)(namespace=namespace, names=names, **extra) or {}
+        except Exception as exc:
+            return {name: exc for name in names}
+        return {name: found.get(name) or [] for name in names}
+
+    def _one(name: str) -> Any:
+        try:
+            return getattr(trust_provider, single)(namespace=namespace, name=name, **extra) or []
+        except Exception as exc:
+            return exc
+
+    return dict(zip(names, mapper(_one, names)))
+
+
+def _trust_evidence_batch(
     *,
     trust_provider: Any,
     ruleset: Dict[str, Any],
-    parsed: Dict[str, str],
-) -> list[dict[str, Any]]:
+    parsed_list: List[Dict[str, str]],
+    mapper: Mapper = map,
+) -> List[TrustOutcome]:
+    """Trust evidence for a batch: each distinct (domain, name) is queried once and fanned out.
+
+    Providers exposing ``query_<domain>_many`` get one bulk call per domain; otherwise
+    distinct names go through the single-name method via ``mapper``.
+    """
+    if trust_provider is None:
+        return [([], None) for _ in parsed_list]
     namespace = str(ruleset.get("trust_namespace") or "")
-    evidence_items: list[dict[str, Any]] = []
+    per_record = [_trust_query_names(parsed) for parsed in parsed_list]
+    resolved: Dict[str, Dict[str, Any]] = {}
+    for domain, single, bulk, _ in _TRUST_DOMAINS:
+        if not (hasattr(trust_provider, single) or hasattr(trust_provider, bulk)):
+            continue
+        names = list(dict.fromkeys(names[domain] for names in per_record if names[domain]))
+        resolved[domain] = _resolve_trust_names(trust_provider, namespace, domain, names, mapper) if names else {}
 
-    admin_name = str(parsed.get("district") or parsed.get("city") or parsed.get("province") or "").strip()
-    if admin_name and hasattr(trust_provider, "query_admin_division"):
-        rows = trust_provider.query_admin_division(namespace=namespace, name=admin_name, parent_hint=None) or []
-        evidence_items.append(
-            {
-                "step": "trust_query",
-                "domain": "admin_division",
-                "namespace": namespace,
-                "query": admin_name,
-                "count": len(rows),
-            }
-        )
+    outcomes: List[TrustOutcome] = []
+    for names in per_record:
+        evidence_items: list[dict[str, Any]] = []
+        error: Exception | None = None
+        for domain, _, _, _ in _TRUST_DOMAINS:
+            name = names[domain]
+            if not name or domain not in resolved:
+                continue
+            rows = resolved[domain][name]
+            if isinstance(rows, Exception):
+                error = rows
+                break
+            evidence_items.append(
+                {
+                    "step": "trust_query",
+                    "domain": domain,
+                    "namespace": namespace,
+                    "query": name,
+                    "count": len(rows),
+                }
+            )
+        if error is not None:
+            evidence_items = [
+                {
+                    "step": "trust_query",
+                    "status": "error",
+                    "error_type": error.__class__.__name__,
+                }
+            ]
+        outcomes.append((evidence_items, error))
+    return outcomes
 
-    road_name = str(parsed.get("road") or "").strip()
-    if road_name and hasattr(trust_provider, "query_road"):
-        rows = trust_provider.query_road(namespace=namespace, name=road_name, adcode_hint=None) or []
-        evidence_items.append(
-            {
-                "step": "trust_query",
-                "domain": "road",
-                "namespace": namespace,
-                "query": road_name,
-                "count": len(rows),
-            }
-        )
 
-    poi_name = road_name or admin_name
-    if poi_name and hasattr(trust_provider, "query_poi"):
-        rows = trust_provider.query_poi(namespace=namespace, name=poi_name, adcode_hint=None, top_k=5) or []
-        evidence_items.append(
-            {
-                "step": "trust_query",
-                "domain": "poi",
-                "namespace": namespace,
-                "query": poi_name,
-                "count": len(rows),
-            }
-        )
+def _analyze_chunk(chunk: List[Tuple[str, str]]) -> List[AnalyzedAddress]:
+    # Process-pool worker: parses (raw_text, normalized) pairs the parent already deduplicated.
+    return [analyze_address(raw_text, normalized=normalized) for raw_text, normalized in chunk]
+
+
+def _dedup_analyzed_in_processes(
+    records: List[Dict[str, Any]],
+    workers: int,
+    chunk_size: int,
+) -> List[Tuple[Dict[str, Any], AnalyzedAddress]]:
+    # Dedup on the normalized text first, so duplicates are neither shipped to nor parsed by workers.
+    unique = dedup_normalized(records)
+    pairs = [(str(item.get("raw_text", "") or ""), normalized) for item, normalized in unique]
+    chunks = [pairs[start : start + chunk_size] for start in range(0, len(pairs), chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        analyses = [analysis for analyzed in pool.map(_analyze_chunk, chunks) for analysis in analyzed]
+    return [(item, analysis) for (item, _), analysis in zip(unique, analyses)]
+
 
-    return evidence_items
+def _io_threads(
+    analyses: List[AnalyzedAddress],
+    trust_stage: Callable[[Mapper], List[TrustOutcome]],
+    workers: int,
+) -> Tuple[List[List[MatchCandidate]], List[TrustOutcome]]:
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pipeline-io") as pool:
+        # Fengtu lookups run as one batched task while distinct trust names fan out on the pool.
+        candidates_future = pool.submit(recall_candidates_many, analyses)
+        trust_outcomes = trust_stage(pool.map)
+        return candidates_future.result(), trust_outcomes
 
 
-def run(records: List[Dict[str, Any]], ruleset: Dict[str, Any], trust_provider: Any | None = None) -> List[Dict[str, Any]]:
+async def _io_asyncio(
+    analyses: List[AnalyzedAddress],
+    trust_stage: Callable[[Mapper], List[TrustOutcome]],
+    workers: int,
+) -> Tuple[List[List[MatchCandidate]], List[TrustOutcome]]:
+    # Providers are synchronous; the loop overlaps them on worker threads, bounded by ``workers``.
+    loop = asyncio.get_running_loop()
+    limit = asyncio.Semaphore(workers)
+
+    async def _bounded(func: Callable[..., Any], *args: Any) -> Any:
+        async with limit:
+            return await asyncio.to_thread(func, *args)
+
+    async def _gather(func: Callable[[Any], Any], items: List[Any]) -> List[Any]:
+        return list(await asyncio.gather(*(_bounded(func, item) for item in items)))
+
+    def mapper(func: Callable[[Any], Any], items: List[Any]) -> List[Any]:
+        # Called from the trust-stage thread; lookups are scheduled back onto the loop.
+        return asyncio.run_coroutine_threadsafe(_gather(func, items), loop).result()
+
+    candidates_task = asyncio.ensure_future(_bounded(recall_candidates_many, analyses))
+    try:
+        trust_outcomes = await asyncio.to_thread(trust_stage, mapper)
+        return await candidates_task, trust_outcomes
+    finally:
+        candidates_task.cancel()
+
+
+def run(
+    records: List[Dict[str, Any]],
+    ruleset: Dict[str, Any],
+    trust_provider: Any | None = None,
+    *,
+    execution_mode: str = "sequential",
+    workers: int | None = None,
+    chunk_size: int | None = None,
+) -> List[Dict[str, Any]]:
+    """Govern ``records`` in input order.
+
+    ``execution_mode`` picks how stages run: ``threads``/``asyncio`` overlap trust and
+    Fengtu I/O, ``processes`` additionally parses the deduplicated records in chunks on a
+    process pool. Output and ``blocked:`` errors are identical across modes.
+    """
+    if execution_mode not in EXECUTION_MODES:
+        raise ValueError(f"unsupported execution_mode: {execution_mode}")
     if not records:
         raise ValueError("blocked: input records are empty")
-    unique_records = dedup_records(records)
+    if execution_mode == "processes":
+        process_workers = max(1, workers or os.cpu_count() or 1)
+        chunk = chunk_size or max(1, math.ceil(len(records) / (process_workers * 4)))
+        unique_records = _dedup_analyzed_in_processes(records, process_workers, chunk)
+    else:
+        unique_records = dedup_analyzed(records)
     if not unique_records:
         raise ValueError("blocked: no valid unique records")
     trust_required = bool(ruleset.get("require_trust_enhancement", False))
     if trust_required and trust_provider is None:
         raise ValueError("blocked: trust provider is required by ruleset")
 
-    outputs: List[Dict[str, Any]] = []
-    for item in unique_records:
-        raw_text = str(item.get("raw_text", "")).strip()
-        if not raw_text:
+    for item, analysis in unique_records:
+        if not analysis.raw_text.strip():
             raise ValueError(f"blocked: raw_text empty for raw_id={item.get('raw_id')}")
-        normalized = normalize_text(raw_text)
-        parsed = parse_components(normalized)
-        candidates = recall_candidates(normalized)
-        confidence, strategy = score_confidence(parsed, candidates)
-        trust_evidence_items: list[dict[str, Any]] = []
-        if trust_provider is not None:
+
+    analyses = [analysis for _, analysis in unique_records]
+
+    def trust_stage(mapper: Mapper) -> List[TrustOutcome]:
+        return _trust_evidence_batch(
+            trust_provider=trust_provider,
+            ruleset=ruleset,
+            parsed_list=[analysis.parsed for analysis in analyses],
+            mapper=mapper,
+        )
+
+    io_workers = max(1, workers or min(32, (os.cpu_count() or 1) + 4))
+    if execution_mode == "sequential":
+        # Trusted lookups for the whole batch go out together (cached, batched or concurrent).
+        candidate_lists = recall_candidates_many(analyses)
+        trust_outcomes = trust_stage(map)
+    elif execution_mode == "asyncio":
+        candidate_lists, trust_outcomes = asyncio.run(_io_asyncio(analyses, trust_stage, io_workers))
+    else:
+        candidate_lists, trust_outcomes = _io_threads(analyses, trust_stage, io_workers)
+
+    trust_lists: List[list[dict[str, Any]]] = []
+    for evidence_items, error in trust_outcomes:
+        # Outcomes are in record order, so the first failing record decides the blocked error.
+        if error is not None and trust_required:
+            raise ValueError(f"blocked: trust enhancement failed: {error.__class__.__name__}") from error
+        trust_lists.append(evidence_items)
+
+    return [
+        _record_result(item, analysis, candidates, trust_evidence_items, ruleset)
+        for (item, analysis), candidates, trust_evidence_items in zip(unique_records, candidate_lists, trust_lists)
+    ]
+
+
+def _record_result(
+    item: Dict[str, Any],
+    analysis: AnalyzedAddress,
+    candidates: List[MatchCandidate],
+    trust_evidence_items: list[dict[str, Any]],
+    ruleset: Dict[str, Any],
+) -> Dict[str, Any]:
+    normalized = analysis.normalized
+    parsed = analysis.parsed
+    confidence, strategy = score_address(analysis, candidates, ruleset)
+    return {
+        "raw_id": item.get("raw_id"),
+        "canon_text": normalized,
+        "confidence": confidence,
+        "strategy": strategy,
+        "evidence": {
+            "items": [
+                {"step": "normalize", "value": normalized},
+                {"step": "parse", "fields": list(parsed.keys())},
+                {"step": "candidate_count", "count": len(candidates)},
+                {"step": "ruleset", "value": ruleset.get("ruleset_id", "default")},
+                *trust_evidence_items,
+            ]
+        },
+    }
+
+
+def _error_result(item: Dict[str, Any], message: str) -> Dict[str, Any]:
+    return {"raw_id": item.get("raw_id"), "status": "error", "error": message}
+
+
+def stream(
+    records: Iterable[Dict[str, Any]],
+    ruleset: Dict[str, Any],
+    trust_provider: Any | None = None,
+    *,
+    batch_size: int = 256,
+) -> Iterator[Dict[str, Any]]:
+    """Govern an unbounded record iterable, yielding one result per unique record.
+
+    Memory stays bounded by ``batch_size`` plus an 8-byte digest per distinct
+    address seen. Per-record failures are yielded as ``{"status": "error"}``
+    results instead of aborting; only ruleset-level problems raise.
+    """
+    trust_required = bool(ruleset.get("require_trust_enhancement", False))
+    if trust_required and trust_provider is None:
+        raise ValueError("blocked: trust provider is required by ruleset")
+    return _stream(iter(records), ruleset, trust_provider, trust_required, max(1, batch_size))
+
+
+def _stream(
+    records: Iterator[Dict[str, Any]],
+    ruleset: Dict[str, Any],
+    trust_provider: Any,
+    trust_required: bool,
+    batch_size: int,
+) -> Iterator[Dict[str, Any]]:
+    seen: set[bytes] = set()
+    while True:
+        batch = list(islice(records, batch_size))
+        if not batch:
+            return
+        staged: List[Tuple[Dict[str, Any], AnalyzedAddress | None, str]] = []
+        for item in batch:
             try:
-                trust_evidence_items = _query_trust_enhancement(trust_provider=trust_provider, ruleset=ruleset, parsed=parsed)
+                raw_text = str(item.get("raw_text", "") or "")
+                normalized = normalize_text(raw_text) if raw_text else ""
+                digest = blake2b(dedup_key(item, normalized).encode("utf-8"), digest_size=8).digest()
+                if digest in seen:
+                    continue
+                seen.add(digest)
+                if not raw_text.strip():
+                    staged.append((item, None, f"blocked: raw_text empty for raw_id={item.get('raw_id')}"))
+                    continue
+                staged.append((item, analyze_address(raw_text, normalized=normalized), ""))
             except Exception as exc:
-                if trust_required:
-                    raise ValueError(f"blocked: trust enhancement failed: {exc.__class__.__name__}") from exc
-                trust_evidence_items.append(
-                    {
-                        "step": "trust_query",
-                        "status": "error",
-                        "error_type": exc.__class__.__name__,
-                    }
-                )
-
-        outputs.append(
-            {
-                "raw_id": item.get("raw_id"),
-                "canon_text": normalized,
-                "confidence": confidence,
-                "strategy": strategy,
-                "evidence": {
-                    "items": [
-                        {"step": "normalize", "value": normalized},
-                        {"step": "parse", "fields": list(parsed.keys())},
-                        {"step": "candidate_count", "count": len(candidates)},
-                        {"step": "ruleset", "value": ruleset.get("ruleset_id", "default")},
-                        *trust_evidence_items,
-                    ]
-                },
-            }
+                staged.append((item, None, f"analyze_failed: {exc.__class__.__name__}"))
+
+        analyses = [analysis for _, analysis, _ in staged if analysis is not None]
+        try:
+            candidate_lists = iter(recall_candidates_many(analyses))
+        except Exception as exc:
+            for item, _, error in staged:
+                yield _error_result(item, error or f"recall_failed: {exc.__class__.__name__}")
+            continue
+
+        trust_outcomes = iter(
+            _trust_evidence_batch(
+                trust_provider=trust_provider,
+                ruleset=ruleset,
+                parsed_list=[analysis.parsed for analysis in analyses],
+            )
         )
-    return outputs
+        for item, analysis, error in staged:
+            if analysis is None:
+                yield _error_result(item, error)
+                continue
+            candidates = next(candidate_lists)
+            trust_items, trust_error = next(trust_outcomes)
+            if trust_error is not None and trust_required:
+                yield _error_result(item, f"blocked: trust enhancement failed: {trust_error.__class__.__name__}")
+                continue
+            try:
+                result = _record_result(item, analysis, candidates, trust_items, ruleset)
+            except Exception as exc:
+                result = _error_result(item, f"record_failed: {exc.__class__.__name__}")
+            yield result
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import csv
+import json
+from pathlib import Path
+from typing import Dict, Iterator
+
+
+def iter_records(
+    path: Path | str,
+    *,
+    raw_text_field: str = "raw_text",
+    raw_id_field: str = "raw_id",
+) -> Iterator[Dict[str, str]]:
+    """Lazily read ``{"raw_id", "raw_text"}`` records from a CSV or JSONL file.
+
+    Rows are yielded one at a time so arbitrarily large inputs can be piped into
+    ``pipeline.stream``; a missing id falls back to the 1-based row number.
+    """
+    file_path = Path(path)
+    if file_path.suffix.lower() == ".csv":
+        with file_path.open("r", encoding="utf-8-sig", newline="") as handle:
+            for line_no, row in enumerate(csv.DictReader(handle), start=1):
+                yield {
+                    "raw_id": str(row.get(raw_id_field) or line_no),
+                    "raw_text": str(row.get(raw_text_field) or ""),
+                }
+        return
+    with file_path.open("r", encoding="utf-8") as handle:
+        for line_no, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            yield {
+                "raw_id": str(row.get(raw_id_field) or line_no),
+                "raw_text": str(row.get(raw_text_field) or ""),
+            }
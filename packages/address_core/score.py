@@ -1,41 +1,202 @@
 from __future__ import annotations
 
-from typing import Dict, List, Tuple
+import json
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
-from packages.address_core.types import MatchCandidate
+from packages.address_core.types import AnalyzedAddress, MatchCandidate
 
+try:  # NumPy is optional; batch scoring falls back to pure Python without it.
+    import numpy as _np
+except ImportError:  # pragma: no cover - depends on the environment
+    _np = None
 
-def score_confidence(parsed: Dict[str, str], candidates: List[MatchCandidate]) -> Tuple[float, str]:
-    field_score = min(len(parsed) / 5.0, 1.0)
-    candidate_score = candidates[0].score if candidates else 0.0
-    confidence = field_score * 0.65 + candidate_score * 0.35
 
-    # Hard risk signals should pull score to reject/review.
-    if not parsed.get("house_no"):
-        confidence -= 0.4
-    if not parsed.get("district"):
-        confidence -= 0.2
-    if not parsed.get("road"):
-        confidence -= 0.2
+# 惩罚来源按位编码，单次遍历候选即可得到命中的来源集合。
+SOURCE_BITS: Dict[str, int] = {
+    "invalid_road_truncate": 1 << 0,
+    "fengtu_real_check_invalid": 1 << 1,
+}
 
+DEFAULT_SCORE_RULES: Dict[str, Any] = {
+    "weights": {"field": 0.65, "candidate": 0.35},
+    "field_full_count": 5,
+    # Hard risk signals should pull score to reject/review.
+    "missing_field_penalties": {"house_no": 0.4, "district": 0.2, "road": 0.2},
     # Structure likely incomplete: has building+room but missing unit.
-    if parsed.get("building") and parsed.get("room") and not parsed.get("unit"):
-        confidence -= 0.17
+    "building_room_without_unit_penalty": 0.17,
+    "top_name_penalties": {"不存在路": 0.45},
+    "source_penalties": {"invalid_road_truncate": 0.2, "fengtu_real_check_invalid": 0.35},
+    "thresholds": {"rule_only": 0.88, "match_dict": 0.62},
+}
+
+
+@dataclass(frozen=True)
+class ScoreRules:
+    field_weight: float
+    candidate_weight: float
+    field_full_count: float
+    missing_field_penalties: Tuple[Tuple[str, float], ...]
+    building_room_without_unit_penalty: float
+    top_name_penalties: Tuple[Tuple[str, float], ...]
+    source_penalties: Tuple[Tuple[int, float], ...]
+    source_bits: Dict[str, int] = field(hash=False, compare=False)
+    penalty_vector: Tuple[float, ...] = ()
+    t_rule_only: float = 0.88
+    t_match_dict: float = 0.62
+
+    @property
+    def feature_names(self) -> List[str]:
+        return (
+            ["field_count", "candidate_score"]
+            + [f"missing:{name}" for name, _ in self.missing_field_penalties]
+            + ["building_room_without_unit"]
+            + [f"top_name:{marker}" for marker, _ in self.top_name_penalties]
+            + [f"source_bit:{bit}" for bit, _ in self.source_penalties]
+        )
+
+    def strategy_for(self, confidence: float) -> str:
+        if confidence >= self.t_rule_only:
+            return "rule_only"
+        if confidence >= self.t_match_dict:
+            return "match_dict"
+        return "human_required"
+
+
+def _merged(overrides: Mapping[str, Any]) -> Dict[str, Any]:
+    merged: Dict[str, Any] = {}
+    for key, default in DEFAULT_SCORE_RULES.items():
+        value = overrides.get(key, default)
+        if isinstance(default, dict) and isinstance(value, Mapping):
+            value = {**default, **value}
+        merged[key] = value
+    return merged
+
+
+@lru_cache(maxsize=64)
+def _compile(rules_json: str) -> ScoreRules:
+    config = _merged(json.loads(rules_json))
+    source_bits = dict(SOURCE_BITS)
+    source_penalties: List[Tuple[int, float]] = []
+    for source, penalty in config["source_penalties"].items():
+        if source not in source_bits:
+            source_bits[source] = 1 << len(source_bits)
+        source_penalties.append((source_bits[source], float(penalty)))
+    weights = config["weights"]
+    thresholds = config["thresholds"]
+    missing_field_penalties = tuple((str(k), float(v)) for k, v in config["missing_field_penalties"].items())
+    building_room_penalty = float(config["building_room_without_unit_penalty"])
+    top_name_penalties = tuple((str(k), float(v)) for k, v in config["top_name_penalties"].items())
+    # Penalties line up with the flag columns of ``score_features`` (everything after the first two).
+    penalty_vector = (
+        tuple(penalty for _, penalty in missing_field_penalties)
+        + (building_room_penalty,)
+        + tuple(penalty for _, penalty in top_name_penalties)
+        + tuple(penalty for _, penalty in source_penalties)
+    )
+    return ScoreRules(
+        field_weight=float(weights["field"]),
+        candidate_weight=float(weights["candidate"]),
+        field_full_count=float(config["field_full_count"]),
+        missing_field_penalties=missing_field_penalties,
+        building_room_without_unit_penalty=building_room_penalty,
+        top_name_penalties=top_name_penalties,
+        source_penalties=tuple(source_penalties),
+        source_bits=source_bits,
+        penalty_vector=penalty_vector,
+        t_rule_only=float(thresholds["rule_only"]),
+        t_match_dict=float(thresholds["match_dict"]),
+    )
+
+
+def compile_score_rules(ruleset: Optional[Mapping[str, Any]] = None) -> ScoreRules:
+    """Compile ``ruleset.config_json.score_rules`` (merged over the defaults) into a rule table.
+
+    Compiled tables are memoized by their JSON form, so callers can pass the ruleset per record.
+    """
+    overrides = ((ruleset or {}).get("config_json") or {}).get("score_rules") or {}
+    return _compile(json.dumps(overrides, sort_keys=True, ensure_ascii=False))
+
 
+def source_mask(candidates: Sequence[MatchCandidate], rules: ScoreRules) -> int:
+    bits = rules.source_bits
+    mask = 0
+    for item in candidates:
+        mask |= bits.get(item.source, 0)
+    return mask
+
+
+def score_features(parsed: Dict[str, str], candidates: List[MatchCandidate], rules: ScoreRules) -> List[float]:
+    """Flatten one record into the feature row consumed by ``score_feature_matrix``."""
     top_name = candidates[0].name if candidates else ""
-    if "不存在路" in top_name:
-        confidence -= 0.45
-    if any(item.source == "invalid_road_truncate" for item in candidates):
-        confidence -= 0.2
-    if any(item.source == "fengtu_real_check_invalid" for item in candidates):
-        confidence -= 0.35
-
-    confidence = round(max(0.0, min(1.0, confidence)), 4)
-
-    if confidence >= 0.88:
-        strategy = "rule_only"
-    elif confidence >= 0.62:
-        strategy = "match_dict"
-    else:
-        strategy = "human_required"
-    return confidence, strategy
+    mask = source_mask(candidates, rules)
+    return (
+        [float(len(parsed)), candidates[0].score if candidates else 0.0]
+        + [0.0 if parsed.get(name) else 1.0 for name, _ in rules.missing_field_penalties]
+        + [1.0 if parsed.get("building") and parsed.get("room") and not parsed.get("unit") else 0.0]
+        + [1.0 if marker in top_name else 0.0 for marker, _ in rules.top_name_penalties]
+        + [1.0 if mask & bit else 0.0 for bit, _ in rules.source_penalties]
+    )
+
+
+def _confidence_from_row(row: Sequence[float], rules: ScoreRules) -> float:
+    confidence = min(row[0] / rules.field_full_count, 1.0) * rules.field_weight + row[1] * rules.candidate_weight
+    for flag, penalty in zip(row[2:], rules.penalty_vector):
+        if flag:
+            confidence -= penalty
+    return round(max(0.0, min(1.0, confidence)), 4)
+
+
+def score_feature_matrix(rows: Any, rules: Optional[ScoreRules] = None) -> List[float]:
+    """Score a batch of feature rows (see ``ScoreRules.feature_names``) at once.
+
+    Uses NumPy when it is installed; otherwise evaluates row by row like ``score_confidence``.
+    """
+    rules = rules or compile_score_rules()
+    if _np is None:
+        return [_confidence_from_row(row, rules) for row in rows]
+    matrix = _np.asarray(rows, dtype=float)
+    if matrix.size == 0:
+        return []
+    field_score = _np.minimum(matrix[:, 0] / rules.field_full_count, 1.0)
+    confidence = field_score * rules.field_weight + matrix[:, 1] * rules.candidate_weight
+    confidence = confidence - matrix[:, 2:] @ _np.asarray(rules.penalty_vector, dtype=float)
+    return _np.round(_np.clip(confidence, 0.0, 1.0), 4).tolist()
+
+
+def bucket_counts(confidences: Sequence[float], t_low: float, t_high: float) -> Tuple[int, int, int]:
+    """Count ``(>= t_high, [t_low, t_high), < t_low)`` for threshold sweeps over stored confidences."""
+    if _np is not None and len(confidences) > 0:
+        values = _np.asarray(confidences, dtype=float)
+        is_high = values >= t_high
+        high = int(_np.count_nonzero(is_high))
+        middle = int(_np.count_nonzero(~is_high & (values >= t_low)))
+        return high, middle, len(values) - high - middle
+    high = middle = low = 0
+    for value in confidences:
+        if value >= t_high:
+            high += 1
+        elif value >= t_low:
+            middle += 1
+        else:
+            low += 1
+    return high, middle, low
+
+
+def score_confidence(
+    parsed: Dict[str, str],
+    candidates: List[MatchCandidate],
+    rules: Optional[ScoreRules] = None,
+) -> Tuple[float, str]:
+    rules = rules or compile_score_rules()
+    confidence = _confidence_from_row(score_features(parsed, candidates, rules), rules)
+    return confidence, rules.strategy_for(confidence)
+
+
+def score_address(
+    analysis: AnalyzedAddress,
+    candidates: List[MatchCandidate],
+    ruleset: Optional[Mapping[str, Any]] = None,
+) -> Tuple[float, str]:
+    return score_confidence(analysis.parsed, candidates, compile_score_rules(ruleset))
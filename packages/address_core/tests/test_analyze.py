@@ -0,0 +1,42 @@
+import os
+
+from packages.address_core import analyze as analyze_module
+from packages.address_core.analyze import analyze_address
+from packages.address_core.pipeline import run
+
+
+def test_analyze_address_exposes_normalized_parsed_and_spans() -> None:
+    analysis = analyze_address(" 深圳市南山区科苑路15號 ")
+    assert analysis.normalized == "广东省深圳市南山区科苑路15号"
+    assert analysis.parsed.get("district") == "南山区"
+    assert analysis.parsed.get("house_no") == "15号"
+    start, end = analysis.spans["house_no"]
+    assert analysis.normalized[start:end] == "15号"
+
+
+def test_analyze_address_records_invalid_road_span() -> None:
+    analysis = analyze_address("广东省深圳市罗湖区不存在路64号龙湖天街")
+    start, end = analysis.spans["invalid_road"]
+    assert analysis.normalized[start:end] == "不存在路64号"
+
+
+def test_pipeline_normalizes_each_record_once(monkeypatch) -> None:
+    os.environ["ADDRESS_TRUSTED_FENGTU_ENABLED"] = "0"
+    calls: list[str] = []
+    original = analyze_module.normalize_text
+
+    def _counting_normalize(text: str) -> str:
+        calls.append(text)
+        return original(text)
+
+    monkeypatch.setattr(analyze_module, "normalize_text", _counting_normalize)
+    monkeypatch.setattr("packages.address_core.dedup.normalize_text", _counting_normalize)
+    outputs = run(
+        records=[
+            {"raw_id": "r1", "raw_text": "杭州市西湖区文三路90号"},
+            {"raw_id": "r2", "raw_text": "深圳市南山区科苑路15號"},
+        ],
+        ruleset={"ruleset_id": "default"},
+    )
+    assert len(outputs) == 2
+    assert len(calls) == 2
@@ -0,0 +1,50 @@
+from packages.address_core.circuit_breaker import CircuitBreaker
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_breaker_opens_on_failure_rate_and_probes_with_backoff() -> None:
+    clock = _Clock()
+    breaker = CircuitBreaker("address_real_check", window_size=10, min_calls=4, failure_rate=0.5, open_sec=1.0, clock=clock)
+    breaker.record_success()
+    breaker.record_success()
+    breaker.record_failure("TimeoutError")
+    assert breaker.state == "closed"
+    breaker.record_failure("TimeoutError")
+    assert breaker.state == "open"
+    assert breaker.allow() is False
+
+    clock.now = 1.0
+    assert breaker.allow() is True
+    assert breaker.state == "half_open"
+    # Only one probe at a time.
+    assert breaker.allow() is False
+    breaker.record_failure("URLError")
+    assert breaker.state == "open"
+    assert breaker.snapshot()["open_sec"] == 2.0
+
+    clock.now = 2.5
+    assert breaker.allow() is False
+    clock.now = 3.0
+    assert breaker.allow() is True
+    breaker.record_success()
+    snapshot = breaker.snapshot()
+    assert snapshot["state"] == "closed"
+    assert snapshot["open_sec"] == 1.0
+    assert [item["to"] for item in snapshot["transitions"]] == ["open", "half_open", "open", "half_open", "closed"]
+
+
+def test_breaker_stays_closed_below_min_calls() -> None:
+    breaker = CircuitBreaker("address_standardize", min_calls=5)
+    for _ in range(4):
+        breaker.record_failure("TimeoutError")
+    assert breaker.state == "closed"
+    assert breaker.allow() is True
+    breaker.reset()
+    assert breaker.snapshot()["window_calls"] == 0
@@ -17,3 +17,17 @@ def test_dedup_records_merges_normalized_variants() -> None:
     ]
     unique = dedup_records(rows)
     assert len(unique) == 1
+
+
+def test_dedup_records_does_not_parse(monkeypatch) -> None:
+    from packages.address_core import dedup
+
+    def _no_parse(*_args, **_kwargs):
+        raise AssertionError("dedup_records must not parse records")
+
+    monkeypatch.setattr(dedup, "analyze_address", _no_parse)
+    rows = [
+        {"raw_id": "a", "raw_text": "广东省深圳市罗湖区南京西路190号星河湾2栋8单元397室"},
+        {"raw_id": "a2", "raw_text": "广东省深圳市罗湖区南京西路190号星河湾2栋8单元397室"},
+    ]
+    assert [row["raw_id"] for row in dedup_records(rows)] == ["a"]
@@ -0,0 +1,70 @@
+from packages.address_core.gazetteer import Gazetteer, get_gazetteer, set_gazetteer
+from packages.address_core.normalize import normalize_text
+from packages.address_core.parse import parse_components
+
+
+def test_gazetteer_longest_prefix_prefers_full_name_over_alias() -> None:
+    gazetteer = Gazetteer.from_admin_division(
+        [
+            {"adcode": "320000", "name": "江苏省", "level": "province", "parent_adcode": None, "name_aliases": ["苏"]},
+            {"adcode": "320500", "name": "苏州市", "level": "city", "parent_adcode": "320000", "name_aliases": ["苏州"]},
+        ]
+    )
+    division, end = gazetteer.longest_prefix("苏州市姑苏区", include_aliases=True)
+    assert (division.name, end) == ("苏州市", 3)
+    division, end = gazetteer.longest_prefix("苏州姑苏区", include_aliases=True)
+    assert (division.name, end) == ("苏州市", 2)
+    # Single-character abbreviations are not indexed.
+    assert gazetteer.longest_prefix("苏北", include_aliases=True) is None
+
+
+def test_gazetteer_scales_to_county_level_divisions() -> None:
+    rows = [{"adcode": "990000", "name": "测试省", "level": "province", "parent_adcode": None}]
+    rows.extend(
+        {"adcode": f"98{idx:04d}", "name": f"测试{idx}区", "level": "district", "parent_adcode": "990000"}
+        for idx in range(3000)
+    )
+    gazetteer = Gazetteer.from_admin_division(rows)
+    assert len(gazetteer) == 3001
+    division, end = gazetteer.longest_prefix("测试2999区人民路1号", level="district")
+    assert division.adcode == "982999"
+    assert end == len("测试2999区")
+
+
+def test_gazetteer_ambiguous_parent_is_not_resolved() -> None:
+    gazetteer = get_gazetteer()
+    assert gazetteer.unique_parent_name("朝阳区", "district") == ""
+    assert gazetteer.unique_parent_name("南山区", "district") == "深圳市"
+
+
+def test_normalize_backfills_province_for_any_known_city() -> None:
+    assert normalize_text("杭州市西湖区文三路90号") == "浙江省杭州市西湖区文三路90号"
+    assert normalize_text("浙江省杭州市西湖区文三路90号") == "浙江省杭州市西湖区文三路90号"
+
+
+def test_parse_resolves_autonomous_region_and_backfills_ancestors() -> None:
+    parsed = parse_components("内蒙古自治区呼和浩特市某某区新华大街1号")
+    assert parsed.get("province") == "内蒙古自治区"
+    assert parsed.get("city") == "呼和浩特市"
+
+    parsed = parse_components("南山区科苑路15号")
+    assert list(parsed)[:3] == ["province", "city", "district"]
+    assert parsed.get("province") == "广东省"
+    assert parsed.get("city") == "深圳市"
+
+
+def test_set_gazetteer_replaces_shared_instance() -> None:
+    custom = Gazetteer.from_admin_division(
+        [
+            {"adcode": "330000", "name": "浙江省", "level": "province", "parent_adcode": None},
+            {"adcode": "330200", "name": "宁波市", "level": "city", "parent_adcode": "330000"},
+        ]
+    )
+    set_gazetteer(custom)
+    try:
+        assert get_gazetteer() is custom
+        assert normalize_text("宁波市海曙区") == "浙江省宁波市海曙区"
+        assert normalize_text("深圳市南山区") == "深圳市南山区"
+    finally:
+        set_gazetteer(None)
+    assert normalize_text("深圳市南山区").startswith("广东省")
@@ -1,4 +1,8 @@
-from packages.address_core.parse import parse_components
+import csv
+from pathlib import Path
+
+from packages.address_core.analyze import analyze_address
+from packages.address_core.parse import parse_components, parse_components_batch
 
 
 def test_parse_components_partial_fields() -> None:
@@ -29,3 +33,16 @@ def test_parse_components_normalizes_raw_input_before_parse() -> None:
     assert parsed.get("district") == "南山区"
     assert parsed.get("road") == "科苑路"
     assert parsed.get("house_no") == "15号"
+
+
+def test_parse_components_batch_matches_per_record_on_cn1300_fixture() -> None:
+    dataset = Path("testdata/fixtures/lab-mode-phase1_5-中文地址测试用例-1300-2026-02-15.csv")
+    with dataset.open("r", encoding="utf-8-sig", newline="") as handle:
+        texts = [row["原始地址"] for row in csv.DictReader(handle)]
+    assert len(texts) == 1300
+
+    batch = parse_components_batch([*texts, *texts[:50], "", "  "])
+    expected = [parse_components(text) for text in [*texts, *texts[:50], "", "  "]]
+    assert batch == expected
+    assert [list(item.keys()) for item in batch] == [list(item.keys()) for item in expected]
+    assert [analyze_address(text).parsed for text in texts] == expected[: len(texts)]
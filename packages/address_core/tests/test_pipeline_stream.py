@@ -0,0 +1,70 @@
+import itertools
+import json
+import os
+
+import pytest
+
+from packages.address_core.pipeline import run, stream
+from packages.address_core.readers import iter_records
+
+
+class _FlakyTrustProvider:
+    def query_admin_division(self, namespace: str, name: str, parent_hint=None):
+        if name == "罗湖区":
+            raise RuntimeError("trust_down")
+        return [{"name": name}]
+
+
+def test_stream_matches_run_for_valid_records() -> None:
+    os.environ["ADDRESS_TRUSTED_FENGTU_ENABLED"] = "0"
+    records = [
+        {"raw_id": "s1", "raw_text": "杭州市西湖区文三路90号"},
+        {"raw_id": "s2", "raw_text": "杭州市 西湖区文三路90号"},
+        {"raw_id": "s3", "raw_text": "上海市浦东新区世纪大道8号"},
+    ]
+    ruleset = {"ruleset_id": "default"}
+    assert list(stream(iter(records), ruleset, batch_size=2)) == run(records, ruleset)
+
+
+def test_stream_emits_error_results_instead_of_aborting() -> None:
+    os.environ["ADDRESS_TRUSTED_FENGTU_ENABLED"] = "0"
+    records = [
+        {"raw_id": "e1", "raw_text": "   "},
+        {"raw_id": "e2", "raw_text": "广东省深圳市罗湖区不存在路64号"},
+        {"raw_id": "e3", "raw_text": "杭州市西湖区文三路90号"},
+    ]
+    ruleset = {"ruleset_id": "default", "require_trust_enhancement": True}
+    results = list(stream(records, ruleset, trust_provider=_FlakyTrustProvider()))
+    assert [item["raw_id"] for item in results] == ["e1", "e2", "e3"]
+    assert results[0] == {"raw_id": "e1", "status": "error", "error": "blocked: raw_text empty for raw_id=e1"}
+    assert results[1]["error"] == "blocked: trust enhancement failed: RuntimeError"
+    assert results[2]["canon_text"]
+
+    with pytest.raises(ValueError, match="blocked: trust provider is required"):
+        stream(records, ruleset)
+
+
+def test_stream_consumes_input_lazily() -> None:
+    os.environ["ADDRESS_TRUSTED_FENGTU_ENABLED"] = "0"
+    endless = ({"raw_id": f"l{idx}", "raw_text": f"杭州市西湖区文三路{idx}号"} for idx in itertools.count())
+    first = list(itertools.islice(stream(endless, {"ruleset_id": "default"}, batch_size=4), 5))
+    assert [item["raw_id"] for item in first] == ["l0", "l1", "l2", "l3", "l4"]
+
+
+def test_iter_records_reads_csv_and_jsonl(tmp_path) -> None:
+    csv_path = tmp_path / "cases.csv"
+    csv_path.write_text("case_id,原始地址\nc1,杭州市西湖区文三路90号\n,上海市浦东新区世纪大道8号\n", encoding="utf-8")
+    assert list(iter_records(csv_path, raw_text_field="原始地址", raw_id_field="case_id")) == [
+        {"raw_id": "c1", "raw_text": "杭州市西湖区文三路90号"},
+        {"raw_id": "2", "raw_text": "上海市浦东新区世纪大道8号"},
+    ]
+
+    jsonl_path = tmp_path / "records.jsonl"
+    jsonl_path.write_text(
+        "\n".join(json.dumps(row, ensure_ascii=False) for row in [{"raw_id": "j1", "raw_text": "杭州市西湖区文三路90号"}, {}]) + "\n",
+        encoding="utf-8",
+    )
+    assert list(iter_records(jsonl_path)) == [
+        {"raw_id": "j1", "raw_text": "杭州市西湖区文三路90号"},
+        {"raw_id": "2", "raw_text": ""},
+    ]
@@ -43,3 +43,91 @@ def test_pipeline_blocks_when_trust_required_and_provider_fails() -> None:
             ruleset={"ruleset_id": "default", "require_trust_enhancement": True, "trust_namespace": "system.trust.dev"},
             trust_provider=_FailingTrustProvider(),
         )
+
+
+@pytest.mark.parametrize("execution_mode", ["threads", "processes", "asyncio"])
+def test_pipeline_execution_modes_match_sequential(execution_mode: str) -> None:
+    os.environ["ADDRESS_TRUSTED_FENGTU_ENABLED"] = "0"
+    records = [
+        {"raw_id": f"r-mode-{idx}", "raw_text": text}
+        for idx, text in enumerate(
+            [
+                "杭州市西湖区文三路90号",
+                "上海市浦东新区世纪大道8号",
+                "杭州市 西湖区文三路90号",
+                "广东省深圳市罗湖区不存在路64号",
+                "北京市朝阳区建国路88号3栋2单元1201室",
+            ]
+            * 3
+        )
+    ]
+    ruleset = {"ruleset_id": "default", "trust_namespace": "system.trust.dev"}
+    expected = run(records=records, ruleset=ruleset, trust_provider=_DummyTrustProvider())
+    outputs = run(
+        records=records,
+        ruleset=ruleset,
+        trust_provider=_DummyTrustProvider(),
+        execution_mode=execution_mode,
+        workers=2,
+        chunk_size=4,
+    )
+    assert outputs == expected
+    assert [item["raw_id"] for item in outputs] == ["r-mode-0", "r-mode-1", "r-mode-3", "r-mode-4"]
+
+
+@pytest.mark.parametrize("execution_mode", ["threads", "asyncio"])
+def test_pipeline_parallel_modes_keep_blocked_semantics(execution_mode: str) -> None:
+    os.environ["ADDRESS_TRUSTED_FENGTU_ENABLED"] = "0"
+    with pytest.raises(ValueError, match="blocked: trust enhancement failed: RuntimeError"):
+        run(
+            records=[{"raw_id": f"r-{idx}", "raw_text": f"杭州市西湖区文三路{idx}号"} for idx in range(8)],
+            ruleset={"ruleset_id": "default", "require_trust_enhancement": True, "trust_namespace": "system.trust.dev"},
+            trust_provider=_FailingTrustProvider(),
+            execution_mode=execution_mode,
+            workers=4,
+        )
+    with pytest.raises(ValueError, match="unsupported execution_mode"):
+        run(records=[{"raw_id": "r", "raw_text": "杭州市"}], ruleset={}, execution_mode="gpu")
+
+
+class _CountingTrustProvider(_DummyTrustProvider):
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, str]] = []
+
+    def query_admin_division(self, namespace: str, name: str, parent_hint=None):
+        self.calls.append(("admin_division", name))
+        return super().query_admin_division(namespace, name, parent_hint)
+
+    def query_road(self, namespace: str, name: str, adcode_hint=None):
+        self.calls.append(("road", name))
+        return super().query_road(namespace, name, adcode_hint)
+
+
+class _BulkTrustProvider:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, tuple[str, ...]]] = []
+
+    def query_road_many(self, namespace: str, names, adcode_hint=None):
+        self.calls.append(("road", tuple(names)))
+        return {name: [{"name": name}] for name in names}
+
+    def query_poi_many(self, namespace: str, names, adcode_hint=None, top_k: int = 5):
+        self.calls.append(("poi", tuple(names)))
+        return {name: [{"name": name}] * 2 for name in names}
+
+
+def test_pipeline_resolves_each_distinct_trust_name_once() -> None:
+    os.environ["ADDRESS_TRUSTED_FENGTU_ENABLED"] = "0"
+    records = [{"raw_id": f"r-{idx}", "raw_text": f"杭州市西湖区文三路{idx}号"} for idx in range(20)]
+    records.append({"raw_id": "r-other", "raw_text": "杭州市西湖区天目山路1号"})
+
+    provider = _CountingTrustProvider()
+    outputs = run(records=records, ruleset={"ruleset_id": "default", "trust_namespace": "ns"}, trust_provider=provider)
+    assert sorted(provider.calls) == [("admin_division", "西湖区"), ("road", "天目山路"), ("road", "文三路")]
+    road_items = [item for item in outputs[-1]["evidence"]["items"] if item.get("domain") == "road"]
+    assert road_items == [{"step": "trust_query", "domain": "road", "namespace": "ns", "query": "天目山路", "count": 2}]
+
+    bulk = _BulkTrustProvider()
+    outputs = run(records=records, ruleset={"ruleset_id": "default", "trust_namespace": "ns"}, trust_provider=bulk)
+    assert bulk.calls == [("road", ("文三路", "天目山路")), ("poi", ("文三路", "天目山路"))]
+    assert [item.get("domain") for item in outputs[0]["evidence"]["items"] if item.get("step") == "trust_query"] == ["road", "poi"]
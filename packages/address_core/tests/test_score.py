@@ -1,4 +1,10 @@
-from packages.address_core.score import score_confidence
+from packages.address_core.score import (
+    bucket_counts,
+    compile_score_rules,
+    score_confidence,
+    score_feature_matrix,
+    score_features,
+)
 from packages.address_core.types import MatchCandidate
 
 
@@ -49,3 +55,44 @@ def test_score_confidence_marks_building_room_without_unit_as_review() -> None:
     confidence, strategy = score_confidence(parsed, candidates)
     assert 0.62 <= confidence < 0.88
     assert strategy == "match_dict"
+
+
+def test_score_rules_from_ruleset_config_override_defaults() -> None:
+    parsed = {"province": "上海市", "city": "上海市", "district": "浦东新区", "road": "世纪大道"}
+    candidates = [MatchCandidate(name="上海市上海市浦东新区世纪大道", score=0.81, source="parsed_prefix")]
+    default_confidence, default_strategy = score_confidence(parsed, candidates)
+    assert default_strategy == "human_required"
+
+    ruleset = {
+        "config_json": {
+            "score_rules": {
+                "missing_field_penalties": {"house_no": 0.0},
+                "thresholds": {"match_dict": 0.5},
+            }
+        }
+    }
+    confidence, strategy = score_confidence(parsed, candidates, compile_score_rules(ruleset))
+    assert confidence == round(default_confidence + 0.4, 4)
+    assert strategy == "match_dict"
+    assert compile_score_rules(ruleset) is compile_score_rules(ruleset)
+
+
+def test_score_feature_matrix_matches_per_record_scoring() -> None:
+    rules = compile_score_rules()
+    samples = [
+        ({"province": "广东省", "district": "罗湖区", "road": "不存在路", "house_no": "64号"},
+         [MatchCandidate(name="广东省罗湖区不存在路64号", score=0.92, source="invalid_road_truncate")]),
+        ({"road": "人民路", "building": "9栋", "room": "276室"},
+         [MatchCandidate(name="人民路9栋276室", score=0.75, source="normalized_text"),
+          MatchCandidate(name="人民路", score=0.35, source="fengtu_real_check_invalid")]),
+        ({}, []),
+    ]
+    rows = [score_features(parsed, candidates, rules) for parsed, candidates in samples]
+    assert len(rows[0]) == len(rules.feature_names)
+    expected = [score_confidence(parsed, candidates, rules)[0] for parsed, candidates in samples]
+    assert score_feature_matrix(rows, rules) == expected
+
+
+def test_bucket_counts_splits_by_thresholds() -> None:
+    assert bucket_counts([0.95, 0.85, 0.7, 0.6, 0.1], t_low=0.6, t_high=0.85) == (2, 2, 1)
+    assert bucket_counts([], t_low=0.6, t_high=0.85) == (0, 0, 0)
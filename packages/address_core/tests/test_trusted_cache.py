@@ -0,0 +1,53 @@
+import time
+
+from packages.address_core.trusted_cache import PersistentResponseCache, report_cache_metrics
+
+
+def test_persistent_cache_survives_reopen_and_counts_hits(tmp_path) -> None:
+    path = tmp_path / "cache.sqlite3"
+    cache = PersistentResponseCache(path)
+    cache.put("address_standardize", ("address_standardize", "上海市浦东新区世纪大道8号"), {"ok": True, "data": {"a": 1}})
+    cache.close()
+
+    reopened = PersistentResponseCache(path)
+    assert reopened.get("address_standardize", ("address_standardize", "上海市浦东新区世纪大道8号")) == {"ok": True, "data": {"a": 1}}
+    assert reopened.get("address_standardize", ("address_standardize", "missing")) is None
+    assert reopened.stats() == {"size": 1, "hits": 1, "misses": 1, "stale": 0, "evictions": 0}
+
+
+def test_persistent_cache_uses_per_interface_ttl(tmp_path) -> None:
+    cache = PersistentResponseCache(tmp_path / "cache.sqlite3", default_ttl_sec=3600, interface_ttls={"address_real_check": 0.01})
+    cache.put("address_real_check", ("address_real_check", "x"), {"ok": True})
+    cache.put("address_standardize", ("address_standardize", "x"), {"ok": True})
+    time.sleep(0.05)
+    assert cache.get("address_real_check", ("address_real_check", "x")) is None
+    assert cache.get("address_standardize", ("address_standardize", "x")) == {"ok": True}
+    assert cache.stats()["stale"] == 1
+
+
+def test_persistent_cache_evicts_least_recently_used(tmp_path) -> None:
+    cache = PersistentResponseCache(tmp_path / "cache.sqlite3", max_entries=10)
+    for idx in range(10):
+        cache.put("i", ("i", idx), {"ok": True, "idx": idx})
+    assert cache.get("i", ("i", 0)) is not None
+    cache.put("i", ("i", 10), {"ok": True, "idx": 10})
+    stats = cache.stats()
+    assert stats["size"] == 9 and stats["evictions"] == 2
+    assert cache.get("i", ("i", 0)) is not None
+    assert cache.get("i", ("i", 1)) is None
+
+
+def test_report_cache_metrics_publishes_counters() -> None:
+    published = []
+
+    class _Sink:
+        def upsert_observation_metric(self, **kwargs):
+            published.append(kwargs)
+
+    report_cache_metrics(_Sink(), {"hits": 3, "misses": 1, "stale": 0}, labels={"source": "test"})
+    assert [item["metric_name"] for item in published] == [
+        "trusted.fengtu.cache.hits",
+        "trusted.fengtu.cache.misses",
+        "trusted.fengtu.cache.stale",
+    ]
+    assert published[0]["metric_value"] == 3.0 and published[0]["labels"] == {"source": "test"}
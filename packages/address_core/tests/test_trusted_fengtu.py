@@ -1,5 +1,12 @@
+import json
 import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
 
+import pytest
+
+from packages.address_core.trusted_cache import PersistentResponseCache
 from packages.address_core.trusted_fengtu import FengtuTrustedClient
 
 
@@ -22,19 +29,157 @@ def test_fengtu_client_disabled_returns_none_on_real_check() -> None:
     assert client.is_real_address("广东省深圳市罗湖区不存在路64号") is None
 
 
-def test_fengtu_network_error_requires_user_confirmation() -> None:
+def test_fengtu_open_circuit_fails_fast_until_confirmed() -> None:
     os.environ["ADDRESS_TRUSTED_FENGTU_ENABLED"] = "1"
-    os.environ.pop("ADDRESS_TRUSTED_FENGTU_NETWORK_CONFIRM", None)
-    FengtuTrustedClient._network_confirmation_required = True
-    FengtuTrustedClient._last_network_error = "TimeoutError"
-    FengtuTrustedClient._network_confirmed_once = False
-    FengtuTrustedClient._last_confirm_by = ""
+    FengtuTrustedClient._breakers.clear()
+    breaker = FengtuTrustedClient.breaker("address_real_check")
+    for _ in range(5):
+        breaker.record_failure("TimeoutError")
 
     client = FengtuTrustedClient()
     blocked = client.call("address_real_check", {"address": "上海市浦东新区世纪大道8号"})
     assert blocked.get("ok") is False
-    assert str(blocked.get("reason", "")).startswith("await_user_confirmation")
+    assert blocked.get("reason") == "circuit_open:TimeoutError"
+    # Other interfaces keep their own breaker.
+    assert FengtuTrustedClient.breaker("address_standardize").state == "closed"
+
+    state = FengtuTrustedClient.network_confirmation_state()
+    assert state["confirmation_required"] is True
+    assert state["last_network_error"] == "TimeoutError"
 
-    os.environ["ADDRESS_TRUSTED_FENGTU_NETWORK_CONFIRM"] = "1"
+    FengtuTrustedClient.confirm_network_resume("tester")
     resumed = client.call("address_real_check", {"address": "上海市浦东新区世纪大道8号"})
-    assert str(resumed.get("reason", "")).startswith("await_user_confirmation") is False
+    assert str(resumed.get("reason", "")).startswith("circuit_open") is False
+    FengtuTrustedClient._breakers.clear()
+
+
+class _FengtuStub(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    requests: list = []
+    peers: set = set()
+
+    def _reply(self, payload: dict) -> None:
+        raw = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def do_GET(self) -> None:  # noqa: N802
+        query = parse_qs(urlsplit(self.path).query)
+        _FengtuStub.requests.append(("GET", query.get("address", [""])[0]))
+        _FengtuStub.peers.add(self.client_address)
+        self._reply({"result": {"stdAddress": "STD:" + query.get("address", [""])[0]}})
+
+    def do_POST(self) -> None:  # noqa: N802
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)))
+        _FengtuStub.requests.append(("POST", [item["address"] for item in body["addresses"]]))
+        _FengtuStub.peers.add(self.client_address)
+        self._reply({"results": [{"isReal": "false" if "不存在" in item["address"] else "true"} for item in body["addresses"]]})
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture()
+def fengtu_stub(tmp_path, monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FengtuStub)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    config = {
+        "trusted_sources": [
+            {
+                "source_id": "fengtu_stub",
+                "provider": "fengtu",
+                "trusted_interfaces": [
+                    {
+                        "interface_id": "address_standardize",
+                        "base_url": f"{base}/standardize",
+                        "method": "GET",
+                        "request_template": {"query": {"address": "{address}", "city": "{city}"}},
+                    },
+                    {
+                        "interface_id": "address_real_check",
+                        "base_url": f"{base}/real_check",
+                        "method": "POST",
+                        "request_template": {"body": {"address": "{address}"}},
+                        "batch": {"base_url": f"{base}/real_check/batch", "items_key": "addresses", "response_key": "results"},
+                    },
+                ],
+            }
+        ]
+    }
+    config_path = tmp_path / "trusted_data_sources.json"
+    config_path.write_text(json.dumps(config), encoding="utf-8")
+    monkeypatch.setenv("ADDRESS_TRUSTED_FENGTU_ENABLED", "1")
+    monkeypatch.setenv("ADDRESS_TRUSTED_FENGTU_TIMEOUT_SEC", "5")
+    FengtuTrustedClient._breakers.clear()
+    _FengtuStub.requests = []
+    _FengtuStub.peers = set()
+    yield str(config_path)
+    server.shutdown()
+    server.server_close()
+
+
+def test_fengtu_client_caches_and_reuses_connection(fengtu_stub) -> None:
+    client = FengtuTrustedClient(fengtu_stub)
+    first = client.standardize("上海市浦东新区世纪大道8号", city="上海市")
+    assert first == "STD:上海市浦东新区世纪大道8号"
+    # Whitespace variants share the normalized cache key.
+    assert client.standardize("上海市浦东新区 世纪大道8号", city="上海市") == first
+    assert client.standardize("上海市浦东新区世纪大道9号", city="上海市") == "STD:上海市浦东新区世纪大道9号"
+    assert len(_FengtuStub.requests) == 2
+    assert len(_FengtuStub.peers) == 1
+    assert client.cache_stats()["hits"] == 1
+
+
+def test_fengtu_client_batch_methods(fengtu_stub) -> None:
+    client = FengtuTrustedClient(fengtu_stub)
+    items = [{"address": f"广东省深圳市南山区科苑路{idx}号"} for idx in range(6)]
+    items.append(dict(items[0]))
+    standardized = client.standardize_many(items)
+    assert standardized == [f"STD:{item['address']}" for item in items]
+    assert len([req for req in _FengtuStub.requests if req[0] == "GET"]) == 6
+
+    checks = client.is_real_address_many([{"address": "广东省深圳市罗湖区不存在路64号"}, *items])
+    assert checks == [False] + [True] * len(items)
+    posts = [req for req in _FengtuStub.requests if req[0] == "POST"]
+    assert len(posts) == 1 and len(posts[0][1]) == 7
+
+
+def test_fengtu_shared_client_is_singleton() -> None:
+    FengtuTrustedClient.reset_shared()
+    assert FengtuTrustedClient.shared() is FengtuTrustedClient.shared()
+    FengtuTrustedClient.reset_shared()
+
+
+def test_fengtu_long_lived_client_follows_config_edits(fengtu_stub) -> None:
+    client = FengtuTrustedClient(fengtu_stub)
+    assert client.standardize("上海市浦东新区世纪大道8号") == "STD:上海市浦东新区世纪大道8号"
+
+    config = json.loads(open(fengtu_stub, encoding="utf-8").read())
+    standardize = config["trusted_sources"][0]["trusted_interfaces"][0]
+    standardize["base_url"] = standardize["base_url"].replace("/standardize", "/v2/standardize")
+    standardize["request_template"]["query"]["address"] = "v2:{address}"
+    with open(fengtu_stub, "w", encoding="utf-8") as handle:
+        json.dump(config, handle)
+    stat = os.stat(fengtu_stub)
+    os.utime(fengtu_stub, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    # Same client, no restart: the edited interface is used and old results are not served.
+    assert client.standardize("上海市浦东新区世纪大道8号") == "STD:v2:上海市浦东新区世纪大道8号"
+    assert len(_FengtuStub.requests) == 2
+
+
+def test_fengtu_disk_cache_serves_later_clients_without_network(fengtu_stub, tmp_path) -> None:
+    cache_path = tmp_path / "fengtu_cache.sqlite3"
+    first = FengtuTrustedClient(fengtu_stub, disk_cache=PersistentResponseCache(cache_path))
+    assert first.standardize("上海市浦东新区世纪大道8号") == "STD:上海市浦东新区世纪大道8号"
+    assert len(_FengtuStub.requests) == 1
+
+    warm = FengtuTrustedClient(fengtu_stub, disk_cache=PersistentResponseCache(cache_path))
+    assert warm.standardize("上海市浦东新区世纪大道8号") == "STD:上海市浦东新区世纪大道8号"
+    assert len(_FengtuStub.requests) == 1
+    assert warm.disk_cache_stats()["hits"] == 1
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Hashable, Mapping, Optional
+
+
+def _project_root() -> Path:
+    return Path(__file__).resolve().parents[2]
+
+
+def default_cache_path() -> Path:
+    return _project_root() / "runtime_store" / "fengtu_response_cache.sqlite3"
+
+
+class PersistentResponseCache:
+    """SQLite-backed cache of trusted-source responses shared across runs.
+
+    Entries expire per interface (``interface_ttls``, falling back to ``default_ttl_sec``);
+    once more than ``max_entries`` are stored the least recently used tenth is evicted.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        default_ttl_sec: float = 7 * 24 * 3600,
+        interface_ttls: Optional[Mapping[str, float]] = None,
+        max_entries: int = 200000,
+    ) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._default_ttl_sec = float(default_ttl_sec)
+        self._interface_ttls = {str(k): float(v) for k, v in dict(interface_ttls or {}).items()}
+        self._max_entries = max(1, int(max_entries))
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS response_cache (
+                cache_key TEXT PRIMARY KEY,
+                interface_id TEXT NOT NULL,
+                response_json TEXT NOT NULL,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_response_cache_accessed ON response_cache(accessed_at)")
+        self._size = int(self._conn.execute("SELECT COUNT(*) FROM response_cache").fetchone()[0])
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.evictions = 0
+
+    @classmethod
+    def from_env(cls, interface_ttls: Optional[Mapping[str, float]] = None) -> Optional["PersistentResponseCache"]:
+        """Build from ``ADDRESS_TRUSTED_FENGTU_DISK_CACHE`` ("1" for the default path, or a file path)."""
+        configured = str(os.getenv("ADDRESS_TRUSTED_FENGTU_DISK_CACHE") or "").strip()
+        if not configured or configured == "0":
+            return None
+        path = default_cache_path() if configured == "1" else Path(configured)
+        return cls(
+            path,
+            default_ttl_sec=float(os.getenv("ADDRESS_TRUSTED_FENGTU_DISK_CACHE_TTL_SEC") or 7 * 24 * 3600),
+            interface_ttls=interface_ttls,
+            max_entries=int(os.getenv("ADDRESS_TRUSTED_FENGTU_DISK_CACHE_MAX_ENTRIES") or 200000),
+        )
+
+    @staticmethod
+    def _encode_key(key: Hashable) -> str:
+        return json.dumps(list(key) if isinstance(key, tuple) else key, ensure_ascii=False)
+
+    def ttl_for(self, interface_id: str) -> float:
+        return self._interface_ttls.get(interface_id, self._default_ttl_sec)
+
+    def get(self, interface_id: str, key: Hashable) -> Optional[Dict[str, Any]]:
+        encoded = self._encode_key(key)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response_json, stored_at FROM response_cache WHERE cache_key = ?",
+                (encoded,),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            if now - float(row[1]) > self.ttl_for(interface_id):
+                self.stale += 1
+                return None
+            self._conn.execute("UPDATE response_cache SET accessed_at = ? WHERE cache_key = ?", (now, encoded))
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, interface_id: str, key: Hashable, response: Dict[str, Any]) -> None:
+        encoded = self._encode_key(key)
+        now = time.time()
+        payload = json.dumps(response, ensure_ascii=False)
+        with self._lock:
+            inserted = self._conn.execute(
+                "INSERT OR IGNORE INTO response_cache (cache_key, interface_id, response_json, stored_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (encoded, interface_id, payload, now, now),
+            ).rowcount
+            if inserted:
+                self._size += 1
+            else:
+                self._conn.execute(
+                    "UPDATE response_cache SET response_json = ?, stored_at = ?, accessed_at = ? WHERE cache_key = ?",
+                    (payload, now, now, encoded),
+                )
+            if self._size > self._max_entries:
+                self._evict_locked()
+
+    def _evict_locked(self) -> None:
+        # Evict in chunks so a full cache does not pay a DELETE on every insert.
+        target = self._max_entries - max(1, self._max_entries // 10)
+        excess = self._size - target
+        deleted = self._conn.execute(
+            "DELETE FROM response_cache WHERE cache_key IN "
+            "(SELECT cache_key FROM response_cache ORDER BY accessed_at ASC LIMIT ?)",
+            (excess,),
+        ).rowcount
+        self._size -= deleted
+        self.evictions += deleted
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM response_cache")
+            self._size = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": self._size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "stale": self.stale,
+                "evictions": self.evictions,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def report_cache_metrics(repository: Any, stats: Mapping[str, int], labels: Optional[Dict[str, Any]] = None) -> None:
+    """Publish cache counters as ``trusted.fengtu.cache.*`` observation metrics."""
+    for name in ("hits", "misses", "stale", "evictions", "size"):
+        if name in stats:
+            repository.upsert_observation_metric(
+                metric_name=f"trusted.fengtu.cache.{name}",
+                metric_value=float(stats[name]),
+                labels=dict(labels or {}),
+            )
@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+import http.client
 import json
 import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional
-from urllib.parse import urlencode
-from urllib.request import Request, urlopen
+from typing import Any, Dict, Hashable, List, Mapping, Optional, Sequence, Tuple
+from urllib.error import HTTPError
+from urllib.parse import urlencode, urlsplit
+
+from packages.address_core.circuit_breaker import OPEN, BreakerRegistry, CircuitBreaker
+from packages.address_core.normalize import normalize_text
+from packages.address_core.trusted_cache import PersistentResponseCache
 
 
 def _project_root() -> Path:
@@ -33,48 +42,247 @@ def _deep_find_string(payload: Any, keys: set[str]) -> Optional[str]:
     return None
 
 
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(str(os.getenv(name) or default))
+    except ValueError:
+        return default
+
+
+_CONFIG_LOCK = threading.Lock()
+_CONFIG_CACHE: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+_MISSING_CONFIG: Dict[str, Any] = {}
+
+
+def _load_config_cached(path: Path) -> Dict[str, Any]:
+    # Parsed once per file version: callers get the same dict until the file's mtime changes.
+    try:
+        mtime = path.stat().st_mtime_ns
+    except OSError:
+        return _MISSING_CONFIG
+    key = str(path)
+    with _CONFIG_LOCK:
+        cached = _CONFIG_CACHE.get(key)
+        if cached and cached[0] == mtime:
+            return cached[1]
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        data = {}
+    config = data if isinstance(data, dict) else {}
+    with _CONFIG_LOCK:
+        _CONFIG_CACHE[key] = (mtime, config)
+    return config
+
+
+class _ResultCache:
+    """Thread-safe LRU cache whose entries expire ``ttl_sec`` after insertion."""
+
+    def __init__(self, maxsize: int, ttl_sec: float) -> None:
+        self._maxsize = max(0, maxsize)
+        self._ttl_sec = ttl_sec
+        self._items: "OrderedDict[Hashable, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._items[key]
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, value: Dict[str, Any]) -> None:
+        if self._maxsize <= 0:
+            return
+        with self._lock:
+            self._items[key] = (time.monotonic() + self._ttl_sec, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self._maxsize:
+                self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"size": len(self._items), "hits": self.hits, "misses": self.misses}
+
+
+class _KeepAliveSession:
+    """Keep-alive HTTP connections, one per (scheme, host) per thread.
+
+    http.client connections are not thread-safe, so each worker thread owns its own.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+
+    def _connections(self) -> Dict[Tuple[str, str], http.client.HTTPConnection]:
+        connections = getattr(self._local, "connections", None)
+        if connections is None:
+            connections = {}
+            self._local.connections = connections
+        return connections
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        body: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: float,
+    ) -> bytes:
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        connections = self._connections()
+        for attempt in range(2):
+            conn = connections.get(key)
+            reused = conn is not None
+            if conn is None:
+                conn_cls = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+                conn = conn_cls(parts.netloc, timeout=timeout)
+                connections[key] = conn
+            elif conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                resp = conn.getresponse()
+                raw = resp.read()
+            except (http.client.RemoteDisconnected, http.client.CannotSendRequest, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                connections.pop(key, None)
+                # The server may drop an idle keep-alive connection; retry once on a fresh one.
+                if reused and attempt == 0:
+                    continue
+                raise
+            except Exception:
+                conn.close()
+                connections.pop(key, None)
+                raise
+            if resp.will_close:
+                conn.close()
+                connections.pop(key, None)
+            if resp.status >= 400:
+                raise HTTPError(url, resp.status, resp.reason, resp.headers, None)
+            return raw
+        raise http.client.RemoteDisconnected("connection closed")
+
+
 class FengtuTrustedClient:
-    _network_confirmation_required: bool = False
-    _last_network_error: str = ""
-    _network_confirmed_once: bool = False
+    # Per-interface breakers are process-wide so every client sees the same provider health.
+    _breakers = BreakerRegistry()
     _last_confirm_by: str = ""
 
-    def __init__(self, config_path: Optional[str] = None) -> None:
+    _shared_instance: Optional["FengtuTrustedClient"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        config_path: Optional[str] = None,
+        disk_cache: Optional[PersistentResponseCache] = None,
+    ) -> None:
         self._config_path = Path(config_path) if config_path else _default_config_path()
         self._config = self._load_config()
+        # Optional cross-run cache; per-interface TTLs come from ``cache_ttl_sec`` in the config.
+        self._disk_cache = disk_cache or PersistentResponseCache.from_env(self._interface_ttls())
+        self._interfaces: Dict[Tuple[str, str], Optional[Dict[str, Any]]] = {}
+        self._cache = _ResultCache(
+            maxsize=_env_int("ADDRESS_TRUSTED_FENGTU_CACHE_SIZE", 10000),
+            ttl_sec=float(_env_int("ADDRESS_TRUSTED_FENGTU_CACHE_TTL_SEC", 3600)),
+        )
+        self._session = _KeepAliveSession()
+        self._max_concurrency = max(1, _env_int("ADDRESS_TRUSTED_FENGTU_MAX_CONCURRENCY", 8))
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
 
-    def enabled(self) -> bool:
-        return os.getenv("ADDRESS_TRUSTED_FENGTU_ENABLED", "1") == "1"
+    @classmethod
+    def shared(cls) -> "FengtuTrustedClient":
+        """Process-wide client for the default config; reuses its cache and connections."""
+        if cls._shared_instance is None:
+            with cls._shared_lock:
+                if cls._shared_instance is None:
+                    cls._shared_instance = cls()
+        return cls._shared_instance
 
     @classmethod
-    def _network_confirmed_by_user(cls) -> bool:
-        return cls._network_confirmed_once or os.getenv("ADDRESS_TRUSTED_FENGTU_NETWORK_CONFIRM", "0") == "1"
+    def reset_shared(cls) -> None:
+        with cls._shared_lock:
+            instance = cls._shared_instance
+            cls._shared_instance = None
+        if instance is not None and instance._executor is not None:
+            instance._executor.shutdown(wait=False)
+
+    def enabled(self) -> bool:
+        return os.getenv("ADDRESS_TRUSTED_FENGTU_ENABLED", "1") == "1"
 
     @classmethod
     def network_confirmation_state(cls) -> Dict[str, Any]:
+        breakers = [breaker.snapshot() for breaker in cls._breakers.all()]
+        tripped = [item for item in breakers if item["state"] != "closed"]
         return {
-            "confirmation_required": cls._network_confirmation_required,
-            "last_network_error": cls._last_network_error,
+            "confirmation_required": any(item["state"] == OPEN for item in breakers),
+            "last_network_error": str((tripped or [{}])[0].get("last_error") or ""),
             "last_confirm_by": cls._last_confirm_by,
+            "breakers": breakers,
         }
 
     @classmethod
     def confirm_network_resume(cls, operator: str) -> Dict[str, Any]:
-        cls._network_confirmed_once = True
+        """Operator override: close every breaker immediately instead of waiting for a probe."""
         cls._last_confirm_by = str(operator or "").strip() or "unknown"
+        cls._breakers.reset_all(f"confirmed_by:{cls._last_confirm_by}")
         return cls.network_confirmation_state()
 
+    @classmethod
+    def breaker(cls, interface_id: str) -> CircuitBreaker:
+        return cls._breakers.get(interface_id)
+
+    def cache_stats(self) -> Dict[str, int]:
+        return self._cache.stats()
+
+    def disk_cache_stats(self) -> Dict[str, int]:
+        return self._disk_cache.stats() if self._disk_cache is not None else {}
+
+    def _interface_ttls(self) -> Dict[str, float]:
+        ttls: Dict[str, float] = {}
+        for src in list(self._config.get("trusted_sources") or []):
+            for item in list(src.get("trusted_interfaces") or []):
+                if item.get("cache_ttl_sec") is not None:
+                    ttls[str(item.get("interface_id"))] = float(item["cache_ttl_sec"])
+        return ttls
+
     def _load_config(self) -> Dict[str, Any]:
-        try:
-            if self._config_path.exists():
-                data = json.loads(self._config_path.read_text(encoding="utf-8"))
-                if isinstance(data, dict):
-                    return data
-        except Exception:
-            pass
-        return {}
+        return _load_config_cached(self._config_path)
+
+    def _refresh_config(self) -> None:
+        # Long-lived (shared) clients pick up config edits: base_url, keys and provider groups
+        # resolved from the old file are dropped together with results fetched through them.
+        config = self._load_config()
+        if config is not self._config:
+            self._config = config
+            self._interfaces = {}
+            self._cache.clear()
 
     def _find_interface(self, interface_id: str) -> Optional[Dict[str, Any]]:
+        self._refresh_config()
+        preferred_group = str(os.getenv("FENGTU_PROVIDER_GROUP") or "").strip().lower()
+        key = (interface_id, preferred_group)
+        interfaces = self._interfaces
+        if key not in interfaces:
+            interfaces[key] = self._resolve_interface(interface_id, preferred_group)
+        return interfaces[key]
+
+    def _resolve_interface(self, interface_id: str, preferred_group: str) -> Optional[Dict[str, Any]]:
         trusted_sources = list(self._config.get("trusted_sources") or [])
         fengtu_sources = [
             src
@@ -82,7 +290,6 @@ class FengtuTrustedClient:
             if str(src.get("source_id") or "").startswith("fengtu")
             or str(src.get("provider") or "").lower() == "fengtu"
         ]
-        preferred_group = str(os.getenv("FENGTU_PROVIDER_GROUP") or "").strip().lower()
         if preferred_group:
             for src in fengtu_sources:
                 for item in list(src.get("trusted_interfaces") or []):
@@ -113,6 +320,22 @@ class FengtuTrustedClient:
     def _compact_empty(data: Dict[str, Any]) -> Dict[str, Any]:
         return {k: v for k, v in data.items() if v not in ("", None)}
 
+    @staticmethod
+    def _cache_key(interface_id: str, payload: Mapping[str, Any]) -> Hashable:
+        if "address" in payload:
+            return (
+                interface_id,
+                normalize_text(str(payload.get("address") or "")),
+                str(payload.get("province") or ""),
+                str(payload.get("city") or ""),
+                str(payload.get("county") or ""),
+            )
+        return (interface_id, json.dumps(dict(payload), ensure_ascii=False, sort_keys=True, default=str))
+
+    @staticmethod
+    def _timeout() -> float:
+        return float(os.getenv("ADDRESS_TRUSTED_FENGTU_TIMEOUT_SEC", "0.8"))
+
     def _auth_headers(self, interface: Dict[str, Any]) -> Dict[str, str]:
         headers = {str(k): str(v) for k, v in dict(interface.get("headers") or {}).items()}
         env_name = str(interface.get("api_key_env") or "")
@@ -121,29 +344,24 @@ class FengtuTrustedClient:
             headers["ak"] = env_key
         return headers
 
-    def call(self, interface_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
-        interface = self._find_interface(interface_id)
-        if not interface:
-            return {"ok": False, "reason": "interface_not_found", "interface_id": interface_id}
+    def _query_ak(self, interface: Dict[str, Any], query: Dict[str, Any]) -> None:
+        env_key = os.getenv(str(interface.get("api_key_env") or ""), "")
+        if str(interface.get("ak_in", "header")) == "query" and env_key and "ak" not in query:
+            query["ak"] = env_key
 
-        if not self.enabled():
-            return {"ok": False, "reason": "disabled"}
-        if FengtuTrustedClient._network_confirmation_required:
-            if not FengtuTrustedClient._network_confirmed_by_user():
-                return {
-                    "ok": False,
-                    "reason": f"await_user_confirmation:{FengtuTrustedClient._last_network_error or 'network_error'}",
-                }
-            FengtuTrustedClient._network_confirmation_required = False
-            FengtuTrustedClient._last_network_error = ""
-            FengtuTrustedClient._network_confirmed_once = False
+    @staticmethod
+    def _circuit_open(interface_id: str, breaker: CircuitBreaker) -> Dict[str, Any]:
+        return {
+            "ok": False,
+            "reason": f"circuit_open:{breaker.last_error or 'network_error'}",
+            "interface_id": interface_id,
+        }
 
+    def _request_one(self, interface_id: str, interface: Dict[str, Any], payload: Dict[str, Any]) -> Dict[str, Any]:
         method = str(interface.get("method") or "GET").upper()
         base_url = str(interface.get("base_url") or "")
         request_template = dict(interface.get("request_template") or {})
         headers = self._auth_headers(interface)
-        env_name = str(interface.get("api_key_env") or "")
-        env_key = os.getenv(env_name, "")
 
         query = self._compact_empty(
             self._render_template(dict(request_template.get("query") or {}), payload)
@@ -155,8 +373,7 @@ class FengtuTrustedClient:
             if isinstance(request_template.get("body"), dict)
             else None
         )
-        if str(interface.get("ak_in", "header")) == "query" and env_key and "ak" not in query:
-            query["ak"] = env_key
+        self._query_ak(interface, query)
         if query:
             base_url = f"{base_url}?{urlencode(query)}"
 
@@ -165,43 +382,152 @@ class FengtuTrustedClient:
             body_bytes = json.dumps(body, ensure_ascii=False).encode("utf-8")
             headers.setdefault("Content-Type", "application/json")
 
+        breaker = self.breaker(interface_id)
+        if not breaker.allow():
+            return self._circuit_open(interface_id, breaker)
         try:
-            request = Request(base_url, data=body_bytes, headers=headers, method=method)
-            with urlopen(request, timeout=float(os.getenv("ADDRESS_TRUSTED_FENGTU_TIMEOUT_SEC", "0.8"))) as resp:
-                raw = resp.read().decode("utf-8")
-            data = json.loads(raw) if raw else {}
-            return {"ok": True, "interface_id": interface_id, "data": data}
+            raw = self._session.request(method, base_url, body=body_bytes, headers=headers, timeout=self._timeout())
+            text = raw.decode("utf-8")
+            data = json.loads(text) if text else {}
         except Exception as exc:
-            FengtuTrustedClient._network_confirmation_required = True
-            FengtuTrustedClient._last_network_error = exc.__class__.__name__
-            FengtuTrustedClient._network_confirmed_once = False
+            breaker.record_failure(exc.__class__.__name__)
             return {"ok": False, "reason": exc.__class__.__name__, "interface_id": interface_id}
+        breaker.record_success()
+        return {"ok": True, "interface_id": interface_id, "data": data}
 
-    def standardize(self, address: str, province: str = "", city: str = "", county: str = "") -> Optional[str]:
-        response = self.call(
-            "address_standardize",
-            {
-                "address": address,
-                "province": province,
-                "city": city,
-                "county": county,
-            },
-        )
+    def _request_batch(
+        self,
+        interface_id: str,
+        interface: Dict[str, Any],
+        payloads: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        # Provider batch endpoint: {"batch": {"base_url", "items_key", "response_key", "max_items"}}.
+        spec = dict(interface.get("batch") or {})
+        request_template = dict(interface.get("request_template") or {})
+        item_template = request_template.get("body") or request_template.get("query") or {}
+        items_key = str(spec.get("items_key") or "items")
+        response_key = str(spec.get("response_key") or "results")
+        max_items = max(1, int(spec.get("max_items") or 50))
+        query: Dict[str, Any] = {}
+        self._query_ak(interface, query)
+        url = str(spec.get("base_url") or interface.get("base_url") or "")
+        if query:
+            url = f"{url}?{urlencode(query)}"
+        headers = self._auth_headers(interface)
+        headers.setdefault("Content-Type", "application/json")
+
+        breaker = self.breaker(interface_id)
+        responses: List[Dict[str, Any]] = []
+        for start in range(0, len(payloads), max_items):
+            chunk = payloads[start : start + max_items]
+            if not breaker.allow():
+                responses.extend(self._circuit_open(interface_id, breaker) for _ in chunk)
+                continue
+            body = {items_key: [self._compact_empty(self._render_template(dict(item_template), item)) for item in chunk]}
+            try:
+                raw = self._session.request(
+                    "POST",
+                    url,
+                    body=json.dumps(body, ensure_ascii=False).encode("utf-8"),
+                    headers=headers,
+                    timeout=self._timeout() * max(1, len(chunk) // 10),
+                )
+                data = json.loads(raw.decode("utf-8") or "{}")
+                rows = data.get(response_key) if isinstance(data, dict) else data
+                rows = rows if isinstance(rows, list) else []
+                breaker.record_success()
+            except Exception as exc:
+                breaker.record_failure(exc.__class__.__name__)
+                failed = {"ok": False, "reason": exc.__class__.__name__, "interface_id": interface_id}
+                responses.extend(dict(failed) for _ in chunk)
+                continue
+            for index in range(len(chunk)):
+                if index < len(rows):
+                    responses.append({"ok": True, "interface_id": interface_id, "data": rows[index]})
+                else:
+                    responses.append({"ok": False, "reason": "batch_item_missing", "interface_id": interface_id})
+        return responses
+
+    def _request_concurrent(
+        self,
+        interface_id: str,
+        interface: Dict[str, Any],
+        payloads: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        if len(payloads) == 1 or self._max_concurrency == 1:
+            return [self._request_one(interface_id, interface, payload) for payload in payloads]
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self._max_concurrency,
+                        thread_name_prefix="fengtu",
+                    )
+        return list(self._executor.map(lambda payload: self._request_one(interface_id, interface, payload), payloads))
+
+    def call(self, interface_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        return self.call_many(interface_id, [payload])[0]
+
+    def call_many(self, interface_id: str, payloads: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Resolve many payloads for one interface.
+
+        Cached and duplicate payloads are answered without network calls; the rest go
+        through the provider batch endpoint when configured, else bounded concurrency.
+        """
+        interface = self._find_interface(interface_id)
+        if not interface:
+            return [{"ok": False, "reason": "interface_not_found", "interface_id": interface_id} for _ in payloads]
+        if not self.enabled():
+            return [{"ok": False, "reason": "disabled"} for _ in payloads]
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(payloads)
+        pending: Dict[Hashable, List[int]] = {}
+        for index, payload in enumerate(payloads):
+            key = self._cache_key(interface_id, payload)
+            if key not in pending:
+                cached = self._cache.get(key)
+                if cached is None and self._disk_cache is not None:
+                    cached = self._disk_cache.get(interface_id, key)
+                    if cached is not None:
+                        self._cache.put(key, cached)
+                if cached is not None:
+                    results[index] = cached
+                    continue
+            pending.setdefault(key, []).append(index)
+
+        if pending:
+            unique = [payloads[indexes[0]] for indexes in pending.values()]
+            if interface.get("batch") and len(unique) > 1:
+                fetched = self._request_batch(interface_id, interface, unique)
+            else:
+                fetched = self._request_concurrent(interface_id, interface, unique)
+            for (key, indexes), response in zip(pending.items(), fetched):
+                if response.get("ok"):
+                    self._cache.put(key, response)
+                    if self._disk_cache is not None:
+                        self._disk_cache.put(interface_id, key, response)
+                for index in indexes:
+                    results[index] = response
+        return [item or {"ok": False, "reason": "unresolved", "interface_id": interface_id} for item in results]
+
+    @staticmethod
+    def _address_payload(address: str, province: str = "", city: str = "", county: str = "") -> Dict[str, Any]:
+        return {
+            "address": address,
+            "province": province,
+            "city": city,
+            "county": county,
+        }
+
+    @staticmethod
+    def _standardized_from(response: Dict[str, Any]) -> Optional[str]:
         if not response.get("ok"):
             return None
         data = response.get("data")
         return _deep_find_string(data, {"stdAddress", "standardizedAddress", "fullAddress", "address", "result"})
 
-    def is_real_address(self, address: str, province: str = "", city: str = "", county: str = "") -> Optional[bool]:
-        response = self.call(
-            "address_real_check",
-            {
-                "address": address,
-                "province": province,
-                "city": city,
-                "county": county,
-            },
-        )
+    @staticmethod
+    def _real_flag_from(response: Dict[str, Any]) -> Optional[bool]:
         if not response.get("ok"):
             return None
         data = response.get("data")
@@ -224,3 +550,23 @@ class FengtuTrustedClient:
         if any(token in text for token in ("true", "valid", "real", "是", "有效", "存在")):
             return True
         return None
+
+    def standardize(self, address: str, province: str = "", city: str = "", county: str = "") -> Optional[str]:
+        response = self.call("address_standardize", self._address_payload(address, province, city, county))
+        return self._standardized_from(response)
+
+    def is_real_address(self, address: str, province: str = "", city: str = "", county: str = "") -> Optional[bool]:
+        response = self.call("address_real_check", self._address_payload(address, province, city, county))
+        return self._real_flag_from(response)
+
+    def standardize_many(self, items: Sequence[Mapping[str, str]]) -> List[Optional[str]]:
+        """Batch ``standardize``; each item carries address/province/city/county."""
+        payloads = [self._address_payload(**{key: str(item.get(key) or "") for key in _ADDRESS_KEYS}) for item in items]
+        return [self._standardized_from(response) for response in self.call_many("address_standardize", payloads)]
+
+    def is_real_address_many(self, items: Sequence[Mapping[str, str]]) -> List[Optional[bool]]:
+        payloads = [self._address_payload(**{key: str(item.get(key) or "") for key in _ADDRESS_KEYS}) for item in items]
+        return [self._real_flag_from(response) for response in self.call_many("address_real_check", payloads)]
+
+
+_ADDRESS_KEYS = ("address", "province", "city", "county")
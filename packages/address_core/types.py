@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 @dataclass
@@ -22,6 +22,15 @@ class MatchCandidate:
     source: str
 
 
+@dataclass
+class AnalyzedAddress:
+    raw_text: str
+    normalized: str
+    parsed: Dict[str, str] = field(default_factory=dict)
+    # Match spans are offsets into ``normalized`` so downstream stages never re-run the regexes.
+    spans: Dict[str, Tuple[int, int]] = field(default_factory=dict)
+
+
 @dataclass
 class GovernanceResult:
     raw_id: str
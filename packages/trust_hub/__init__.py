@@ -323,12 +323,19 @@ class TrustHub:
 
     def list_trust_data_admin_division(self, namespace_id: str = "", limit: int = 20) -> List[Dict[str, object]]:
         safe_limit = max(1, min(int(limit), 1000))
-        table = "trust_data.admin_division" if self._database_url.startswith("postgresql") else "trust_data_admin_division"
+        pg = self._database_url.startswith("postgresql")
+        table = "trust_data.admin_division" if pg else "trust_data_admin_division"
+        releases = "trust_meta.active_release" if pg else "trust_meta_active_release"
+        # Published snapshots stay attached side by side; list only each source's active one.
         sql = f"""
-            SELECT namespace_id, source_id, division_id, name, level, parent_id, adcode, snapshot_id
-            FROM {table}
-            WHERE (:namespace_id = '' OR namespace_id = :namespace_id)
-            ORDER BY division_id ASC
+            SELECT d.namespace_id, d.source_id, d.division_id, d.name, d.level, d.parent_id, d.adcode, d.snapshot_id
+            FROM {table} d
+            JOIN {releases} ar
+              ON ar.namespace_id = d.namespace_id
+             AND ar.source_id = d.source_id
+             AND ar.active_snapshot_id = d.snapshot_id
+            WHERE (:namespace_id = '' OR d.namespace_id = :namespace_id)
+            ORDER BY d.division_id ASC
             LIMIT :limit
         """
         return self._query_db(sql, {"namespace_id": str(namespace_id or ""), "limit": safe_limit})
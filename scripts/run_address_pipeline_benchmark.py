@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from packages.address_core.dedup import dedup_records
+from packages.address_core.pipeline import EXECUTION_MODES, run
+
+
+DEFAULT_DATASET = Path("testdata/fixtures/address-graph-cases-1000-2026-02-12.json")
+DEFAULT_OUTPUT_DIR = Path("output/lab_mode")
+
+
+class _LatencyTrustProvider:
+    """Trust provider with a fixed per-query delay, standing in for a remote trust hub."""
+
+    def __init__(self, latency_ms: float) -> None:
+        self._latency_sec = latency_ms / 1000.0
+
+    def _wait(self, name: str, namespace: str) -> list[dict[str, Any]]:
+        time.sleep(self._latency_sec)
+        return [{"name": name, "namespace": namespace}]
+
+    def query_admin_division(self, namespace: str, name: str, parent_hint=None):
+        return self._wait(name, namespace)
+
+    def query_road(self, namespace: str, name: str, adcode_hint=None):
+        return self._wait(name, namespace)
+
+    def query_poi(self, namespace: str, name: str, adcode_hint=None, top_k: int = 5):
+        return self._wait(name, namespace)
+
+
+def _load_records(dataset_path: Path) -> list[dict[str, str]]:
+    payload = json.loads(dataset_path.read_text(encoding="utf-8"))
+    cases = payload.get("cases") if isinstance(payload, dict) else payload
+    records: list[dict[str, str]] = []
+    for case in cases or []:
+        raw_text = str((case.get("input") or {}).get("address") or "").strip()
+        if raw_text:
+            records.append({"raw_id": str(case.get("case_id") or len(records)), "raw_text": raw_text})
+    return records
+
+
+def _bench_mode(
+    *,
+    mode: str,
+    records: list[dict[str, str]],
+    ruleset: dict[str, Any],
+    trust_provider: Any,
+    workers: int | None,
+    rounds: int,
+) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+    durations: list[float] = []
+    outputs: list[dict[str, Any]] = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        outputs = run(records, ruleset, trust_provider, execution_mode=mode, workers=workers)
+        durations.append(time.perf_counter() - started)
+    best = min(durations)
+    # Duplicates are dropped before parsing, so throughput counts the unique records processed.
+    return {
+        "mode": mode,
+        "best_sec": round(best, 4),
+        "records_per_sec": round(len(outputs) / best, 1) if best > 0 else 0.0,
+    }, outputs
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark address_core pipeline execution modes")
+    parser.add_argument("--dataset", default=str(DEFAULT_DATASET), help="address-graph-cases JSON fixture")
+    parser.add_argument("--modes", default=",".join(EXECUTION_MODES), help="Comma separated execution modes")
+    parser.add_argument("--workers", type=int, default=None, help="Worker count for parallel modes")
+    parser.add_argument("--rounds", type=int, default=3, help="Runs per mode; the best run is reported")
+    parser.add_argument("--trust-latency-ms", type=float, default=2.0, help="Simulated trust query latency (0 disables trust)")
+    parser.add_argument("--enable-fengtu", action="store_true", help="Enable trusted Fengtu interfaces")
+    parser.add_argument("--output-dir", default=str(DEFAULT_OUTPUT_DIR), help="Output directory for report JSON")
+    args = parser.parse_args()
+
+    os.environ["ADDRESS_TRUSTED_FENGTU_ENABLED"] = "1" if args.enable_fengtu else "0"
+    records = _load_records(Path(args.dataset))
+    ruleset = {"ruleset_id": "default", "trust_namespace": "system.trust.bench"}
+    trust_provider = _LatencyTrustProvider(args.trust_latency_ms) if args.trust_latency_ms > 0 else None
+
+    results: list[dict[str, Any]] = []
+    reference: list[dict[str, Any]] | None = None
+    for mode in [item.strip() for item in args.modes.split(",") if item.strip()]:
+        result, outputs = _bench_mode(
+            mode=mode,
+            records=records,
+            ruleset=ruleset,
+            trust_provider=trust_provider,
+            workers=args.workers,
+            rounds=max(1, args.rounds),
+        )
+        if reference is None:
+            reference = outputs
+        result["outputs_match_first_mode"] = outputs == reference
+        results.append(result)
+        print(f"[OK] mode={mode} best_sec={result['best_sec']} records_per_sec={result['records_per_sec']}")
+
+    baseline = next((item for item in results if item["mode"] == "sequential"), results[0] if results else None)
+    for item in results:
+        item["speedup_vs_sequential"] = round(baseline["best_sec"] / item["best_sec"], 2) if baseline and item["best_sec"] else 0.0
+
+    report = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "dataset": str(args.dataset),
+        "records": len(records),
+        "unique_records": len(dedup_records(records)),
+        "workers": args.workers,
+        "trust_latency_ms": args.trust_latency_ms,
+        "fengtu_enabled": bool(args.enable_fengtu),
+        "results": results,
+    }
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    report_path = output_dir / f"address_pipeline_benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    report_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"[OK] report={report_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
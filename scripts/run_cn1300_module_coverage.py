@@ -9,6 +9,7 @@ import sys
 from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
 from statistics import mean, median
 from typing import Any, Callable
@@ -17,11 +18,15 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+from packages.address_core.analyze import analyze_address
 from packages.address_core.dedup import dedup_records
-from packages.address_core.match import recall_candidates
+from packages.address_core.match import recall_candidates_for
 from packages.address_core.normalize import normalize_text
-from packages.address_core.parse import parse_components
-from packages.address_core.score import score_confidence
+from packages.address_core.pipeline import stream as pipeline_stream
+from packages.address_core.readers import iter_records
+from packages.address_core.score import score_address
+from packages.address_core.trusted_cache import report_cache_metrics
+from packages.address_core.trusted_fengtu import FengtuTrustedClient
 
 
 DEFAULT_DATASET = Path("testdata/fixtures/lab-mode-phase1_5-中文地址测试用例-1300-2026-02-15.csv")
@@ -103,10 +108,11 @@ def _eval_row(row: dict[str, str]) -> RowResult:
     expected_judgement = row.get("预期判定", "")
     expected_human_review = _as_bool(row.get("是否需人工复核", ""))
 
-    normalized = normalize_text(raw_text)
+    analysis = analyze_address(raw_text)
+    normalized = analysis.normalized
     normalize_hit = _canon_text(normalized) == _canon_text(expected_normalized)
 
-    parsed = parse_components(normalized)
+    parsed = analysis.parsed
     expected_parse = _expected_for_parse(row)
     parse_hits: dict[str, bool] = {}
     for field_name, expected_value in expected_parse.items():
@@ -114,14 +120,14 @@ def _eval_row(row: dict[str, str]) -> RowResult:
         got = _canon_text(parsed.get(field_name, ""))
         parse_hits[field_name] = bool(expected) and got == expected
 
-    candidates = recall_candidates(normalized)
+    candidates = recall_candidates_for(analysis)
     expected_canon = _canon_text(expected_normalized)
     match_hit = any(_canon_text(getattr(candidate, "name", "")) == expected_canon for candidate in candidates)
     fengtu_names = [str(getattr(candidate, "name", "")) for candidate in candidates if str(getattr(candidate, "source", "")) == "fengtu_standardize"]
     fengtu_candidate = fengtu_names[0] if fengtu_names else ""
     fengtu_conflict_pending = bool(fengtu_candidate) and _canon_text(fengtu_candidate) != expected_canon
 
-    confidence, strategy = score_confidence(parsed, candidates)
+    confidence, strategy = score_address(analysis, candidates)
     predicted_judgement = _label_from_strategy(strategy)
     score_hit = predicted_judgement == expected_judgement
 
@@ -148,6 +154,27 @@ def _eval_row(row: dict[str, str]) -> RowResult:
     )
 
 
+def _eval_pipeline_stream(dataset_path: Path, limit: int) -> dict[str, Any]:
+    # Pipe the CSV reader straight into the streaming pipeline; nothing is buffered per run.
+    records = islice(iter_records(dataset_path, raw_text_field="原始地址", raw_id_field="case_id"), limit)
+    emitted = 0
+    errors: Counter[str] = Counter()
+    strategies: Counter[str] = Counter()
+    for result in pipeline_stream(records, {"ruleset_id": "default"}):
+        emitted += 1
+        if result.get("status") == "error":
+            errors[str(result.get("error") or "").split(":", 1)[0]] += 1
+        else:
+            strategies[str(result.get("strategy") or "")] += 1
+    return {
+        "input_rows": limit,
+        "emitted_count": emitted,
+        "error_count": sum(errors.values()),
+        "error_distribution": dict(errors),
+        "strategy_distribution": dict(strategies),
+    }
+
+
 def _eval_dedup(rows: list[dict[str, str]]) -> dict[str, Any]:
     def _variant_of(raw_text: str) -> str:
         text = str(raw_text or "")
@@ -326,6 +353,7 @@ def _build_report(
             "total_rows": total,
             "progress_rate": 1.0,
         },
+        "pipeline_stream": _eval_pipeline_stream(dataset_path, limit=total),
         "module_coverage": {
             "normalize": {
                 "hit_count": normalize_hits,
@@ -392,6 +420,16 @@ def main() -> int:
     parser.add_argument("--limit", type=int, default=None, help="Optional row limit for quick local debug")
     parser.add_argument("--output-dir", default=str(DEFAULT_OUTPUT_DIR), help="Output directory for report JSON")
     parser.add_argument("--enable-fengtu", action="store_true", help="Enable trusted Fengtu interfaces for match/score")
+    parser.add_argument(
+        "--fengtu-cache",
+        default="",
+        help="Persistent Fengtu response cache path ('1' for runtime_store default); warm runs skip network calls",
+    )
+    parser.add_argument(
+        "--report-cache-metrics",
+        action="store_true",
+        help="Publish Fengtu cache hit/miss/stale counters as governance observation metrics",
+    )
     parser.add_argument("--progress-file", default="", help="Optional progress json output path")
     args = parser.parse_args()
 
@@ -401,6 +439,8 @@ def main() -> int:
 
     if args.enable_fengtu:
         os.environ["ADDRESS_TRUSTED_FENGTU_ENABLED"] = "1"
+    if args.fengtu_cache:
+        os.environ["ADDRESS_TRUSTED_FENGTU_DISK_CACHE"] = args.fengtu_cache
 
     progress_file = Path(args.progress_file) if args.progress_file else None
     started_at = datetime.now(timezone.utc).isoformat()
@@ -477,6 +517,13 @@ def main() -> int:
     print(f"[OK] match_hit_rate={report['module_coverage']['match']['hit_rate']}")
     print(f"[OK] score_judgement_hit_rate={report['module_coverage']['score']['judgement_hit_rate']}")
     print(f"[OK] report={report_path}")
+    cache_stats = FengtuTrustedClient.shared().disk_cache_stats()
+    if cache_stats:
+        print(f"[OK] fengtu_disk_cache={json.dumps(cache_stats)}")
+        if args.report_cache_metrics:
+            from services.governance_api.app.repositories.governance_repository import REPOSITORY
+
+            report_cache_metrics(REPOSITORY, cache_stats, labels={"source": "cn1300_module_coverage"})
     return 0
 
 
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from services.governance_api.app.repositories.governance_repository import REPOSITORY
+
+
+DEFAULT_OUTPUT_DIR = Path("output/lab_mode")
+
+
+def _records(prefix: str, rows: int) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    raw_records = [{"raw_id": f"{prefix}_{i}", "raw_text": f"上海市徐汇区肇嘉浜路{i}号"} for i in range(rows)]
+    results = [
+        {
+            "raw_id": item["raw_id"],
+            "canon_text": item["raw_text"],
+            "confidence": 0.9,
+            "strategy": "rule_only",
+            "evidence": {"items": [{"kind": "persist_benchmark"}]},
+        }
+        for item in raw_records
+    ]
+    return raw_records, results
+
+
+def _cleanup(task_id: str, prefix: str) -> None:
+    REPOSITORY._execute("DELETE FROM governance.canonical_record WHERE raw_id LIKE :prefix", {"prefix": f"{prefix}_%"})
+    REPOSITORY._execute("DELETE FROM governance.raw_record WHERE raw_id LIKE :prefix", {"prefix": f"{prefix}_%"})
+    REPOSITORY._execute("DELETE FROM governance.task_run WHERE task_id = :task_id", {"task_id": task_id})
+    REPOSITORY._execute("DELETE FROM governance.batch WHERE batch_id = :task_id", {"task_id": task_id})
+
+
+def _bench(rows: int, chunk_size: int) -> dict[str, Any]:
+    task_id = f"task_persist_bench_{uuid4().hex[:8]}"
+    prefix = f"{task_id}_raw"
+    REPOSITORY.create_task(
+        task_id=task_id,
+        batch_name="persist-benchmark",
+        ruleset_id="default",
+        status="SUCCEEDED",
+        queue_backend="sync",
+        queue_message="benchmark",
+    )
+    raw_records, results = _records(prefix, rows)
+    try:
+        started = time.perf_counter()
+        REPOSITORY.save_results(task_id=task_id, results=results, raw_records=raw_records, chunk_size=chunk_size)
+        elapsed = time.perf_counter() - started
+    finally:
+        _cleanup(task_id, prefix)
+    return {
+        "chunk_size": chunk_size,
+        "rows": rows,
+        "elapsed_sec": round(elapsed, 4),
+        "rows_per_sec": round(rows / elapsed, 1) if elapsed > 0 else 0.0,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark GovernanceRepository.save_results persistence throughput")
+    parser.add_argument("--rows", type=int, default=5000, help="Records per run (raw + canonical rows each)")
+    parser.add_argument(
+        "--chunk-sizes",
+        default="1,100,1000",
+        help="Comma separated chunk sizes; 1 is the row-at-a-time baseline",
+    )
+    parser.add_argument("--output-dir", default=str(DEFAULT_OUTPUT_DIR), help="Output directory for report JSON")
+    args = parser.parse_args()
+
+    results: list[dict[str, Any]] = []
+    for chunk_size in [int(item) for item in args.chunk_sizes.split(",") if item.strip()]:
+        result = _bench(max(1, args.rows), max(1, chunk_size))
+        results.append(result)
+        print(f"[OK] chunk_size={chunk_size} elapsed_sec={result['elapsed_sec']} rows_per_sec={result['rows_per_sec']}")
+
+    report = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "rows": args.rows,
+        "results": results,
+    }
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    report_path = output_dir / f"governance_persist_benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    report_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"[OK] report={report_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -3,6 +3,7 @@ from pathlib import Path
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 
+from services.governance_api.app.repositories.governance_repository import REPOSITORY
 from services.governance_api.app.routers import lab, manual_review, observability, ops, reviews, rulesets, tasks
 
 
@@ -19,6 +20,8 @@ def create_app() -> FastAPI:
     app.include_router(observability.router, prefix="/v1/governance", tags=["observability"])
     app.include_router(lab.router, prefix="/v1/governance", tags=["lab"])
     app.include_router(manual_review.router, prefix="/v1/governance", tags=["manual-review"])
+    # Drain buffered observation/audit rows before the process goes away.
+    app.add_event_handler("shutdown", REPOSITORY.flush_events)
     return app
 
 
@@ -57,6 +57,7 @@ class FengtuNetworkStatusResponse(BaseModel):
     confirmation_required: bool
     last_network_error: str = ""
     last_confirm_by: str = ""
+    breakers: List[Dict[str, Any]] = Field(default_factory=list)
 
 
 class FengtuConfirmNetworkPayload(BaseModel):
@@ -30,6 +30,7 @@ class ManualReviewQueueResponse(BaseModel):
     total: int
     pending: int
     items: list[ManualReviewItem]
+    next_cursor: str = ""
 
 
 class ManualReviewDecisionRequest(BaseModel):
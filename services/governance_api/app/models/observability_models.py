@@ -23,12 +23,14 @@ class ObservationEvent(BaseModel):
 class ObservationEventsResponse(BaseModel):
     total: int = Field(ge=0)
     items: List[ObservationEvent] = Field(default_factory=list)
+    next_cursor: str = ""
 
 
 class ObservationTraceReplayResponse(BaseModel):
     trace_id: str
     total: int = Field(ge=0)
     timeline: List[ObservationEvent] = Field(default_factory=list)
+    next_cursor: str = ""
 
 
 class ObservationMetricPoint(BaseModel):
@@ -78,6 +80,7 @@ class ObservationSnapshotResponse(BaseModel):
     kpis: Dict[str, Any] = Field(default_factory=dict)
     metrics: List[ObservationMetricPoint] = Field(default_factory=list)
     alerts: List[ObservationAlert] = Field(default_factory=list)
+    memory: Dict[str, Dict[str, Any]] = Field(default_factory=dict)
 
 
 class RuntimeWorkpackageRecord(BaseModel):
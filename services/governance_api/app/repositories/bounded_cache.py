@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import MutableMapping
+from typing import Any, Callable, Iterable, Iterator
+
+_SAMPLE_SIZE = 32
+
+
+def _approx_bytes(items: list[Any], total: int) -> int:
+    # Estimate from the JSON size of a small sample; exact deep sizes would cost more than the cache.
+    if not items or total <= 0:
+        return 0
+    sample = items[:_SAMPLE_SIZE]
+    size = sum(len(json.dumps(item, ensure_ascii=False, default=str)) for item in sample)
+    return int(size / len(sample) * total)
+
+
+class BoundedLog:
+    """Append-only ring buffer that keeps at most ``max_entries`` items no older than ``max_age_sec``."""
+
+    def __init__(self, max_entries: int, *, max_age_sec: float = 0.0, clock: Callable[[], float] = time.monotonic) -> None:
+        self._items: deque[tuple[float, Any]] = deque(maxlen=max(1, int(max_entries)))
+        self._max_age_sec = float(max_age_sec)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def _prune_locked(self) -> None:
+        if self._max_age_sec <= 0:
+            return
+        cutoff = self._clock() - self._max_age_sec
+        while self._items and self._items[0][0] < cutoff:
+            self._items.popleft()
+            self.evictions += 1
+
+    def append(self, item: Any) -> None:
+        with self._lock:
+            self._prune_locked()
+            if len(self._items) == self._items.maxlen:
+                self.evictions += 1
+            self._items.append((self._clock(), item))
+
+    def replace(self, items: Iterable[Any]) -> None:
+        now = self._clock()
+        with self._lock:
+            self._items.clear()
+            self._items.extend((now, item) for item in items)
+
+    def tail(self, count: int) -> list[Any]:
+        with self._lock:
+            self._prune_locked()
+            size = len(self._items)
+            return [self._items[index][1] for index in range(max(0, size - max(0, count)), size)]
+
+    def __iter__(self) -> Iterator[Any]:
+        with self._lock:
+            self._prune_locked()
+            snapshot = [item for _, item in self._items]
+        return iter(snapshot)
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._prune_locked()
+            return len(self._items)
+
+    def stats(self) -> dict[str, Any]:
+        items = list(self)
+        return {
+            "entries": len(items),
+            "capacity": self._items.maxlen,
+            "evictions": self.evictions,
+            "approx_bytes": _approx_bytes(items, len(items)),
+        }
+
+
+class LRUCache(MutableMapping):
+    """Dict with least-recently-used eviction beyond ``max_entries`` and optional entry expiry."""
+
+    def __init__(self, max_entries: int, *, max_age_sec: float = 0.0, clock: Callable[[], float] = time.monotonic) -> None:
+        self._data: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+        self._max_entries = max(1, int(max_entries))
+        self._max_age_sec = float(max_age_sec)
+        self._clock = clock
+        self._lock = threading.RLock()
+        self.evictions = 0
+
+    def _expired(self, stored_at: float) -> bool:
+        return self._max_age_sec > 0 and self._clock() - stored_at > self._max_age_sec
+
+    def __getitem__(self, key: Any) -> Any:
+        with self._lock:
+            stored_at, value = self._data[key]
+            if self._expired(stored_at):
+                del self._data[key]
+                self.evictions += 1
+                raise KeyError(key)
+            self._data.move_to_end(key)
+            return value
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (self._clock(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self._max_entries:
+                self._data.popitem(last=False)
+                self.evictions += 1
+            # Drop expired entries that reached the cold end.
+            while self._data:
+                oldest = next(iter(self._data))
+                if not self._expired(self._data[oldest][0]):
+                    break
+                del self._data[oldest]
+                self.evictions += 1
+
+    def __delitem__(self, key: Any) -> None:
+        with self._lock:
+            del self._data[key]
+
+    def __iter__(self) -> Iterator[Any]:
+        # Iterate over a snapshot: reads reorder entries, which would break a live iterator.
+        with self._lock:
+            keys = [key for key, (stored_at, _) in self._data.items() if not self._expired(stored_at)]
+        return iter(keys)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            entry = self._data.get(key)
+            return entry is not None and not self._expired(entry[0])
+
+    def values(self) -> list[Any]:  # type: ignore[override]
+        with self._lock:
+            return [value for stored_at, value in self._data.values() if not self._expired(stored_at)]
+
+    def items(self) -> list[tuple[Any, Any]]:  # type: ignore[override]
+        with self._lock:
+            return [(key, value) for key, (stored_at, value) in self._data.items() if not self._expired(stored_at)]
+
+    def stats(self) -> dict[str, Any]:
+        values = self.values()
+        return {
+            "entries": len(values),
+            "capacity": self._max_entries,
+            "evictions": self.evictions,
+            "approx_bytes": _approx_bytes(values, len(values)),
+        }
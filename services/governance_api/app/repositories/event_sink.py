@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable
+
+OVERFLOW_POLICIES = ("drop_oldest", "drop_newest", "block")
+
+BatchWriter = Callable[[str, list[dict[str, Any]]], None]
+TransientCheck = Callable[[BaseException], bool]
+
+
+def connection_error(exc: BaseException) -> bool:
+    """Default ``is_transient`` check: only lost connections and timeouts are worth a retry."""
+    return isinstance(exc, (ConnectionError, TimeoutError))
+
+
+class BufferedEventSink:
+    """Bounded queue of telemetry rows drained by a background thread in multi-row batches.
+
+    ``submit`` never touches the database. When the queue is full, ``overflow_policy`` decides
+    whether the oldest droppable row is dropped, the new row is dropped, or the caller blocks
+    until the writer catches up, for at most ``block_timeout_sec``. Rows submitted with
+    ``droppable=False`` (audit rows) are never dropped: they block on a full queue (raising
+    ``TimeoutError`` when the wait expires) and are never evicted by ``drop_oldest``.
+
+    A failed batch is retried row by row so one bad row cannot sink its batch. Rows failing
+    with a transient error (``is_transient``) are retried when non-droppable: they go back to
+    the head of the queue with a backoff capped at ``retry_max_delay_sec``. Every other failed
+    non-droppable row is dead-lettered (counted and kept in ``dead_letters``), never retried.
+    """
+
+    def __init__(
+        self,
+        writer: BatchWriter,
+        *,
+        max_queue: int = 10000,
+        batch_size: int = 500,
+        flush_interval_sec: float = 0.2,
+        overflow_policy: str = "drop_oldest",
+        retry_delay_sec: float = 0.2,
+        retry_max_delay_sec: float = 5.0,
+        block_timeout_sec: float | None = 30.0,
+        is_transient: TransientCheck = connection_error,
+        dead_letter_limit: int = 100,
+    ) -> None:
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow_policy must be one of {OVERFLOW_POLICIES}")
+        self._writer = writer
+        self._max_queue = max(1, int(max_queue))
+        self._batch_size = max(1, int(batch_size))
+        self._flush_interval_sec = max(0.0, float(flush_interval_sec))
+        self._overflow_policy = overflow_policy
+        self._retry_delay_sec = max(0.0, float(retry_delay_sec))
+        self._retry_max_delay_sec = max(self._retry_delay_sec, float(retry_max_delay_sec))
+        self._next_retry_delay = self._retry_delay_sec
+        self._block_timeout_sec = None if block_timeout_sec is None else max(0.0, float(block_timeout_sec))
+        self._is_transient = is_transient
+        self._dead_letters: deque[tuple[str, dict[str, Any], str]] = deque(maxlen=max(1, int(dead_letter_limit)))
+        # Entries are (kind, row, droppable); ``_pinned`` counts the non-droppable ones queued.
+        self._queue: deque[tuple[str, dict[str, Any], bool]] = deque()
+        self._pinned = 0
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._flush_waiters = 0
+        self._closed = False
+        self._thread: threading.Thread | None = None
+        self._counters = {"submitted": 0, "written": 0, "dropped": 0, "failed": 0, "retried": 0, "dead_lettered": 0, "batches": 0, "blocked": 0, "block_timeouts": 0}
+        self._last_error = ""
+
+    def _ensure_thread(self) -> None:
+        # Caller holds the condition lock.
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="governance-event-sink", daemon=True)
+            self._thread.start()
+
+    def submit(self, kind: str, row: dict[str, Any], *, droppable: bool = True) -> bool:
+        """Queue one row for ``kind``; returns False when the row was dropped."""
+        with self._cond:
+            if self._closed:
+                self._counters["dropped"] += 1
+                return False
+            self._ensure_thread()
+            if len(self._queue) >= self._max_queue:
+                if droppable and self._overflow_policy == "drop_newest":
+                    self._counters["dropped"] += 1
+                    return False
+                if droppable and self._overflow_policy == "drop_oldest" and self._evict_oldest_droppable():
+                    self._counters["dropped"] += 1
+                elif not self._wait_for_room():
+                    self._counters["block_timeouts"] += 1
+                    if not droppable:
+                        raise TimeoutError(f"event sink full: {kind} row not queued")
+                    self._counters["dropped"] += 1
+                    return False
+            self._queue.append((kind, row, droppable))
+            self._pinned += 0 if droppable else 1
+            self._counters["submitted"] += 1
+            if len(self._queue) == 1 or len(self._queue) >= self._batch_size:
+                self._cond.notify_all()
+            return True
+
+    def _wait_for_room(self) -> bool:
+        # Caller holds the condition lock.
+        self._counters["blocked"] += 1
+        self._cond.notify_all()
+        deadline = None if self._block_timeout_sec is None else time.monotonic() + self._block_timeout_sec
+        while len(self._queue) >= self._max_queue and not self._closed:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            self._cond.wait(remaining)
+        return True
+
+    def _evict_oldest_droppable(self) -> bool:
+        # Caller holds the condition lock.
+        if self._pinned >= len(self._queue):
+            return False
+        for index, (_, _, droppable) in enumerate(self._queue):
+            if droppable:
+                del self._queue[index]
+                return True
+        return False
+
+    def _take_batch(self) -> list[tuple[str, dict[str, Any], bool]]:
+        # Caller holds the condition lock.
+        count = min(len(self._queue), self._batch_size)
+        batch = [self._queue.popleft() for _ in range(count)]
+        self._pinned -= sum(1 for _, _, droppable in batch if not droppable)
+        self._in_flight = len(batch)
+        self._cond.notify_all()
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if not self._queue and not self._closed:
+                    self._cond.wait()
+                if self._queue and len(self._queue) < self._batch_size and not (self._closed or self._flush_waiters):
+                    # Let a partial batch fill up for a moment before writing it.
+                    self._cond.wait(self._flush_interval_sec)
+                if not self._queue:
+                    if self._closed:
+                        return
+                    continue
+                batch = self._take_batch()
+            self._write(batch)
+
+    def _write(self, batch: list[tuple[str, dict[str, Any], bool]]) -> None:
+        by_kind: dict[str, list[tuple[str, dict[str, Any], bool]]] = {}
+        for entry in batch:
+            by_kind.setdefault(entry[0], []).append(entry)
+        written = failed = 0
+        retry: list[tuple[str, dict[str, Any], bool]] = []
+        dead: list[tuple[str, dict[str, Any], str]] = []
+        for kind, entries in by_kind.items():
+            failures = self._write_kind(kind, entries)
+            written += len(entries) - len(failures)
+            for entry, exc in failures:
+                if entry[2]:
+                    failed += 1
+                elif self._is_transient(exc):
+                    retry.append(entry)
+                else:
+                    dead.append((kind, entry[1], f"{exc.__class__.__name__}: {exc}"))
+        with self._cond:
+            self._counters["written"] += written
+            self._counters["failed"] += failed
+            self._counters["dead_lettered"] += len(dead)
+            self._dead_letters.extend(dead)
+            self._counters["batches"] += 1
+            self._in_flight = 0
+            if retry:
+                # Non-droppable rows go back to the head, in order, and wait out the backoff.
+                self._queue.extendleft(reversed(retry))
+                self._pinned += len(retry)
+                self._counters["retried"] += len(retry)
+                delay = self._next_retry_delay
+                self._next_retry_delay = min(self._retry_max_delay_sec, max(delay * 2, 0.01))
+                self._cond.notify_all()
+                self._cond.wait(delay)
+            else:
+                self._next_retry_delay = self._retry_delay_sec
+                self._cond.notify_all()
+
+    def _write_kind(
+        self, kind: str, entries: list[tuple[str, dict[str, Any], bool]]
+    ) -> list[tuple[tuple[str, dict[str, Any], bool], Exception]]:
+        """Write one kind's rows; returns the entries that failed with their errors."""
+        try:
+            self._writer(kind, [row for _, row, _ in entries])
+            return []
+        except Exception as exc:  # telemetry must never take the writer thread down
+            self._last_error = f"{kind}:{exc.__class__.__name__}"
+            if len(entries) == 1 or self._is_transient(exc):
+                return [(entry, exc) for entry in entries]
+        # The database rejected the batch: retry row by row so only the bad rows fail.
+        failures = []
+        for entry in entries:
+            try:
+                self._writer(kind, [entry[1]])
+            except Exception as exc:
+                self._last_error = f"{kind}:{exc.__class__.__name__}"
+                failures.append((entry, exc))
+        return failures
+
+    def flush(self, timeout: float | None = 10.0) -> bool:
+        """Block until every row queued so far has been written (or dropped after a failed write).
+
+        Non-droppable rows are retried while the database is unreachable, so this returns False
+        on timeout during an outage.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            if self._queue:
+                self._ensure_thread()
+            self._flush_waiters += 1
+            self._cond.notify_all()
+            try:
+                while self._queue or self._in_flight:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    self._cond.wait(remaining)
+                return True
+            finally:
+                self._flush_waiters -= 1
+
+    def close(self, timeout: float | None = 10.0) -> bool:
+        """Flush-on-shutdown hook: drain the queue and stop the writer thread."""
+        flushed = self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        return flushed
+
+    def dead_letters(self) -> list[tuple[str, dict[str, Any], str]]:
+        """The most recent non-droppable rows the database rejected, as (kind, row, error)."""
+        with self._cond:
+            return list(self._dead_letters)
+
+    def stats(self) -> dict[str, Any]:
+        with self._cond:
+            return {
+                **self._counters,
+                "queue_depth": len(self._queue),
+                "max_queue": self._max_queue,
+                "overflow_policy": self._overflow_policy,
+                "last_error": self._last_error,
+            }
@@ -1,30 +1,112 @@
 from __future__ import annotations
 
+import atexit
+import base64
 import json
 import os
 import hashlib
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import Any
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Iterator
 from uuid import uuid4
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event as sa_event, text
+from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError
+
+from packages.address_core.score import bucket_counts
+from services.governance_api.app.repositories.bounded_cache import BoundedLog, LRUCache
+from services.governance_api.app.repositories.event_sink import BufferedEventSink
+from services.governance_api.app.repositories.ops_metrics import OpsMetricsQuery
+from services.governance_api.app.repositories.partition_maintenance import PartitionMaintainer
+
+
+_SEARCH_PATH = "governance, runtime, trust_meta, trust_data, audit, public"
+
+_OBSERVATION_EVENT_COLUMNS = (
+    "event_id", "trace_id", "span_id", "source_service", "event_type", "status", "severity",
+    "task_id", "workpackage_id", "ruleset_id", "payload_json", "created_at",
+)
+_OBSERVATION_METRIC_COLUMNS = (
+    "metric_id", "metric_name", "metric_value", "labels_json", "window_start", "window_end", "created_at",
+)
+_AUDIT_EVENT_COLUMNS = ("event_id", "event_type", "caller", "payload", "related_change_id", "created_at")
+# VARCHAR limits of audit.event_log; rows are checked up front because the insert runs later.
+_AUDIT_EVENT_LIMITS = {"event_type": 64, "caller": 128, "related_change_id": 64}
+_REVIEW_CONFIDENCE_GATE = 0.85
+
+
+def _set_search_path(dbapi_connection, _connection_record) -> None:
+    # Session-level SET must not sit inside a transaction a later rollback could undo.
+    autocommit = dbapi_connection.autocommit
+    dbapi_connection.autocommit = True
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"SET search_path TO {_SEARCH_PATH}")
+    finally:
+        cursor.close()
+        dbapi_connection.autocommit = autocommit
+
+
+def _transient_db_error(exc: BaseException) -> bool:
+    # Lost connections and operational failures clear up on their own; data errors never do.
+    if isinstance(exc, DBAPIError) and exc.connection_invalidated:
+        return True
+    return isinstance(exc, (OperationalError, InterfaceError, ConnectionError, TimeoutError))
+
+
+def _contains_nul(value: Any) -> bool:
+    # jsonb rejects \u0000 in strings and keys.
+    if isinstance(value, str):
+        return "\x00" in value
+    if isinstance(value, dict):
+        return any(_contains_nul(key) or _contains_nul(item) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return any(_contains_nul(item) for item in value)
+    return False
+
+
+def _memory_cap(name: str, default: int) -> int:
+    return max(1, int(str(os.getenv(name) or default)))
+
+
+def _memory_max_age_sec() -> float:
+    return float(str(os.getenv("GOVERNANCE_MEMORY_MAX_AGE_SEC") or "86400"))
+
+
+def _lru(cap_env: str, default: int) -> Callable[[], LRUCache]:
+    return lambda: LRUCache(_memory_cap(cap_env, default), max_age_sec=_memory_max_age_sec())
+
+
+def _ring(cap_env: str, default: int) -> Callable[[], BoundedLog]:
+    return lambda: BoundedLog(_memory_cap(cap_env, default), max_age_sec=_memory_max_age_sec())
 
 
 @dataclass
 class _MemoryStore:
-    tasks: dict[str, dict[str, Any]] = field(default_factory=dict)
-    results: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
+    # The mirror only serves recent in-process reads; Postgres stays the source of truth.
+    tasks: LRUCache = field(default_factory=_lru("GOVERNANCE_MEMORY_MAX_TASKS", 10000))
+    results: LRUCache = field(default_factory=_lru("GOVERNANCE_MEMORY_MAX_RESULT_TASKS", 500))
     reviews: dict[str, dict[str, Any]] = field(default_factory=dict)
     rulesets: dict[str, dict[str, Any]] = field(default_factory=dict)
     change_requests: dict[str, dict[str, Any]] = field(default_factory=dict)
     workpackage_publishes: dict[str, dict[str, Any]] = field(default_factory=dict)
     workpackage_records: dict[str, dict[str, Any]] = field(default_factory=dict)
-    audit_events: list[dict[str, Any]] = field(default_factory=list)
-    observation_events: list[dict[str, Any]] = field(default_factory=list)
-    observation_metrics: list[dict[str, Any]] = field(default_factory=list)
+    audit_events: BoundedLog = field(default_factory=_ring("GOVERNANCE_MEMORY_MAX_AUDIT_EVENTS", 5000))
+    observation_events: BoundedLog = field(default_factory=_ring("GOVERNANCE_MEMORY_MAX_EVENTS", 5000))
+    observation_metrics: BoundedLog = field(default_factory=_ring("GOVERNANCE_MEMORY_MAX_METRICS", 5000))
     observation_alerts: dict[str, dict[str, Any]] = field(default_factory=dict)
 
+    def usage(self) -> dict[str, dict[str, Any]]:
+        return {
+            "tasks": self.tasks.stats(),
+            "results": self.results.stats(),
+            "audit_events": self.audit_events.stats(),
+            "observation_events": self.observation_events.stats(),
+            "observation_metrics": self.observation_metrics.stats(),
+        }
+
 
 class GovernanceGateError(Exception):
     def __init__(self, *, code: str, message: str, status_code: int) -> None:
@@ -54,7 +136,10 @@ class GovernanceRepository:
             }
         )
         self._engine = None
+        self._session_conn: ContextVar[Any] = ContextVar(f"governance_session_{id(self)}", default=None)
         self._engine = self._build_engine()
+        self._event_sink = self._build_event_sink()
+        self._ops_metrics = OpsMetricsQuery(self)
 
     def _enforce_db_switch_guard(self, db_url: str) -> None:
         locked = str(os.getenv("GOVERNANCE_DB_LOCKED_URL") or "").strip()
@@ -76,7 +161,7 @@ class GovernanceRepository:
     def _build_engine(self):
         pool_size = max(1, int(str(os.getenv("PG_POOL_SIZE") or "10")))
         max_overflow = max(0, int(str(os.getenv("PG_MAX_OVERFLOW") or "20")))
-        return create_engine(
+        engine = create_engine(
             self._database_url(),
             pool_pre_ping=True,
             pool_size=pool_size,
@@ -84,6 +169,25 @@ class GovernanceRepository:
             pool_recycle=1800,
             future=True,
         )
+        # Postgres search path is set once per pooled connection instead of per statement.
+        sa_event.listen(engine, "connect", _set_search_path)
+        return engine
+
+    def _build_event_sink(self) -> BufferedEventSink | None:
+        mode = str(os.getenv("GOVERNANCE_EVENT_SINK_MODE") or "async").strip().lower()
+        if mode == "sync":
+            return None
+        sink = BufferedEventSink(
+            self._write_event_batch,
+            max_queue=int(str(os.getenv("GOVERNANCE_EVENT_SINK_MAX_QUEUE") or "10000")),
+            batch_size=int(str(os.getenv("GOVERNANCE_EVENT_SINK_BATCH_SIZE") or "500")),
+            flush_interval_sec=float(str(os.getenv("GOVERNANCE_EVENT_SINK_FLUSH_INTERVAL_SEC") or "0.2")),
+            overflow_policy=str(os.getenv("GOVERNANCE_EVENT_SINK_OVERFLOW") or "drop_oldest").strip(),
+            block_timeout_sec=float(str(os.getenv("GOVERNANCE_EVENT_SINK_BLOCK_TIMEOUT_SEC") or "30")),
+            is_transient=_transient_db_error,
+        )
+        atexit.register(sink.close)
+        return sink
 
     def _get_engine(self):
         if self._engine is None:
@@ -99,27 +203,53 @@ class GovernanceRepository:
     def _sql_json_cast(self, param: str) -> str:
         return f"CAST({param} AS jsonb)"
 
+    @contextmanager
+    def session(self) -> Iterator["GovernanceRepository"]:
+        """Unit of work: repository calls inside the block share one connection and transaction.
+
+        Nested ``session()`` blocks join the outer one. Only database writes are rolled back on
+        error; the in-process memory mirror keeps whatever was applied before the failure.
+        """
+        if self._session_conn.get() is not None:
+            yield self
+            return
+        with self._get_engine().begin() as conn:
+            token = self._session_conn.set(conn)
+            try:
+                yield self
+            finally:
+                self._session_conn.reset(token)
+
+    @contextmanager
+    def _connection(self) -> Iterator[Any]:
+        conn = self._session_conn.get()
+        if conn is not None:
+            yield conn
+            return
+        with self._get_engine().begin() as conn:
+            yield conn
+
     def _execute(self, sql: str, params: dict[str, Any]) -> bool:
         if not self._db_enabled():
             return False
         # If DB is enabled, we expect strict consistency. Failures should propagate.
-        engine = self._get_engine()
-        with engine.begin() as conn:
-            # Postgres search path setup
-            if self._database_url().startswith("postgresql"):
-                conn.execute(text("SET search_path TO governance, runtime, trust_meta, trust_data, audit, public"))
+        with self._connection() as conn:
             conn.execute(text(sql), params)
         return True
 
+    def _execute_many(self, statements: list[tuple[str, dict[str, Any]]]) -> bool:
+        if not self._db_enabled() or not statements:
+            return False
+        with self._connection() as conn:
+            for sql, params in statements:
+                conn.execute(text(sql), params)
+        return True
+
     def _query(self, sql: str, params: dict[str, Any]) -> list[dict[str, Any]]:
         if not self._db_enabled():
             return []
         # If DB is enabled, we expect strict consistency. Failures should propagate.
-        engine = self._get_engine()
-        with engine.begin() as conn:
-            # Postgres search path setup
-            if self._database_url().startswith("postgresql"):
-                conn.execute(text("SET search_path TO governance, runtime, trust_meta, trust_data, audit, public"))
+        with self._connection() as conn:
             rows = conn.execute(text(sql), params).mappings().all()
         return [dict(item) for item in rows]
 
@@ -578,36 +708,38 @@ class GovernanceRepository:
             "trace_id": trace_id,
         }
         now_func = self._sql_now()
-        self._execute(
-            f"""
-            INSERT INTO governance.batch (batch_id, batch_name, status, created_at, updated_at)
-            VALUES (:batch_id, :batch_name, :status, {now_func}, {now_func})
-            ON CONFLICT (batch_id)
-            DO UPDATE SET batch_name = EXCLUDED.batch_name, status = EXCLUDED.status, updated_at = {now_func};
-            """,
-            {
-                "batch_id": batch_id,
-                "batch_name": batch_name,
-                "status": status,
-            },
-        )
-        self._execute(
-            f"""
-            INSERT INTO governance.task_run (task_id, batch_id, status, error_message, runtime, trace_id, created_at, updated_at)
-            VALUES (:task_id, :batch_id, :status, :error_message, :runtime, :trace_id, {now_func}, {now_func})
-            ON CONFLICT (task_id)
-            DO UPDATE SET batch_id = EXCLUDED.batch_id, status = EXCLUDED.status, error_message = EXCLUDED.error_message,
-                          runtime = EXCLUDED.runtime, trace_id = EXCLUDED.trace_id, updated_at = {now_func};
-            """,
-            {
-                "task_id": task_id,
-                "batch_id": batch_id,
-                "status": status,
-                "error_message": queue_message,
-                "runtime": queue_backend,
-                "trace_id": trace_id,
-            },
-        )
+        with self.session():
+            self._execute(
+                f"""
+                INSERT INTO governance.batch (batch_id, batch_name, status, created_at, updated_at)
+                VALUES (:batch_id, :batch_name, :status, {now_func}, {now_func})
+                ON CONFLICT (batch_id)
+                DO UPDATE SET batch_name = EXCLUDED.batch_name, status = EXCLUDED.status, updated_at = {now_func};
+                """,
+                {
+                    "batch_id": batch_id,
+                    "batch_name": batch_name,
+                    "status": status,
+                },
+            )
+            self._execute(
+                f"""
+                INSERT INTO governance.task_run (task_id, batch_id, status, error_message, runtime, trace_id, created_at, updated_at)
+                VALUES (:task_id, :batch_id, :status, :error_message, :runtime, :trace_id, {now_func}, {now_func})
+                ON CONFLICT (task_id)
+                DO UPDATE SET batch_id = EXCLUDED.batch_id, status = EXCLUDED.status, error_message = EXCLUDED.error_message,
+                              runtime = EXCLUDED.runtime, trace_id = EXCLUDED.trace_id, updated_at = {now_func};
+                """,
+                {
+                    "task_id": task_id,
+                    "batch_id": batch_id,
+                    "status": status,
+                    "error_message": queue_message,
+                    "runtime": queue_backend,
+                    "trace_id": trace_id,
+                },
+            )
+        self._ops_metrics.invalidate()
 
     def get_task(self, task_id: str) -> dict[str, Any] | None:
         if self._db_enabled():
@@ -676,83 +808,223 @@ class GovernanceRepository:
         if task_id in self._memory.tasks:
             self._memory.tasks[task_id]["status"] = status
         now_func = self._sql_now()
-        self._execute(
-            f"""
-            UPDATE governance.task_run
-            SET status = :status, updated_at = {now_func}, finished_at = CASE WHEN :status IN ('SUCCEEDED','FAILED','BLOCKED') THEN {now_func} ELSE finished_at END
-            WHERE task_id = :task_id;
-            """,
-            {"task_id": task_id, "status": status},
-        )
-
-    def save_results(
-        self,
-        task_id: str,
-        results: list[dict[str, Any]],
-        raw_records: list[dict[str, Any]] | None = None,
-    ) -> None:
-        self._memory.results[task_id] = results
-        task = self._memory.tasks.get(task_id, {})
-        self.save_raw_records(task_id=task_id, raw_records=(raw_records or []))
-        now_func = self._sql_now()
-        evidence_cast = self._sql_json_cast(":evidence")
-
-        for item in results:
-            raw_id = item.get("raw_id")
-            if not raw_id:
-                continue
-            evidence_json = json.dumps(item.get("evidence", {"items": []}), ensure_ascii=False)
+        with self.session():
             self._execute(
                 f"""
-                INSERT INTO governance.canonical_record (canonical_id, raw_id, canon_text, confidence, strategy, evidence, ruleset_version, created_at, updated_at)
-                VALUES (:canonical_id, :raw_id, :canon_text, :confidence, :strategy, {evidence_cast}, :ruleset_version, {now_func}, {now_func})
-                ON CONFLICT (canonical_id)
-                DO UPDATE SET canon_text = EXCLUDED.canon_text, confidence = EXCLUDED.confidence,
-                              strategy = EXCLUDED.strategy, evidence = EXCLUDED.evidence, updated_at = {now_func};
+                UPDATE governance.task_run
+                SET status = :status, updated_at = {now_func}, finished_at = CASE WHEN :status IN ('SUCCEEDED','FAILED','BLOCKED') THEN {now_func} ELSE finished_at END
+                WHERE task_id = :task_id;
                 """,
-                {
-                    "canonical_id": self._canonical_id(str(raw_id)),
-                    "raw_id": raw_id,
-                    "canon_text": item.get("canon_text", ""),
-                    "confidence": float(item.get("confidence", 0.0)),
-                    "strategy": item.get("strategy", "human_required"),
-                    "evidence": evidence_json,
-                    "ruleset_version": task.get("ruleset_id", "default"),
-                },
+                {"task_id": task_id, "status": status},
             )
+            self._refresh_review_queue_for_task(task_id)
+        self._ops_metrics.invalidate()
 
-    def save_raw_records(self, *, task_id: str, raw_records: list[dict[str, Any]]) -> None:
-        if not raw_records:
-            return
+    def _persist_chunk_size(self, chunk_size: int | None) -> int:
+        if chunk_size is not None:
+            return max(1, int(chunk_size))
+        return max(1, int(str(os.getenv("GOVERNANCE_PERSIST_CHUNK_SIZE") or "1000")))
+
+    def _raw_record_rows(self, task_id: str, raw_records: list[dict[str, Any]]) -> list[dict[str, Any]]:
         task = self._memory.tasks.get(task_id, {})
         batch_id = task.get("batch_id", task_id)
-        now_func = self._sql_now()
+        # ON CONFLICT cannot touch the same row twice in one statement; the last record per raw_id wins.
+        rows: dict[str, dict[str, Any]] = {}
         for raw_input in raw_records:
             raw_id = raw_input.get("raw_id")
             if not raw_id:
                 continue
-            raw_text = raw_input.get("raw_text") or ""
-            self._execute(
-                f"""
-                INSERT INTO governance.raw_record (raw_id, batch_id, raw_text, province, city, district, street, detail, raw_hash, ingested_at)
-                VALUES (:raw_id, :batch_id, :raw_text, :province, :city, :district, :street, :detail, :raw_hash, {now_func})
-                ON CONFLICT (raw_id)
-                DO UPDATE SET batch_id = EXCLUDED.batch_id, raw_text = EXCLUDED.raw_text,
-                              province = EXCLUDED.province, city = EXCLUDED.city, district = EXCLUDED.district,
-                              street = EXCLUDED.street, detail = EXCLUDED.detail;
-                """,
-                {
-                    "raw_id": raw_id,
-                    "batch_id": batch_id,
-                    "raw_text": raw_text,
-                    "province": raw_input.get("province"),
-                    "city": raw_input.get("city"),
-                    "district": raw_input.get("district"),
-                    "street": raw_input.get("street"),
-                    "detail": raw_input.get("detail"),
-                    "raw_hash": f"rawhash_{raw_id}",
-                },
+            rows[str(raw_id)] = {
+                "raw_id": raw_id,
+                "batch_id": batch_id,
+                "raw_text": raw_input.get("raw_text") or "",
+                "province": raw_input.get("province"),
+                "city": raw_input.get("city"),
+                "district": raw_input.get("district"),
+                "street": raw_input.get("street"),
+                "detail": raw_input.get("detail"),
+                "raw_hash": f"rawhash_{raw_id}",
+            }
+        return list(rows.values())
+
+    def _canonical_record_rows(self, task_id: str, results: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        task = self._memory.tasks.get(task_id, {})
+        rows: dict[str, dict[str, Any]] = {}
+        for item in results:
+            raw_id = item.get("raw_id")
+            if not raw_id:
+                continue
+            canonical_id = self._canonical_id(str(raw_id))
+            rows[canonical_id] = {
+                "canonical_id": canonical_id,
+                "raw_id": raw_id,
+                "canon_text": item.get("canon_text", ""),
+                "confidence": float(item.get("confidence", 0.0)),
+                "strategy": item.get("strategy", "human_required"),
+                "evidence": json.dumps(item.get("evidence", {"items": []}), ensure_ascii=False),
+                "ruleset_version": task.get("ruleset_id", "default"),
+            }
+        return list(rows.values())
+
+    def _raw_record_upsert(self, rows: list[dict[str, Any]]) -> tuple[str, dict[str, Any]]:
+        now_func = self._sql_now()
+        sql = f"""
+            INSERT INTO governance.raw_record (raw_id, batch_id, raw_text, province, city, district, street, detail, raw_hash, ingested_at)
+            SELECT t.raw_id, t.batch_id, t.raw_text, t.province, t.city, t.district, t.street, t.detail, t.raw_hash, {now_func}
+            FROM unnest(
+                CAST(:raw_id AS text[]), CAST(:batch_id AS text[]), CAST(:raw_text AS text[]),
+                CAST(:province AS text[]), CAST(:city AS text[]), CAST(:district AS text[]),
+                CAST(:street AS text[]), CAST(:detail AS text[]), CAST(:raw_hash AS text[])
+            ) AS t(raw_id, batch_id, raw_text, province, city, district, street, detail, raw_hash)
+            ON CONFLICT (raw_id)
+            DO UPDATE SET batch_id = EXCLUDED.batch_id, raw_text = EXCLUDED.raw_text,
+                          province = EXCLUDED.province, city = EXCLUDED.city, district = EXCLUDED.district,
+                          street = EXCLUDED.street, detail = EXCLUDED.detail;
+            """
+        columns = ("raw_id", "batch_id", "raw_text", "province", "city", "district", "street", "detail", "raw_hash")
+        return sql, {column: [row[column] for row in rows] for column in columns}
+
+    def _canonical_record_upsert(self, rows: list[dict[str, Any]]) -> tuple[str, dict[str, Any]]:
+        now_func = self._sql_now()
+        sql = f"""
+            INSERT INTO governance.canonical_record (canonical_id, raw_id, canon_text, confidence, strategy, evidence, ruleset_version, created_at, updated_at)
+            SELECT t.canonical_id, t.raw_id, t.canon_text, t.confidence, t.strategy, {self._sql_json_cast("t.evidence")}, t.ruleset_version, {now_func}, {now_func}
+            FROM unnest(
+                CAST(:canonical_id AS text[]), CAST(:raw_id AS text[]), CAST(:canon_text AS text[]),
+                CAST(:confidence AS double precision[]), CAST(:strategy AS text[]), CAST(:evidence AS text[]),
+                CAST(:ruleset_version AS text[])
+            ) AS t(canonical_id, raw_id, canon_text, confidence, strategy, evidence, ruleset_version)
+            ON CONFLICT (canonical_id)
+            DO UPDATE SET canon_text = EXCLUDED.canon_text, confidence = EXCLUDED.confidence,
+                          strategy = EXCLUDED.strategy, evidence = EXCLUDED.evidence, updated_at = {now_func};
+            """
+        columns = ("canonical_id", "raw_id", "canon_text", "confidence", "strategy", "evidence", "ruleset_version")
+        return sql, {column: [row[column] for row in rows] for column in columns}
+
+    def _review_queue_refresh(self, scope: str, params: dict[str, Any]) -> tuple[str, dict[str, Any]]:
+        """Statement re-deriving the review_queue rows of the raw records matched by ``scope``.
+
+        Rows that no longer need a manual decision are removed; ``scope`` filters ``tr``/``raw``.
+        """
+        sql = f"""
+            WITH source AS (
+                SELECT DISTINCT ON (raw.raw_id)
+                    raw.raw_id, tr.task_id, COALESCE(raw.raw_text, '') AS raw_text,
+                    COALESCE(canon.canon_text, '') AS canon_text, COALESCE(canon.confidence, 0) AS confidence,
+                    COALESCE(canon.strategy, '') AS strategy, COALESCE(tr.status, '') AS task_status,
+                    rl.review_status, rl.reviewer, rl.comment AS review_comment, rl.reviewed_at,
+                    tr.created_at AS task_created_at, COALESCE(tr.updated_at, tr.created_at, NOW()) AS task_updated_at,
+                    canon.updated_at AS canonical_updated_at,
+                    (
+                        canon.strategy IN ('human_required', 'human_rejected', 'low_confidence')
+                        OR COALESCE(canon.confidence, 0) < :review_confidence_gate
+                        OR tr.status IN ('SUCCEEDED', 'REVIEWED')
+                    ) AS eligible
+                FROM governance.task_run tr
+                JOIN governance.raw_record raw ON raw.batch_id = tr.batch_id
+                JOIN governance.canonical_record canon ON canon.raw_id = raw.raw_id
+                LEFT JOIN LATERAL (
+                    SELECT rv.review_status, rv.reviewer, rv.comment, rv.reviewed_at
+                    FROM governance.review rv
+                    WHERE rv.raw_id = raw.raw_id
+                    ORDER BY COALESCE(rv.reviewed_at, rv.updated_at, rv.created_at) DESC
+                    LIMIT 1
+                ) rl ON TRUE
+                WHERE {scope}
+                ORDER BY raw.raw_id, tr.updated_at DESC
+            ),
+            removed AS (
+                DELETE FROM governance.review_queue q
+                USING source s
+                WHERE q.raw_id = s.raw_id AND NOT s.eligible
+            )
+            INSERT INTO governance.review_queue (
+                raw_id, task_id, raw_text, canon_text, confidence, strategy, task_status,
+                review_status, reviewer, review_comment, reviewed_at, task_created_at, task_updated_at,
+                canonical_updated_at, pending, risk_level, stage, refreshed_at
             )
+            SELECT
+                s.raw_id, s.task_id, s.raw_text, s.canon_text, s.confidence, s.strategy, s.task_status,
+                s.review_status, s.reviewer, s.review_comment, s.reviewed_at, s.task_created_at, s.task_updated_at,
+                s.canonical_updated_at,
+                s.review_status IS NULL,
+                CASE
+                    WHEN s.review_status IS NOT NULL THEN 'low'
+                    WHEN UPPER(s.task_status) = 'FAILED' OR s.confidence < 0.6 OR s.strategy = 'human_rejected' THEN 'high'
+                    WHEN s.confidence < :review_confidence_gate THEN 'medium'
+                    ELSE 'low'
+                END,
+                CASE WHEN s.review_status IS NULL THEN '待人工确认' ELSE '已人工决策' END,
+                {self._sql_now()}
+            FROM source s
+            WHERE s.eligible
+            ON CONFLICT (raw_id)
+            DO UPDATE SET task_id = EXCLUDED.task_id, raw_text = EXCLUDED.raw_text, canon_text = EXCLUDED.canon_text,
+                          confidence = EXCLUDED.confidence, strategy = EXCLUDED.strategy, task_status = EXCLUDED.task_status,
+                          review_status = EXCLUDED.review_status, reviewer = EXCLUDED.reviewer,
+                          review_comment = EXCLUDED.review_comment, reviewed_at = EXCLUDED.reviewed_at,
+                          task_created_at = EXCLUDED.task_created_at, task_updated_at = EXCLUDED.task_updated_at,
+                          canonical_updated_at = EXCLUDED.canonical_updated_at, pending = EXCLUDED.pending,
+                          risk_level = EXCLUDED.risk_level, stage = EXCLUDED.stage, refreshed_at = EXCLUDED.refreshed_at;
+            """
+        return sql, {**params, "review_confidence_gate": _REVIEW_CONFIDENCE_GATE}
+
+    def _refresh_review_queue_for_task(self, task_id: str) -> None:
+        self._execute(*self._review_queue_refresh("tr.task_id = :task_id", {"task_id": task_id}))
+
+    def _persist_records(
+        self,
+        raw_rows: list[dict[str, Any]],
+        canonical_rows: list[dict[str, Any]],
+        chunk_size: int,
+    ) -> None:
+        # Raw and canonical chunks share one transaction, so a task costs one round trip per chunk.
+        total = max(len(raw_rows), len(canonical_rows))
+        for offset in range(0, total, chunk_size):
+            statements: list[tuple[str, dict[str, Any]]] = []
+            raw_chunk = raw_rows[offset : offset + chunk_size]
+            if raw_chunk:
+                statements.append(self._raw_record_upsert(raw_chunk))
+            canonical_chunk = canonical_rows[offset : offset + chunk_size]
+            if canonical_chunk:
+                statements.append(self._canonical_record_upsert(canonical_chunk))
+            # A raw/canonical pair joins the review queue once the later of its two rows is written.
+            queue_raw_ids = sorted({str(row["raw_id"]) for row in raw_chunk + canonical_chunk})
+            if queue_raw_ids:
+                statements.append(
+                    self._review_queue_refresh(
+                        "raw.raw_id = ANY(CAST(:queue_raw_ids AS text[]))",
+                        {"queue_raw_ids": queue_raw_ids},
+                    )
+                )
+            self._execute_many(statements)
+        self._ops_metrics.invalidate()
+
+    def save_results(
+        self,
+        task_id: str,
+        results: list[dict[str, Any]],
+        raw_records: list[dict[str, Any]] | None = None,
+        *,
+        chunk_size: int | None = None,
+    ) -> None:
+        self._memory.results[task_id] = results
+        self._persist_records(
+            self._raw_record_rows(task_id, raw_records or []),
+            self._canonical_record_rows(task_id, results),
+            self._persist_chunk_size(chunk_size),
+        )
+
+    def save_raw_records(
+        self,
+        *,
+        task_id: str,
+        raw_records: list[dict[str, Any]],
+        chunk_size: int | None = None,
+    ) -> None:
+        if not raw_records:
+            return
+        self._persist_records(self._raw_record_rows(task_id, raw_records), [], self._persist_chunk_size(chunk_size))
 
     def get_results(self, task_id: str) -> list[dict[str, Any]]:
         if self._db_enabled():
@@ -814,7 +1086,7 @@ class GovernanceRepository:
             resolved_raw_id = task_id
         
         now_func = self._sql_now()
-        self._execute(
+        statement = (
             f"""
             INSERT INTO governance.review (review_id, raw_id, review_status, final_canon_text, reviewer, comment, reviewed_at, created_at, updated_at)
             VALUES (:review_id, :raw_id, :review_status, :final_canon_text, :reviewer, :comment, :reviewed_at, {now_func}, {now_func})
@@ -832,6 +1104,13 @@ class GovernanceRepository:
                 "reviewed_at": now_value,
             },
         )
+        self._execute_many(
+            [
+                statement,
+                self._review_queue_refresh("raw.raw_id = :queue_raw_id", {"queue_raw_id": str(resolved_raw_id)}),
+            ]
+        )
+        self._ops_metrics.invalidate()
 
     def get_review(self, task_id: str) -> dict[str, Any] | None:
         if self._db_enabled():
@@ -852,6 +1131,154 @@ class GovernanceRepository:
             return dict(row)
         return self._memory.reviews.get(task_id)
 
+    def runtime_status_rollup(self, *, created_after: str, ruleset_id: str = "") -> list[dict[str, Any]]:
+        """Per-status task counts, result confidence totals and review coverage since ``created_after``.
+
+        One aggregate query instead of loading tasks and then their results and review one by one.
+        A task counts as reviewed when its review row exists; with ``ruleset_id`` only tasks whose
+        canonical records were produced by that ruleset are included.
+        """
+        if self._db_enabled():
+            rows = self._query(
+                """
+                WITH selected AS (
+                    SELECT
+                        tr.task_id,
+                        tr.batch_id,
+                        UPPER(COALESCE(NULLIF(tr.status, ''), 'UNKNOWN')) AS status,
+                        tr.created_at,
+                        EXISTS (
+                            SELECT 1 FROM governance.review rv WHERE rv.review_id = 'review_' || tr.task_id
+                        ) AS reviewed
+                    FROM governance.task_run tr
+                    WHERE tr.created_at >= CAST(:created_after AS timestamptz)
+                      AND (
+                          :ruleset_id = ''
+                          OR EXISTS (
+                              SELECT 1
+                              FROM governance.raw_record raw
+                              JOIN governance.canonical_record canon ON canon.raw_id = raw.raw_id
+                              WHERE raw.batch_id = tr.batch_id AND canon.ruleset_version = :ruleset_id
+                          )
+                      )
+                ),
+                task_results AS (
+                    SELECT s.task_id, COUNT(*) AS result_count, SUM(COALESCE(canon.confidence, 0)) AS confidence_sum
+                    FROM selected s
+                    JOIN governance.raw_record raw ON raw.batch_id = s.batch_id
+                    JOIN governance.canonical_record canon ON canon.raw_id = raw.raw_id
+                    GROUP BY s.task_id
+                )
+                SELECT
+                    s.status,
+                    COUNT(*) AS task_count,
+                    COUNT(*) FILTER (WHERE s.reviewed) AS reviewed_tasks,
+                    COUNT(*) FILTER (WHERE NOT s.reviewed AND res.result_count > 0) AS pending_review_tasks,
+                    COALESCE(SUM(res.result_count), 0) AS result_count,
+                    COALESCE(SUM(res.confidence_sum), 0) AS confidence_sum,
+                    MAX(s.created_at) AS latest_task_at
+                FROM selected s
+                LEFT JOIN task_results res ON res.task_id = s.task_id
+                GROUP BY s.status;
+                """,
+                {"created_after": created_after, "ruleset_id": str(ruleset_id or "")},
+            )
+            return [self._serialize_record(item) for item in rows]
+
+        groups: dict[str, dict[str, Any]] = {}
+        for task in self._memory.tasks.values():
+            if str(task.get("created_at") or "") < created_after:
+                continue
+            if ruleset_id and str(task.get("ruleset_id") or "") != str(ruleset_id):
+                continue
+            task_id = str(task.get("task_id") or "")
+            status = str(task.get("status") or "UNKNOWN").upper()
+            results = self._memory.results.get(task_id, [])
+            reviewed = task_id in self._memory.reviews
+            group = groups.setdefault(
+                status,
+                {"status": status, "task_count": 0, "reviewed_tasks": 0, "pending_review_tasks": 0, "result_count": 0, "confidence_sum": 0.0, "latest_task_at": ""},
+            )
+            group["task_count"] += 1
+            group["reviewed_tasks"] += int(reviewed)
+            group["pending_review_tasks"] += int(bool(results) and not reviewed)
+            group["result_count"] += len(results)
+            group["confidence_sum"] += sum(float(item.get("confidence", 0.0) or 0.0) for item in results)
+            group["latest_task_at"] = max(group["latest_task_at"], str(task.get("created_at") or ""))
+        return list(groups.values())
+
+    def runtime_risk_rollup(self, *, created_after: str, top: int = 5) -> dict[str, Any]:
+        """Confidence buckets, low-confidence strategies and top BLOCKED reasons since ``created_after``."""
+        buckets = {"ge_085": 0, "between_060_085": 0, "lt_060": 0}
+        patterns: list[dict[str, Any]] = []
+        reasons: list[dict[str, Any]] = []
+        if self._db_enabled():
+            params = {"created_after": created_after, "top": max(1, int(top))}
+            with self.session():
+                bucket_rows = self._query(
+                    """
+                    SELECT
+                        CASE
+                            WHEN COALESCE(canon.confidence, 0) >= 0.85 THEN 'ge_085'
+                            WHEN COALESCE(canon.confidence, 0) >= 0.60 THEN 'between_060_085'
+                            ELSE 'lt_060'
+                        END AS bucket,
+                        CASE
+                            WHEN COALESCE(canon.confidence, 0) < 0.60 THEN COALESCE(NULLIF(canon.strategy, ''), 'unknown')
+                        END AS pattern,
+                        COUNT(*) AS count
+                    FROM governance.task_run tr
+                    JOIN governance.raw_record raw ON raw.batch_id = tr.batch_id
+                    JOIN governance.canonical_record canon ON canon.raw_id = raw.raw_id
+                    WHERE tr.created_at >= CAST(:created_after AS timestamptz)
+                    GROUP BY 1, 2;
+                    """,
+                    params,
+                )
+                reasons = self._query(
+                    """
+                    SELECT COALESCE(NULLIF(tr.error_message, ''), 'unknown') AS reason, COUNT(*) AS count
+                    FROM governance.task_run tr
+                    WHERE tr.created_at >= CAST(:created_after AS timestamptz) AND UPPER(tr.status) = 'BLOCKED'
+                    GROUP BY 1
+                    ORDER BY count DESC, reason ASC
+                    LIMIT :top;
+                    """,
+                    params,
+                )
+            for row in bucket_rows:
+                buckets[str(row["bucket"])] += int(row["count"])
+                if row["pattern"] is not None:
+                    patterns.append({"pattern": str(row["pattern"]), "count": int(row["count"])})
+        else:
+            pattern_counts: dict[str, int] = {}
+            reason_counts: dict[str, int] = {}
+            for task in self._memory.tasks.values():
+                if str(task.get("created_at") or "") < created_after:
+                    continue
+                if str(task.get("status") or "").upper() == "BLOCKED":
+                    reason = str(task.get("queue_message") or "unknown")
+                    reason_counts[reason] = reason_counts.get(reason, 0) + 1
+                for result in self._memory.results.get(str(task.get("task_id") or ""), []):
+                    confidence = float(result.get("confidence", 0.0) or 0.0)
+                    if confidence >= 0.85:
+                        buckets["ge_085"] += 1
+                    elif confidence >= 0.60:
+                        buckets["between_060_085"] += 1
+                    else:
+                        buckets["lt_060"] += 1
+                        strategy = str(result.get("strategy") or "unknown")
+                        pattern_counts[strategy] = pattern_counts.get(strategy, 0) + 1
+            patterns = [{"pattern": key, "count": value} for key, value in pattern_counts.items()]
+            reasons = [{"reason": key, "count": value} for key, value in reason_counts.items()]
+        patterns.sort(key=lambda item: (-item["count"], item["pattern"]))
+        reasons.sort(key=lambda item: (-int(item["count"]), str(item["reason"])))
+        return {
+            "confidence_buckets": buckets,
+            "blocked_reason_top": [{"reason": str(item["reason"]), "count": int(item["count"])} for item in reasons[:top]],
+            "low_confidence_pattern_top": patterns[:top],
+        }
+
     def _increment_ruleset_feedback(self, ruleset_id: str, review_status: str) -> dict[str, int]:
         ruleset = self._memory.rulesets.get(ruleset_id)
         if not ruleset:
@@ -972,99 +1399,101 @@ class GovernanceRepository:
         return self._memory.rulesets.get(ruleset_id)
 
     def list_manual_review_items(self, *, pending_only: bool = True, limit: int = 200) -> list[dict[str, Any]]:
+        items, _ = self.page_manual_review_items(pending_only=pending_only, limit=limit)
+        return items
+
+    def page_manual_review_items(
+        self,
+        *,
+        pending_only: bool = True,
+        limit: int = 200,
+        cursor: str = "",
+    ) -> tuple[list[dict[str, Any]], str]:
+        """One keyset page of the review queue plus the cursor of the next page ("" at the end).
+
+        Served from governance.review_queue, ordered pending first, then by ascending confidence and
+        most recent task update, matching idx_review_queue_order.
+        """
         if self._db_enabled():
-            rows = self._query(
-                """
-                WITH review_latest AS (
-                    SELECT DISTINCT ON (raw_id)
-                        raw_id,
-                        review_status,
-                        reviewer,
-                        comment,
-                        reviewed_at,
-                        updated_at
-                    FROM governance.review
-                    ORDER BY raw_id, COALESCE(reviewed_at, updated_at, created_at) DESC
+            params: dict[str, Any] = {"limit": int(limit) + 1}
+            where: list[str] = []
+            if pending_only:
+                where.append("pending")
+            if cursor:
+                pending, confidence, task_updated_at, raw_id = self._decode_cursor(cursor, 4)
+                try:
+                    params.update(
+                        {
+                            "cursor_pending": bool(pending),
+                            "cursor_confidence": float(confidence),
+                            "cursor_updated_at": datetime.fromisoformat(str(task_updated_at)).isoformat(),
+                            "cursor_raw_id": str(raw_id),
+                        }
+                    )
+                except (TypeError, ValueError) as exc:
+                    raise ValueError("invalid cursor") from exc
+                # Mixed sort directions rule out a row comparison; spell out "after the cursor" instead.
+                where.append(
+                    """(
+                        pending < :cursor_pending
+                        OR (pending = :cursor_pending AND (
+                            confidence > :cursor_confidence
+                            OR (confidence = :cursor_confidence AND (
+                                task_updated_at < CAST(:cursor_updated_at AS timestamptz)
+                                OR (task_updated_at = CAST(:cursor_updated_at AS timestamptz) AND raw_id > :cursor_raw_id)
+                            ))
+                        ))
+                    )"""
                 )
+            rows = self._query(
+                f"""
                 SELECT
-                    tr.task_id,
-                    tr.status AS task_status,
-                    tr.created_at AS task_created_at,
-                    tr.updated_at AS task_updated_at,
-                    raw.raw_id,
-                    raw.raw_text,
-                    canon.canon_text,
-                    canon.confidence,
-                    canon.strategy,
-                    canon.updated_at AS canonical_updated_at,
-                    rl.review_status,
-                    rl.reviewer,
-                    rl.comment AS review_comment,
-                    rl.reviewed_at
-                FROM governance.task_run tr
-                JOIN governance.raw_record raw
-                    ON raw.batch_id = tr.batch_id
-                JOIN governance.canonical_record canon
-                    ON canon.raw_id = raw.raw_id
-                LEFT JOIN review_latest rl
-                    ON rl.raw_id = raw.raw_id
-                WHERE (
-                        canon.strategy IN ('human_required', 'human_rejected', 'low_confidence')
-                        OR canon.confidence < :confidence_gate
-                        OR tr.status IN ('SUCCEEDED', 'REVIEWED')
-                    )
-                    AND (:pending_only = FALSE OR rl.review_status IS NULL)
-                ORDER BY
-                    CASE WHEN rl.review_status IS NULL THEN 0 ELSE 1 END ASC,
-                    canon.confidence ASC,
-                    tr.updated_at DESC
+                    task_id, task_status, task_created_at, task_updated_at, raw_id, raw_text, canon_text,
+                    confidence, strategy, canonical_updated_at, review_status, reviewer, review_comment,
+                    reviewed_at, pending, risk_level, stage
+                FROM governance.review_queue
+                {"WHERE " + " AND ".join(where) if where else ""}
+                ORDER BY pending DESC, confidence ASC, task_updated_at DESC, raw_id ASC
                 LIMIT :limit;
                 """,
-                {
-                    "pending_only": bool(pending_only),
-                    "limit": int(limit),
-                    "confidence_gate": 0.85,
-                },
+                params,
             )
+            next_cursor = ""
+            if len(rows) > int(limit):
+                last = rows[int(limit) - 1]
+                next_cursor = self._encode_cursor(
+                    [
+                        bool(last["pending"]),
+                        float(last["confidence"]),
+                        last["task_updated_at"].astimezone(timezone.utc).isoformat(),
+                        str(last["raw_id"]),
+                    ]
+                )
             normalized: list[dict[str, Any]] = []
-            for row in rows:
-                confidence = float(row.get("confidence", 0.0) or 0.0)
-                review_status = str(row.get("review_status") or "")
-                task_status = str(row.get("task_status") or "")
-                strategy = str(row.get("strategy") or "")
-                if review_status:
-                    risk_level = "low"
-                    stage = "已人工决策"
-                else:
-                    stage = "待人工确认"
-                    if task_status.upper() == "FAILED" or confidence < 0.6 or strategy == "human_rejected":
-                        risk_level = "high"
-                    elif confidence < 0.85:
-                        risk_level = "medium"
-                    else:
-                        risk_level = "low"
+            for row in rows[: int(limit)]:
+                row = self._serialize_record(row)
                 normalized.append(
                     {
                         "task_id": str(row.get("task_id") or ""),
                         "raw_id": str(row.get("raw_id") or ""),
                         "raw_text": str(row.get("raw_text") or ""),
                         "canon_text": str(row.get("canon_text") or ""),
-                        "confidence": round(confidence, 6),
-                        "strategy": strategy,
-                        "task_status": task_status,
-                        "review_status": review_status,
+                        "confidence": round(float(row.get("confidence", 0.0) or 0.0), 6),
+                        "strategy": str(row.get("strategy") or ""),
+                        "task_status": str(row.get("task_status") or ""),
+                        "review_status": str(row.get("review_status") or ""),
                         "reviewer": str(row.get("reviewer") or ""),
                         "review_comment": str(row.get("review_comment") or ""),
                         "reviewed_at": str(row.get("reviewed_at") or ""),
                         "task_created_at": str(row.get("task_created_at") or ""),
                         "task_updated_at": str(row.get("task_updated_at") or ""),
                         "canonical_updated_at": str(row.get("canonical_updated_at") or ""),
-                        "stage": stage,
-                        "risk_level": risk_level,
+                        "stage": str(row.get("stage") or ""),
+                        "risk_level": str(row.get("risk_level") or ""),
                         "evidence_ref": f"/v1/governance/tasks/{str(row.get('task_id') or '')}/result",
                     }
                 )
-            return normalized
+            return normalized, next_cursor
 
         items: list[dict[str, Any]] = []
         for task_id, task in self._memory.tasks.items():
@@ -1105,7 +1534,7 @@ class GovernanceRepository:
                     }
                 )
         items.sort(key=lambda row: (row["stage"] != "待人工确认", row["confidence"]))
-        return items[:limit]
+        return items[:limit], ""
 
     def submit_manual_review_decision(
         self,
@@ -1187,6 +1616,8 @@ class GovernanceRepository:
                 """,
                 {"task_id": task_id},
             )
+            self._refresh_review_queue_for_task(task_id)
+            self._ops_metrics.invalidate()
             event = self._append_audit_event(
                 event_type="manual_review_decision",
                 caller=reviewer,
@@ -1227,6 +1658,74 @@ class GovernanceRepository:
             "audit_event_id": "",
         }
 
+    def _emit_event(self, kind: str, row: dict[str, Any], *, droppable: bool = True) -> None:
+        if not self._db_enabled():
+            return
+        if self._event_sink is None:
+            self._write_event_batch(kind, [row])
+            return
+        self._event_sink.submit(kind, row, droppable=droppable)
+
+    def flush_events(self, timeout: float | None = 10.0) -> bool:
+        """Wait until buffered observation/audit rows are in the database."""
+        if self._event_sink is None:
+            return True
+        return self._event_sink.flush(timeout)
+
+    def event_sink_stats(self) -> dict[str, Any]:
+        if self._event_sink is None:
+            return {"mode": "sync"}
+        return {"mode": "async", **self._event_sink.stats()}
+
+    def maintain_partitions(
+        self,
+        *,
+        mode: str = "detach",
+        archive_dir: str = "",
+        archive_format: str = "jsonl",
+        now: datetime | None = None,
+    ) -> list[dict[str, Any]]:
+        """Pre-create upcoming observation/audit partitions and expire those past retention."""
+        if not self._db_enabled():
+            return []
+        self.flush_events()
+        return PartitionMaintainer(self).run(now=now, mode=mode, archive_dir=archive_dir, archive_format=archive_format)
+
+    def _write_event_batch(self, kind: str, rows: list[dict[str, Any]]) -> None:
+        if kind == "observation_event":
+            columns = _OBSERVATION_EVENT_COLUMNS
+            sql = f"""
+                INSERT INTO governance.observation_event ({", ".join(columns)})
+                SELECT t.event_id, t.trace_id, t.span_id, t.source_service, t.event_type, t.status, t.severity,
+                       t.task_id, t.workpackage_id, t.ruleset_id, {self._sql_json_cast("t.payload_json")},
+                       CAST(t.created_at AS timestamptz)
+                FROM unnest({", ".join(f"CAST(:{column} AS text[])" for column in columns)}) AS t({", ".join(columns)});
+                """
+        elif kind == "observation_metric":
+            columns = _OBSERVATION_METRIC_COLUMNS
+            sql = f"""
+                INSERT INTO governance.observation_metric ({", ".join(columns)})
+                SELECT t.metric_id, t.metric_name, CAST(t.metric_value AS double precision),
+                       {self._sql_json_cast("t.labels_json")}, CAST(t.window_start AS timestamptz),
+                       CAST(t.window_end AS timestamptz), CAST(t.created_at AS timestamptz)
+                FROM unnest({", ".join(f"CAST(:{column} AS text[])" for column in columns)}) AS t({", ".join(columns)});
+                """
+        elif kind == "audit_event":
+            columns = _AUDIT_EVENT_COLUMNS
+            sql = f"""
+                INSERT INTO audit.event_log ({", ".join(columns)})
+                SELECT t.event_id, t.event_type, t.caller, {self._sql_json_cast("t.payload")}, t.related_change_id,
+                       CAST(t.created_at AS timestamptz)
+                FROM unnest({", ".join(f"CAST(:{column} AS text[])" for column in columns)}) AS t({", ".join(columns)})
+                ON CONFLICT (event_id, created_at) DO NOTHING;
+                """
+        else:
+            raise ValueError(f"unknown event kind: {kind}")
+        params = {
+            column: [None if row.get(column) is None else str(row.get(column)) for row in rows] for column in columns
+        }
+        self._execute(sql, params)
+
     def _now_iso(self) -> str:
         return datetime.now(timezone.utc).isoformat()
 
@@ -1242,6 +1741,13 @@ class GovernanceRepository:
         payload: dict[str, Any],
         related_change_id: str | None = None,
     ) -> dict[str, Any]:
+        fields = {"event_type": event_type, "caller": caller, "related_change_id": related_change_id}
+        for column, limit in _AUDIT_EVENT_LIMITS.items():
+            if fields[column] is not None and len(str(fields[column])) > limit:
+                raise ValueError(f"{column} exceeds {limit} characters")
+        if _contains_nul(payload):
+            raise ValueError("payload must not contain NUL characters")
+        payload_text = json.dumps(payload, ensure_ascii=False)
         event_id = f"evt_{uuid4().hex[:12]}"
         event = {
             "event_id": event_id,
@@ -1252,21 +1758,18 @@ class GovernanceRepository:
             "created_at": self._now_iso(),
         }
         self._memory.audit_events.append(event)
-        now_func = self._sql_now()
-        payload_cast = self._sql_json_cast(":payload")
-        self._execute(
-            f"""
-            INSERT INTO audit.event_log (event_id, event_type, caller, payload, related_change_id, created_at)
-            VALUES (:event_id, :event_type, :caller, {payload_cast}, :related_change_id, {now_func})
-            ON CONFLICT (event_id) DO NOTHING;
-            """,
+        # Audit rows are never dropped on overflow; a full queue applies backpressure instead.
+        self._emit_event(
+            "audit_event",
             {
                 "event_id": event_id,
                 "event_type": event_type,
                 "caller": caller,
-                "payload": json.dumps(payload, ensure_ascii=False),
+                "payload": payload_text,
                 "related_change_id": related_change_id,
+                "created_at": event["created_at"],
             },
+            droppable=False,
         )
         return event
 
@@ -1301,78 +1804,139 @@ class GovernanceRepository:
             "created_at": self._now_iso(),
         }
         self._memory.observation_events.append(event)
-        now_func = self._sql_now()
-        payload_cast = self._sql_json_cast(":payload_json")
-        self._execute(
-            f"""
-            INSERT INTO governance.observation_event (
-                event_id, trace_id, span_id, source_service, event_type, status, severity,
-                task_id, workpackage_id, ruleset_id, payload_json, created_at
-            ) VALUES (
-                :event_id, :trace_id, :span_id, :source_service, :event_type, :status, :severity,
-                :task_id, :workpackage_id, :ruleset_id, {payload_cast}, {now_func}
-            );
-            """,
+        self._emit_event(
+            "observation_event",
             {
-                "event_id": event["event_id"],
-                "trace_id": event["trace_id"],
-                "span_id": event["span_id"],
-                "source_service": event["source_service"],
-                "event_type": event["event_type"],
-                "status": event["status"],
-                "severity": event["severity"],
-                "task_id": event["task_id"],
-                "workpackage_id": event["workpackage_id"],
-                "ruleset_id": event["ruleset_id"],
+                **{key: event[key] for key in _OBSERVATION_EVENT_COLUMNS if key != "payload_json"},
                 "payload_json": json.dumps(event["payload_json"], ensure_ascii=False),
             },
         )
         return dict(event)
 
-    def list_observation_events(
+    def _encode_cursor(self, values: list[Any]) -> str:
+        raw = json.dumps(values)
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+    def _decode_cursor(self, cursor: str, size: int) -> list[Any]:
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8"))
+        except Exception as exc:
+            raise ValueError("invalid cursor") from exc
+        if not isinstance(values, list) or len(values) != size:
+            raise ValueError("invalid cursor")
+        return values
+
+    def _encode_event_cursor(self, item: dict[str, Any]) -> str:
+        return self._encode_cursor([str(item.get("created_at") or ""), str(item.get("event_id") or "")])
+
+    def _decode_event_cursor(self, cursor: str) -> tuple[str, str]:
+        created_at, event_id = self._decode_cursor(cursor, 2)
+        try:
+            datetime.fromisoformat(str(created_at))
+        except Exception as exc:
+            raise ValueError("invalid cursor") from exc
+        return str(created_at), str(event_id)
+
+    def page_observation_events(
         self,
         *,
         trace_id: str = "",
         task_id: str = "",
         status: str = "",
         event_type: str = "",
+        created_after: str = "",
         limit: int = 100,
-    ) -> list[dict[str, Any]]:
-        safe_limit = max(1, min(int(limit), 1000))
-        rows = [dict(item) for item in self._memory.observation_events]
+        cursor: str = "",
+        ascending: bool = False,
+        max_limit: int = 1000,
+    ) -> tuple[list[dict[str, Any]], str]:
+        """One keyset page of observation events plus the cursor of the next page ("" at the end).
+
+        Filters and the (created_at, event_id) cursor seek run in SQL against the
+        (trace_id|task_id|event_type, created_at, event_id) indexes, so a page reads only its LIMIT
+        rows; those rows still come from the heap since every column is returned. Pages are ordered
+        by (created_at, event_id), newest first unless ``ascending``. ``created_after`` (ISO
+        timestamp) bounds the scan to the day partitions of that window.
+        """
+        safe_limit = max(1, min(int(limit), max_limit))
+        rows: list[dict[str, Any]] = []
         if self._db_enabled():
+            self.flush_events()
+            where: list[str] = []
+            params: dict[str, Any] = {"limit": safe_limit + 1}
+            for column, value in (("trace_id", trace_id), ("task_id", task_id), ("event_type", event_type)):
+                if value:
+                    where.append(f"{column} = :{column}")
+                    params[column] = value
+            if status:
+                where.append("LOWER(status) = LOWER(:status)")
+                params["status"] = status
+            if created_after:
+                where.append("created_at >= CAST(:created_after AS timestamptz)")
+                params["created_after"] = created_after
+            if cursor:
+                params["cursor_at"], params["cursor_id"] = self._decode_event_cursor(cursor)
+                op = ">" if ascending else "<"
+                where.append(f"(created_at, event_id) {op} (CAST(:cursor_at AS timestamptz), :cursor_id)")
+            direction = "ASC" if ascending else "DESC"
             db_rows = self._query(
-                """
+                f"""
                 SELECT event_id, trace_id, span_id, source_service, event_type, status, severity,
                        task_id, workpackage_id, ruleset_id, payload_json, created_at
                 FROM governance.observation_event
-                ORDER BY created_at DESC
+                {"WHERE " + " AND ".join(where) if where else ""}
+                ORDER BY created_at {direction}, event_id {direction}
                 LIMIT :limit
                 """,
-                {"limit": safe_limit},
+                params,
             )
-            if db_rows:
-                rows = []
-                for item in db_rows:
-                    normalized = self._serialize_record(item)
-                    normalized["payload_json"] = self._normalize_json_value(normalized.get("payload_json") or {})
-                    rows.append(normalized)
-        if trace_id:
-            rows = [item for item in rows if str(item.get("trace_id") or "") == trace_id]
-        if task_id:
-            rows = [item for item in rows if str(item.get("task_id") or "") == task_id]
-        if status:
-            rows = [item for item in rows if str(item.get("status") or "").lower() == str(status).lower()]
-        if event_type:
-            rows = [item for item in rows if str(item.get("event_type") or "") == event_type]
-        rows.sort(key=lambda item: str(item.get("created_at") or ""), reverse=True)
-        return rows[:safe_limit]
+            for item in db_rows:
+                normalized = self._serialize_record(item)
+                normalized["payload_json"] = self._normalize_json_value(normalized.get("payload_json") or {})
+                rows.append(normalized)
+        if not rows and not cursor:
+            # Copy only from the bounded in-memory mirror when the database has nothing.
+            rows = [
+                dict(item)
+                for item in self._memory.observation_events
+                if (not trace_id or str(item.get("trace_id") or "") == trace_id)
+                and (not task_id or str(item.get("task_id") or "") == task_id)
+                and (not status or str(item.get("status") or "").lower() == str(status).lower())
+                and (not event_type or str(item.get("event_type") or "") == event_type)
+                and (not created_after or str(item.get("created_at") or "") >= created_after)
+            ]
+            rows.sort(key=lambda item: (str(item.get("created_at") or ""), str(item.get("event_id") or "")), reverse=not ascending)
+        next_cursor = self._encode_event_cursor(rows[safe_limit - 1]) if len(rows) > safe_limit else ""
+        return rows[:safe_limit], next_cursor
 
-    def get_trace_replay(self, trace_id: str, limit: int = 500) -> list[dict[str, Any]]:
-        items = self.list_observation_events(trace_id=trace_id, limit=limit)
-        items.sort(key=lambda item: str(item.get("created_at") or ""))
+    def list_observation_events(
+        self,
+        *,
+        trace_id: str = "",
+        task_id: str = "",
+        status: str = "",
+        event_type: str = "",
+        created_after: str = "",
+        limit: int = 100,
+    ) -> list[dict[str, Any]]:
+        items, _ = self.page_observation_events(
+            trace_id=trace_id,
+            task_id=task_id,
+            status=status,
+            event_type=event_type,
+            created_after=created_after,
+            limit=limit,
+        )
         return items
 
+    def get_trace_replay(self, trace_id: str, limit: int = 500, cursor: str = "") -> list[dict[str, Any]]:
+        items, _ = self.page_trace_replay(trace_id, limit=limit, cursor=cursor)
+        return items
+
+    def page_trace_replay(self, trace_id: str, *, limit: int = 500, cursor: str = "") -> tuple[list[dict[str, Any]], str]:
+        # Replay reads the trace from its first event forward, however old the trace is.
+        return self.page_observation_events(trace_id=trace_id, limit=limit, cursor=cursor, ascending=True, max_limit=2000)
+
     def upsert_observation_metric(
         self,
         *,
@@ -1394,20 +1958,10 @@ class GovernanceRepository:
         if not item["metric_name"]:
             raise ValueError("metric_name is required")
         self._memory.observation_metrics.append(item)
-        now_func = self._sql_now()
-        labels_cast = self._sql_json_cast(":labels_json")
-        self._execute(
-            f"""
-            INSERT INTO governance.observation_metric (
-                metric_id, metric_name, metric_value, labels_json, window_start, window_end, created_at
-            ) VALUES (
-                :metric_id, :metric_name, :metric_value, {labels_cast}, :window_start, :window_end, {now_func}
-            );
-            """,
+        self._emit_event(
+            "observation_metric",
             {
-                "metric_id": item["metric_id"],
-                "metric_name": item["metric_name"],
-                "metric_value": item["metric_value"],
+                **{key: item[key] for key in _OBSERVATION_METRIC_COLUMNS if key != "labels_json"},
                 "labels_json": json.dumps(item["labels_json"], ensure_ascii=False),
                 "window_start": item["window_start"] or None,
                 "window_end": item["window_end"] or None,
@@ -1419,6 +1973,7 @@ class GovernanceRepository:
         safe_limit = max(1, min(int(limit), 1000))
         rows = [dict(item) for item in self._memory.observation_metrics if str(item.get("metric_name") or "") == metric_name]
         if self._db_enabled():
+            self.flush_events()
             db_rows = self._query(
                 """
                 SELECT metric_id, metric_name, metric_value, labels_json, window_start, window_end, created_at
@@ -1551,7 +2106,7 @@ class GovernanceRepository:
         failed = sum(1 for item in tasks if str(item.get("status") or "").upper() == "FAILED")
         success_rate = float(succeeded) / float(total_tasks) if total_tasks else 0.0
         open_alerts = self.list_observation_alerts(status="open", limit=500)
-        latest_metrics = self._memory.observation_metrics[-20:]
+        latest_metrics = self._memory.observation_metrics.tail(20)
         return {
             "environment": str(env or "dev"),
             "kpis": {
@@ -1562,17 +2117,32 @@ class GovernanceRepository:
             },
             "metrics": [dict(item) for item in latest_metrics],
             "alerts": open_alerts,
+            "memory": self.memory_usage(),
         }
 
-    def get_ops_summary(
+    def memory_usage(self) -> dict[str, dict[str, Any]]:
+        """Entries, caps, evictions and approximate bytes of the bounded in-memory mirror."""
+        return self._memory.usage()
+
+    def _active_ruleset(self) -> dict[str, Any] | None:
+        if self._db_enabled():
+            active = self._ops_metrics.active_ruleset()
+            if active:
+                return active
+        for ruleset in self._memory.rulesets.values():
+            if ruleset.get("is_active"):
+                return ruleset
+        return self._memory.rulesets.get("default")
+
+    def _memory_ops_aggregates(
         self,
-        task_id: str | None = None,
-        batch_name: str | None = None,
-        ruleset_id: str | None = None,
-        status_list: list[str] | None = None,
-        recent_hours: int | None = None,
-        t_low_override: float | None = None,
-        t_high_override: float | None = None,
+        *,
+        task_id: str | None,
+        batch_name: str | None,
+        ruleset_id: str | None,
+        status_list: list[str] | None,
+        recent_hours: int | None,
+        t_low: float,
     ) -> dict[str, Any]:
         tasks = list(self._memory.tasks.values())
         if task_id:
@@ -1603,7 +2173,6 @@ class GovernanceRepository:
 
             tasks = [item for item in tasks if _to_ts(item.get("created_at")) >= cutoff]
 
-        total_tasks = len(tasks)
         status_counts: dict[str, int] = {}
         for task in tasks:
             status = str(task.get("status", "UNKNOWN"))
@@ -1612,30 +2181,61 @@ class GovernanceRepository:
         selected_task_ids = {str(task.get("task_id")) for task in tasks}
         all_results: list[dict[str, Any]] = []
         for result_task_id, values in self._memory.results.items():
-            if selected_task_ids and result_task_id not in selected_task_ids:
-                continue
-            all_results.extend(values)
-        total_results = len(all_results)
-        avg_confidence = (
-            sum(float(item.get("confidence", 0.0)) for item in all_results) / float(total_results)
-            if total_results
-            else 0.0
-        )
-
-        active_ruleset = None
-        for ruleset in self._memory.rulesets.values():
-            if ruleset.get("is_active"):
-                active_ruleset = ruleset
-                break
-        if not active_ruleset:
-            active_ruleset = self._memory.rulesets.get("default")
+            if result_task_id in selected_task_ids:
+                all_results.extend(values)
+        confidences = [float(item.get("confidence", 0.0)) for item in all_results]
+        return {
+            "status_counts": status_counts,
+            "total_results": len(confidences),
+            "avg_confidence": sum(confidences) / float(len(confidences)) if confidences else 0.0,
+            "low_confidence_results": sum(1 for value in confidences if value < t_low),
+        }
 
+    def get_ops_summary(
+        self,
+        task_id: str | None = None,
+        batch_name: str | None = None,
+        ruleset_id: str | None = None,
+        status_list: list[str] | None = None,
+        recent_hours: int | None = None,
+        t_low_override: float | None = None,
+        t_high_override: float | None = None,
+    ) -> dict[str, Any]:
+        active_ruleset = self._active_ruleset()
         thresholds = (active_ruleset or {}).get("config_json", {}).get("thresholds", {})
         default_t_low = float(thresholds.get("t_low", 0.6))
         default_t_high = float(thresholds.get("t_high", 0.85))
         t_low = float(t_low_override) if t_low_override is not None else default_t_low
         t_high = float(t_high_override) if t_high_override is not None else default_t_high
-        low_confidence_results = sum(1 for item in all_results if float(item.get("confidence", 0.0)) < t_low)
+
+        if self._db_enabled():
+            created_after = ""
+            if recent_hours is not None:
+                # Floored to the minute so repeated windowed calls share one TTL-cache entry.
+                window_start = datetime.now(timezone.utc) - timedelta(hours=float(recent_hours))
+                created_after = window_start.replace(second=0, microsecond=0).isoformat()
+            aggregates = self._ops_metrics.summary(
+                task_id=str(task_id or ""),
+                batch_name=str(batch_name or ""),
+                ruleset_id=str(ruleset_id or ""),
+                statuses=tuple(sorted({status.upper() for status in status_list or [] if status})),
+                created_after=created_after,
+                t_low=t_low,
+            )
+        else:
+            aggregates = self._memory_ops_aggregates(
+                task_id=task_id,
+                batch_name=batch_name,
+                ruleset_id=ruleset_id,
+                status_list=status_list,
+                recent_hours=recent_hours,
+                t_low=t_low,
+            )
+        status_counts = dict(aggregates["status_counts"])
+        total_tasks = sum(status_counts.values())
+        total_results = int(aggregates["total_results"])
+        avg_confidence = float(aggregates["avg_confidence"])
+        low_confidence_results = int(aggregates["low_confidence_results"])
 
         pending_review_tasks = status_counts.get("SUCCEEDED", 0)
         reviewed_tasks = status_counts.get("REVIEWED", 0)
@@ -1686,6 +2286,7 @@ class GovernanceRepository:
                 "config_json": str(item["config_json"]).replace("'", '"'),
             },
         )
+        self._ops_metrics.invalidate()
         return item
 
     def create_change_request(self, payload: dict[str, Any]) -> dict[str, Any]:
@@ -1899,10 +2500,12 @@ class GovernanceRepository:
             },
             related_change_id=change_id,
         )
+        self._ops_metrics.invalidate()
         return target
 
     def list_audit_events(self, related_change_id: str | None = None) -> list[dict[str, Any]]:
         if self._db_enabled():
+            self.flush_events()
             sql = """
                 SELECT event_id, event_type, caller, payload, related_change_id, created_at
                 FROM audit.event_log
@@ -1919,7 +2522,7 @@ class GovernanceRepository:
                 item["payload"] = self._normalize_json_value(item.get("payload") or {})
                 normalized.append(item)
             # Keep memory cache warm for in-process reads.
-            self._memory.audit_events = list(normalized)
+            self._memory.audit_events.replace(normalized)
             return normalized
         if not related_change_id:
             return list(self._memory.audit_events)
@@ -1972,62 +2575,77 @@ class GovernanceRepository:
             f"UPDATE governance.ruleset SET is_active = TRUE, updated_at = {now_func} WHERE ruleset_id = :ruleset_id;",
             {"ruleset_id": ruleset_id},
         )
+        self._ops_metrics.invalidate()
         return target
 
     def _task_thresholds(self, task_id: str, t_low_override: float | None, t_high_override: float | None) -> tuple[float, float]:
-        task = self._memory.tasks.get(task_id, {})
-        ruleset = self._memory.rulesets.get(task.get("ruleset_id", "default"), self._memory.rulesets.get("default", {}))
+        ruleset = self._ops_metrics.task_ruleset(task_id) if self._db_enabled() else None
+        if not ruleset:
+            task = self._memory.tasks.get(task_id, {})
+            ruleset = self._memory.rulesets.get(task.get("ruleset_id", "default"), self._memory.rulesets.get("default", {}))
         thresholds = (ruleset or {}).get("config_json", {}).get("thresholds", {})
         t_low = float(t_low_override) if t_low_override is not None else float(thresholds.get("t_low", 0.6))
         t_high = float(t_high_override) if t_high_override is not None else float(thresholds.get("t_high", 0.85))
         return t_low, t_high
 
-    def _task_metrics(self, task_id: str, t_low: float, t_high: float) -> dict[str, float]:
+    def _memory_task_buckets(self, task_id: str, t_low: float, t_high: float) -> dict[str, Any]:
         results = list(self._memory.results.get(task_id, []))
-        total = len(results)
-        if total <= 0:
-            return {
-                "auto_pass_rate": 0.0,
-                "review_rate": 0.0,
-                "human_required_rate": 0.0,
-                "consistency_score": 1.0,
-                "quality_gate_pass_rate": 1.0,
-                "review_accept_rate": 0.0,
-            }
-
-        auto_pass = 0
-        review_bucket = 0
-        human_required = 0
-        gate_pass = 0
+        confidences: list[float] = []
         groups: dict[str, set[str]] = {}
         for item in results:
-            confidence = float(item.get("confidence", 0.0))
-            if confidence >= t_high:
-                auto_pass += 1
-            elif confidence >= t_low:
-                review_bucket += 1
-            else:
-                human_required += 1
-            if confidence >= t_low:
-                gate_pass += 1
+            confidences.append(float(item.get("confidence", 0.0)))
             raw_key = str(item.get("raw_id") or "")
             canon = str(item.get("canon_text") or "")
             groups.setdefault(raw_key, set()).add(canon)
 
+        auto_pass, review_bucket, human_required = bucket_counts(confidences, t_low, t_high)
         conflict_groups = 0
         duplicated_groups = 0
         for _, outputs in groups.items():
             if len(outputs) > 1:
                 duplicated_groups += 1
                 conflict_groups += 1
+        review_item = self._memory.reviews.get(task_id) or {}
+        return {
+            "total": len(results),
+            "auto_pass": auto_pass,
+            "review_bucket": review_bucket,
+            "human_required": human_required,
+            "conflict_groups": conflict_groups,
+            "duplicated_groups": duplicated_groups,
+            "review_status": str(review_item.get("review_status") or ""),
+        }
+
+    def _task_metrics(self, task_id: str, t_low: float, t_high: float) -> dict[str, float]:
+        if self._db_enabled():
+            buckets = self._ops_metrics.task_buckets(task_id, t_low=t_low, t_high=t_high)
+        else:
+            buckets = self._memory_task_buckets(task_id, t_low, t_high)
+        total = int(buckets["total"])
+        if total <= 0:
+            return {
+                "auto_pass_rate": 0.0,
+                "review_rate": 0.0,
+                "human_required_rate": 0.0,
+                "consistency_score": 1.0,
+                "quality_gate_pass_rate": 1.0,
+                "review_accept_rate": 0.0,
+            }
+
+        auto_pass = int(buckets["auto_pass"])
+        review_bucket = int(buckets["review_bucket"])
+        human_required = int(buckets["human_required"])
+        gate_pass = auto_pass + review_bucket
+
+        conflict_groups = int(buckets["conflict_groups"])
+        duplicated_groups = int(buckets["duplicated_groups"])
         consistency_score = 1.0
         if duplicated_groups > 0:
             consistency_score = max(0.0, 1.0 - (float(conflict_groups) / float(duplicated_groups)))
 
-        review_item = self._memory.reviews.get(task_id)
         review_accept_rate = 0.0
-        if review_item:
-            review_status = str(review_item.get("review_status") or "").lower()
+        review_status = str(buckets["review_status"] or "").lower()
+        if review_status:
             review_accept_rate = 1.0 if review_status in {"approved", "edited"} else 0.0
 
         return {
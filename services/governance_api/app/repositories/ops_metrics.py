@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import os
+from typing import Any, Callable
+
+from services.governance_api.app.repositories.bounded_cache import LRUCache
+
+_TASK_RESULTS_SQL = """
+    FROM governance.task_run tr
+    JOIN governance.raw_record raw ON raw.batch_id = tr.batch_id
+    JOIN governance.canonical_record canon ON canon.raw_id = raw.raw_id
+"""
+
+
+class OpsMetricsQuery:
+    """SQL aggregates behind ``/ops/summary`` and ``/ops/scorecard``.
+
+    Every replica reads the same database rows instead of its own in-process mirror. Results are
+    cached per filter tuple for ``GOVERNANCE_OPS_CACHE_TTL_SEC`` seconds (0 disables the cache);
+    the repository calls ``invalidate`` after its own task, result, review and ruleset writes.
+    """
+
+    def __init__(self, repository: Any, *, ttl_sec: float | None = None, max_entries: int = 256) -> None:
+        self._repo = repository
+        ttl = float(str(os.getenv("GOVERNANCE_OPS_CACHE_TTL_SEC") or "5")) if ttl_sec is None else float(ttl_sec)
+        self._cache = LRUCache(max_entries, max_age_sec=ttl) if ttl > 0 else None
+
+    def invalidate(self) -> None:
+        if self._cache is not None:
+            self._cache.clear()
+
+    def _cached(self, key: tuple[Any, ...], compute: Callable[[], Any]) -> Any:
+        if self._cache is None:
+            return compute()
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = compute()
+            self._cache[key] = value
+            return value
+
+    def active_ruleset(self) -> dict[str, Any] | None:
+        def _load() -> dict[str, Any] | None:
+            rows = self._repo._query(
+                """
+                SELECT ruleset_id, version, is_active, config_json
+                FROM governance.ruleset
+                WHERE is_active = TRUE OR ruleset_id = 'default'
+                ORDER BY is_active DESC, updated_at DESC
+                LIMIT 1;
+                """,
+                {},
+            )
+            if not rows:
+                return None
+            row = self._repo._serialize_record(rows[0])
+            row["config_json"] = self._repo._normalize_json_value(row.get("config_json"))
+            return row
+
+        return self._cached(("active_ruleset",), _load)
+
+    def task_ruleset(self, task_id: str) -> dict[str, Any] | None:
+        """Ruleset the task's canonical records were produced with, falling back to ``default``."""
+
+        def _load() -> dict[str, Any] | None:
+            rows = self._repo._query(
+                f"""
+                SELECT rs.ruleset_id, rs.config_json
+                FROM governance.ruleset rs
+                WHERE rs.ruleset_id = COALESCE(
+                    (SELECT canon.ruleset_version {_TASK_RESULTS_SQL} WHERE tr.task_id = :task_id LIMIT 1),
+                    'default'
+                ) OR rs.ruleset_id = 'default'
+                ORDER BY (rs.ruleset_id = 'default') ASC
+                LIMIT 1;
+                """,
+                {"task_id": task_id},
+            )
+            if not rows:
+                return None
+            return {"ruleset_id": rows[0]["ruleset_id"], "config_json": self._repo._normalize_json_value(rows[0]["config_json"])}
+
+        return self._cached(("task_ruleset", task_id), _load)
+
+    def summary(
+        self,
+        *,
+        task_id: str = "",
+        batch_name: str = "",
+        ruleset_id: str = "",
+        statuses: tuple[str, ...] = (),
+        created_after: str = "",
+        t_low: float,
+    ) -> dict[str, Any]:
+        """Status counts plus result totals, average and below-``t_low`` count for the filtered tasks."""
+        key = ("summary", task_id, batch_name, ruleset_id, statuses, created_after, t_low)
+        return self._cached(
+            key,
+            lambda: self._summary(
+                task_id=task_id,
+                batch_name=batch_name,
+                ruleset_id=ruleset_id,
+                statuses=statuses,
+                created_after=created_after,
+                t_low=t_low,
+            ),
+        )
+
+    def _summary(
+        self,
+        *,
+        task_id: str,
+        batch_name: str,
+        ruleset_id: str,
+        statuses: tuple[str, ...],
+        created_after: str,
+        t_low: float,
+    ) -> dict[str, Any]:
+        where: list[str] = []
+        params: dict[str, Any] = {"t_low": float(t_low)}
+        if task_id:
+            where.append("tr.task_id = :task_id")
+            params["task_id"] = task_id
+        if batch_name:
+            where.append("b.batch_name = :batch_name")
+            params["batch_name"] = batch_name
+        if ruleset_id:
+            where.append(
+                """EXISTS (
+                    SELECT 1
+                    FROM governance.raw_record r
+                    JOIN governance.canonical_record c ON c.raw_id = r.raw_id
+                    WHERE r.batch_id = tr.batch_id AND c.ruleset_version = :ruleset_id
+                )"""
+            )
+            params["ruleset_id"] = ruleset_id
+        if statuses:
+            where.append("UPPER(tr.status) = ANY(CAST(:statuses AS text[]))")
+            params["statuses"] = list(statuses)
+        if created_after:
+            where.append("tr.created_at >= CAST(:created_after AS timestamptz)")
+            params["created_after"] = created_after
+        selected = f"""
+            WITH selected AS (
+                SELECT tr.task_id, tr.batch_id, COALESCE(tr.status, 'UNKNOWN') AS status
+                FROM governance.task_run tr
+                LEFT JOIN governance.batch b ON b.batch_id = tr.batch_id
+                {"WHERE " + " AND ".join(where) if where else ""}
+            )
+        """
+        with self._repo.session():
+            status_rows = self._repo._query(
+                selected + "SELECT status, COUNT(*) AS task_count FROM selected GROUP BY status;",
+                params,
+            )
+            result_rows = self._repo._query(
+                selected
+                + """
+                SELECT
+                    COUNT(*) AS total_results,
+                    COALESCE(AVG(COALESCE(canon.confidence, 0)), 0) AS avg_confidence,
+                    COUNT(*) FILTER (WHERE COALESCE(canon.confidence, 0) < :t_low) AS low_confidence_results
+                FROM selected s
+                JOIN governance.raw_record raw ON raw.batch_id = s.batch_id
+                JOIN governance.canonical_record canon ON canon.raw_id = raw.raw_id;
+                """,
+                params,
+            )
+        results = result_rows[0] if result_rows else {}
+        return {
+            "status_counts": {str(row["status"]): int(row["task_count"]) for row in status_rows},
+            "total_results": int(results.get("total_results") or 0),
+            "avg_confidence": float(results.get("avg_confidence") or 0.0),
+            "low_confidence_results": int(results.get("low_confidence_results") or 0),
+        }
+
+    def task_buckets(self, task_id: str, *, t_low: float, t_high: float) -> dict[str, Any]:
+        """Threshold bucket counts, conflicting raw_id groups and the latest review of one task."""
+
+        def _load() -> dict[str, Any]:
+            rows = self._repo._query(
+                f"""
+                WITH results AS (
+                    SELECT raw.raw_id, canon.canon_text, COALESCE(canon.confidence, 0) AS confidence
+                    {_TASK_RESULTS_SQL}
+                    WHERE tr.task_id = :task_id
+                ),
+                groups AS (
+                    SELECT raw_id, COUNT(DISTINCT canon_text) AS outputs
+                    FROM results
+                    GROUP BY raw_id
+                )
+                SELECT
+                    (SELECT COUNT(*) FROM results) AS total,
+                    (SELECT COUNT(*) FILTER (WHERE confidence >= :t_high) FROM results) AS auto_pass,
+                    (SELECT COUNT(*) FILTER (WHERE confidence < :t_high AND confidence >= :t_low) FROM results) AS review_bucket,
+                    (SELECT COUNT(*) FILTER (WHERE confidence < :t_low) FROM results) AS human_required,
+                    (SELECT COUNT(*) FILTER (WHERE outputs > 1) FROM groups) AS conflict_groups,
+                    (
+                        SELECT rv.review_status
+                        FROM governance.review rv
+                        WHERE rv.review_id = 'review_' || :task_id OR rv.raw_id IN (SELECT raw_id FROM results)
+                        ORDER BY COALESCE(rv.reviewed_at, rv.updated_at, rv.created_at) DESC
+                        LIMIT 1
+                    ) AS review_status;
+                """,
+                {"task_id": task_id, "t_low": float(t_low), "t_high": float(t_high)},
+            )
+            row = rows[0] if rows else {}
+            return {
+                "total": int(row.get("total") or 0),
+                "auto_pass": int(row.get("auto_pass") or 0),
+                "review_bucket": int(row.get("review_bucket") or 0),
+                "human_required": int(row.get("human_required") or 0),
+                "conflict_groups": int(row.get("conflict_groups") or 0),
+                "duplicated_groups": int(row.get("conflict_groups") or 0),
+                "review_status": str(row.get("review_status") or ""),
+            }
+
+        return self._cached(("task_buckets", task_id, t_low, t_high), _load)
@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import re
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import text
+
+# Documented archive tiers: hot rows stay in the live tables, warm rows live in the oldest
+# partitions until retention expires them, cold rows only survive in exported archives.
+RETENTION_TIERS = {"hot": 14, "warm": 90, "cold": 365}
+
+ARCHIVE_FORMATS = ("jsonl", "parquet")
+EXPIRE_MODES = ("drop", "detach")
+
+_BOUND_PATTERN = re.compile(r"FROM \((.+?)\) TO \((.+?)\)")
+_ARCHIVE_BATCH_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class PartitionPolicy:
+    """Range-partitioning policy for one ``created_at``-partitioned table."""
+
+    table: str
+    granularity: str
+    retention_days: int
+    premake: int
+    # Expired partitions are only ever dropped after they were archived.
+    archive_required: bool = False
+
+    @property
+    def step(self) -> timedelta:
+        return timedelta(days=7 if self.granularity == "week" else 1)
+
+    def period_start(self, moment: datetime) -> datetime:
+        start = moment.astimezone(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        if self.granularity == "week":
+            start -= timedelta(days=start.weekday())
+        return start
+
+    def partition_name(self, lower: datetime) -> str:
+        return f"{self.table}_p{lower.strftime('%Y%m%d')}"
+
+
+def _env_int(name: str, default: int) -> int:
+    return max(0, int(str(os.getenv(name) or default)))
+
+
+def partition_policies() -> tuple[PartitionPolicy, ...]:
+    observation_days = _env_int("GOVERNANCE_OBSERVATION_RETENTION_DAYS", RETENTION_TIERS["warm"])
+    return (
+        PartitionPolicy(
+            "governance.observation_event",
+            "day",
+            observation_days,
+            _env_int("GOVERNANCE_PARTITION_PREMAKE_DAYS", 7),
+        ),
+        PartitionPolicy(
+            "governance.observation_metric",
+            "day",
+            observation_days,
+            _env_int("GOVERNANCE_PARTITION_PREMAKE_DAYS", 7),
+        ),
+        PartitionPolicy(
+            "audit.event_log",
+            "week",
+            _env_int("GOVERNANCE_AUDIT_RETENTION_DAYS", RETENTION_TIERS["cold"]),
+            _env_int("GOVERNANCE_PARTITION_PREMAKE_WEEKS", 4),
+            archive_required=True,
+        ),
+    )
+
+
+def _parse_bound(value: str) -> datetime | None:
+    value = value.strip()
+    if value in {"MINVALUE", "MAXVALUE"}:
+        return None
+    return datetime.fromisoformat(value.strip("'"))
+
+
+class PartitionMaintainer:
+    """Creates upcoming range partitions and expires (archives, detaches, drops) old ones.
+
+    Works through the repository's unit of work so each table or expired partition is handled in
+    one transaction.
+    """
+
+    def __init__(self, repository: Any, policies: tuple[PartitionPolicy, ...] | None = None) -> None:
+        self._repo = repository
+        self._policies = policies if policies is not None else partition_policies()
+
+    def list_partitions(self, table: str) -> list[dict[str, Any]]:
+        """Partitions of ``table`` with their [lower, upper) bounds; None marks MINVALUE/MAXVALUE."""
+        rows = self._repo._query(
+            """
+            SELECT n.nspname AS schema_name, c.relname AS partition_name,
+                   pg_get_expr(c.relpartbound, c.oid) AS bound
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            WHERE i.inhparent = CAST(:table AS regclass)
+            ORDER BY c.relname
+            """,
+            {"table": table},
+        )
+        partitions: list[dict[str, Any]] = []
+        for row in rows:
+            bound = str(row["bound"] or "")
+            match = _BOUND_PATTERN.search(bound)
+            partitions.append(
+                {
+                    "partition": f"{row['schema_name']}.{row['partition_name']}",
+                    "is_default": bound == "DEFAULT",
+                    "lower": _parse_bound(match.group(1)) if match else None,
+                    "upper": _parse_bound(match.group(2)) if match else None,
+                }
+            )
+        return partitions
+
+    def ensure_partitions(self, policy: PartitionPolicy, *, now: datetime | None = None) -> dict[str, Any]:
+        """Create partitions from the current period ``premake`` periods ahead.
+
+        Rows that already landed in the DEFAULT partition get a partition of their own as well and
+        are moved into it before it is attached.
+        """
+        now = now or datetime.now(timezone.utc)
+        created: list[str] = []
+        moved_rows = 0
+        with self._repo.session():
+            partitions = self.list_partitions(policy.table)
+            default = next((item["partition"] for item in partitions if item["is_default"]), "")
+            ranges = [item for item in partitions if not item["is_default"]]
+            start = policy.period_start(now)
+            end = start + policy.step * (policy.premake + 1)
+            if default:
+                span = self._repo._query(
+                    f"SELECT MIN(created_at) AS oldest, MAX(created_at) AS newest FROM {default}", {}
+                )[0]
+                if span["oldest"] is not None:
+                    start = min(start, policy.period_start(span["oldest"]))
+                    end = max(end, policy.period_start(span["newest"]) + policy.step)
+            lower = start
+            while lower < end:
+                upper = lower + policy.step
+                if not any(self._overlaps(item, lower, upper) for item in ranges):
+                    moved_rows += self._create_partition(policy, default, lower, upper)
+                    created.append(policy.partition_name(lower))
+                lower = upper
+        return {"table": policy.table, "created": created, "moved_rows": moved_rows}
+
+    @staticmethod
+    def _overlaps(partition: dict[str, Any], lower: datetime, upper: datetime) -> bool:
+        return (partition["lower"] is None or partition["lower"] < upper) and (
+            partition["upper"] is None or partition["upper"] > lower
+        )
+
+    def _create_partition(self, policy: PartitionPolicy, default: str, lower: datetime, upper: datetime) -> int:
+        name = policy.partition_name(lower)
+        params = {"lower": lower.isoformat(), "upper": upper.isoformat()}
+        self._repo._execute(f"CREATE TABLE {name} (LIKE {policy.table} INCLUDING DEFAULTS)", {})
+        moved = 0
+        if default:
+            # ATTACH refuses ranges the DEFAULT partition still holds rows for.
+            moved = self._repo._query(
+                f"""
+                WITH moved AS (
+                    DELETE FROM {default}
+                    WHERE created_at >= CAST(:lower AS timestamptz) AND created_at < CAST(:upper AS timestamptz)
+                    RETURNING *
+                ), copied AS (
+                    INSERT INTO {name} SELECT * FROM moved RETURNING 1
+                )
+                SELECT COUNT(*) AS moved FROM copied
+                """,
+                params,
+            )[0]["moved"]
+        self._repo._execute(
+            f"""
+            ALTER TABLE {policy.table} ATTACH PARTITION {name}
+            FOR VALUES FROM ('{params["lower"]}') TO ('{params["upper"]}')
+            """,
+            {},
+        )
+        return int(moved)
+
+    def expire_partitions(
+        self,
+        policy: PartitionPolicy,
+        *,
+        now: datetime | None = None,
+        mode: str = "detach",
+        archive_dir: str = "",
+        archive_format: str = "jsonl",
+    ) -> list[dict[str, Any]]:
+        """Detach (and in ``drop`` mode drop) partitions whose whole range is past retention.
+
+        With ``archive_dir`` set, each partition is exported first as gzip JSONL or Parquet.
+        Policies with ``archive_required`` are only detached in ``drop`` mode without an archive.
+        """
+        if mode not in EXPIRE_MODES:
+            raise ValueError(f"mode must be one of {EXPIRE_MODES}")
+        if archive_format not in ARCHIVE_FORMATS:
+            raise ValueError(f"archive_format must be one of {ARCHIVE_FORMATS}")
+        if policy.retention_days <= 0:
+            return []
+        cutoff = (now or datetime.now(timezone.utc)) - timedelta(days=policy.retention_days)
+        action = "detach" if policy.archive_required and not archive_dir else mode
+        expired: list[dict[str, Any]] = []
+        for item in self.list_partitions(policy.table):
+            if item["is_default"] or item["upper"] is None or item["upper"] > cutoff:
+                continue
+            partition = item["partition"]
+            with self._repo.session():
+                archive: dict[str, Any] = {}
+                if archive_dir:
+                    archive = self._archive_partition(partition, Path(archive_dir), archive_format)
+                self._repo._execute(f"ALTER TABLE {policy.table} DETACH PARTITION {partition}", {})
+                if action == "drop":
+                    self._repo._execute(f"DROP TABLE {partition}", {})
+            expired.append({"partition": partition, "upper": item["upper"].isoformat(), "action": action, **archive})
+        return expired
+
+    def _archive_partition(self, partition: str, archive_dir: Path, archive_format: str) -> dict[str, Any]:
+        archive_dir.mkdir(parents=True, exist_ok=True)
+        suffix = "jsonl.gz" if archive_format == "jsonl" else "parquet"
+        path = archive_dir / f"{partition}.{suffix}"
+        rows = 0
+        with self._repo._connection() as conn:
+            # Stream per statement: the connection is shared with the rest of the unit of work.
+            result = conn.execute(
+                text(f"SELECT * FROM {partition} ORDER BY created_at").execution_options(stream_results=True)
+            )
+            batches = (
+                [
+                    {key: value if isinstance(value, (dict, list, int, float)) or value is None else str(value) for key, value in row.items()}
+                    for row in chunk
+                ]
+                for chunk in result.mappings().partitions(_ARCHIVE_BATCH_SIZE)
+            )
+            if archive_format == "jsonl":
+                with gzip.open(path, "wt", encoding="utf-8") as handle:
+                    for batch in batches:
+                        for row in batch:
+                            handle.write(json.dumps(row, ensure_ascii=False) + "\n")
+                        rows += len(batch)
+            else:
+                rows = self._write_parquet(path, batches)
+        return {"archive_path": str(path), "archived_rows": rows}
+
+    @staticmethod
+    def _write_parquet(path: Path, batches: Any) -> int:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise RuntimeError("parquet archives require pyarrow") from exc
+        writer = None
+        rows = 0
+        try:
+            for batch in batches:
+                # JSON columns are stored as text so every batch shares one schema.
+                table = pa.Table.from_pylist(
+                    [{key: json.dumps(value, ensure_ascii=False) if isinstance(value, (dict, list)) else value for key, value in row.items()} for row in batch]
+                )
+                if writer is None:
+                    writer = pq.ParquetWriter(str(path), table.schema, compression="zstd")
+                writer.write_table(table)
+                rows += len(batch)
+        finally:
+            if writer is not None:
+                writer.close()
+        return rows
+
+    def run(
+        self,
+        *,
+        now: datetime | None = None,
+        mode: str = "detach",
+        archive_dir: str = "",
+        archive_format: str = "jsonl",
+    ) -> list[dict[str, Any]]:
+        report = []
+        for policy in self._policies:
+            item = self.ensure_partitions(policy, now=now)
+            item["expired"] = self.expire_partitions(
+                policy, now=now, mode=mode, archive_dir=archive_dir, archive_format=archive_format
+            )
+            report.append(item)
+        return report
@@ -911,19 +911,20 @@ def _apply_case_filters(
 
 @router.get("/lab/trusted/fengtu/status", response_model=FengtuNetworkStatusResponse)
 def get_fengtu_status() -> FengtuNetworkStatusResponse:
-    client = FengtuTrustedClient()
+    client = FengtuTrustedClient.shared()
     state = FengtuTrustedClient.network_confirmation_state()
     return FengtuNetworkStatusResponse(
         enabled=client.enabled(),
         confirmation_required=bool(state.get("confirmation_required", False)),
         last_network_error=str(state.get("last_network_error") or ""),
         last_confirm_by=str(state.get("last_confirm_by") or ""),
+        breakers=list(state.get("breakers") or []),
     )
 
 
 @router.post("/lab/trusted/fengtu/confirm-network", response_model=FengtuNetworkStatusResponse)
 def confirm_fengtu_network(payload: FengtuConfirmNetworkPayload) -> FengtuNetworkStatusResponse:
-    client = FengtuTrustedClient()
+    client = FengtuTrustedClient.shared()
     state = FengtuTrustedClient.confirm_network_resume(payload.operator)
     GOVERNANCE_SERVICE.log_audit_event(
         "approval_changed",
@@ -939,6 +940,7 @@ def confirm_fengtu_network(payload: FengtuConfirmNetworkPayload) -> FengtuNetwor
         confirmation_required=bool(state.get("confirmation_required", False)),
         last_network_error=str(state.get("last_network_error") or ""),
         last_confirm_by=str(state.get("last_confirm_by") or ""),
+        breakers=list(state.get("breakers") or []),
     )
 
 
@@ -21,16 +21,20 @@ def _now_iso() -> str:
 
 
 @router.get("/manual-review/queue", response_model=ManualReviewQueueResponse)
-def manual_review_queue(pending_only: bool = True, limit: int = 200) -> ManualReviewQueueResponse:
+def manual_review_queue(pending_only: bool = True, limit: int = 200, cursor: str = "") -> ManualReviewQueueResponse:
     if limit < 1 or limit > 1000:
         raise HTTPException(status_code=400, detail="limit must be in [1, 1000]")
-    items = GOVERNANCE_SERVICE.list_manual_review_items(pending_only=pending_only, limit=limit)
+    try:
+        items, next_cursor = GOVERNANCE_SERVICE.page_manual_review_items(pending_only=pending_only, limit=limit, cursor=cursor)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
     pending = sum(1 for item in items if not str(item.get("review_status") or ""))
     return ManualReviewQueueResponse(
         as_of=_now_iso(),
         total=len(items),
         pending=pending,
         items=items,
+        next_cursor=next_cursor,
     )
 
 
@@ -188,23 +188,40 @@ def list_observability_events(
     status: str = Query(default=""),
     event_type: str = Query(default=""),
     limit: int = Query(default=100, ge=1, le=1000),
+    cursor: str = Query(default=""),
 ) -> ObservationEventsResponse:
-    items = GOVERNANCE_SERVICE.list_observation_events(
-        trace_id=trace_id,
-        task_id=task_id,
-        status=status,
-        event_type=event_type,
-        limit=limit,
-    )
-    return ObservationEventsResponse(total=len(items), items=items)
+    try:
+        items, next_cursor = GOVERNANCE_SERVICE.page_observation_events(
+            trace_id=trace_id,
+            task_id=task_id,
+            status=status,
+            event_type=event_type,
+            limit=limit,
+            cursor=cursor,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail={"code": "INVALID_ARGUMENT", "message": str(exc)}) from exc
+    return ObservationEventsResponse(total=len(items), items=items, next_cursor=next_cursor)
 
 
 @router.get("/observability/traces/{trace_id}/replay", response_model=ObservationTraceReplayResponse)
-def get_trace_replay(trace_id: str, limit: int = Query(default=500, ge=1, le=2000)) -> ObservationTraceReplayResponse:
-    timeline = GOVERNANCE_SERVICE.get_trace_replay(trace_id=trace_id, limit=limit)
-    if not timeline:
+def get_trace_replay(
+    trace_id: str,
+    limit: int = Query(default=500, ge=1, le=2000),
+    cursor: str = Query(default=""),
+) -> ObservationTraceReplayResponse:
+    try:
+        timeline, next_cursor = GOVERNANCE_SERVICE.page_trace_replay(trace_id, limit=limit, cursor=cursor)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail={"code": "INVALID_ARGUMENT", "message": str(exc)}) from exc
+    if not timeline and not cursor:
         raise HTTPException(status_code=404, detail="trace not found")
-    return ObservationTraceReplayResponse(trace_id=trace_id, total=len(timeline), timeline=timeline)
+    return ObservationTraceReplayResponse(
+        trace_id=trace_id,
+        total=len(timeline),
+        timeline=timeline,
+        next_cursor=next_cursor,
+    )
 
 
 @router.get("/observability/timeseries", response_model=ObservationTimeseriesResponse)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from time import perf_counter
 from typing import Any
 from uuid import uuid4
@@ -13,6 +13,7 @@ import urllib.error
 import urllib.request
 
 from services.governance_api.app.repositories.governance_repository import GovernanceGateError, REPOSITORY
+from services.governance_api.app.repositories.partition_maintenance import RETENTION_TIERS
 from services.governance_api.app.runtime_stage_dictionary import (
     RUNTIME_PIPELINE_STAGE_ORDER,
     RUNTIME_PIPELINE_STAGE_ZH,
@@ -692,6 +693,9 @@ class GovernanceService:
         except Exception:
             return 0.0
 
+    def _window_start_iso(self, recent_hours: int) -> str:
+        return (datetime.now(timezone.utc) - timedelta(hours=float(recent_hours))).isoformat()
+
     def _created_in_window(self, created_at: str, *, recent_hours: int) -> bool:
         ts = self._parse_iso_ts(created_at)
         if ts <= 0:
@@ -751,96 +755,25 @@ class GovernanceService:
 
     def runtime_summary(self, *, window: str = "24h", ruleset_id: str = "") -> dict[str, Any]:
         recent_hours = self._parse_window_hours(window)
-        tasks = self._repo.list_tasks(limit=5000)
-        selected: list[dict[str, Any]] = []
-        for item in tasks:
-            if not self._task_in_window(item, recent_hours=recent_hours):
-                continue
-            if ruleset_id and str(item.get("ruleset_id") or "") != str(ruleset_id):
-                continue
-            selected.append(item)
-
-        total = len(selected)
-        status_counts: dict[str, int] = {}
-        confidence_values: list[float] = []
-        latest_ts = ""
-        reviewed_tasks = 0
-        pending_review_tasks = 0
-
-        for task in selected:
-            task_id = str(task.get("task_id") or "")
-            status = str(task.get("status") or "UNKNOWN").upper()
-            status_counts[status] = status_counts.get(status, 0) + 1
-            latest_ts = max(latest_ts, str(task.get("created_at") or ""))
-
-            review = self._repo.get_review(task_id) if task_id else None
-            if review:
-                reviewed_tasks += 1
-
-            results = self._repo.get_results(task_id) if task_id else []
-            if results and not review:
-                pending_review_tasks += 1
-            for result in results:
-                try:
-                    confidence_values.append(float(result.get("confidence", 0.0)))
-                except Exception:
-                    confidence_values.append(0.0)
-
-        avg_confidence = (sum(confidence_values) / float(len(confidence_values))) if confidence_values else 0.0
+        rollup = self._repo.runtime_status_rollup(
+            created_after=self._window_start_iso(recent_hours),
+            ruleset_id=str(ruleset_id or ""),
+        )
+        result_count = sum(int(item.get("result_count") or 0) for item in rollup)
+        confidence_sum = sum(float(item.get("confidence_sum") or 0.0) for item in rollup)
+        avg_confidence = (confidence_sum / float(result_count)) if result_count else 0.0
         return {
-            "total_tasks": total,
-            "status_counts": status_counts,
+            "total_tasks": sum(int(item.get("task_count") or 0) for item in rollup),
+            "status_counts": {str(item["status"]): int(item.get("task_count") or 0) for item in rollup},
             "avg_confidence": round(avg_confidence, 6),
-            "pending_review_tasks": pending_review_tasks,
-            "reviewed_tasks": reviewed_tasks,
-            "latest_task_at": latest_ts,
+            "pending_review_tasks": sum(int(item.get("pending_review_tasks") or 0) for item in rollup),
+            "reviewed_tasks": sum(int(item.get("reviewed_tasks") or 0) for item in rollup),
+            "latest_task_at": max((str(item.get("latest_task_at") or "") for item in rollup), default=""),
         }
 
     def runtime_risk_distribution(self, *, window: str = "24h") -> dict[str, Any]:
         recent_hours = self._parse_window_hours(window)
-        tasks = self._repo.list_tasks(limit=5000)
-
-        confidence_buckets = {
-            "ge_085": 0,
-            "between_060_085": 0,
-            "lt_060": 0,
-        }
-        blocked_reason_count: dict[str, int] = {}
-        low_confidence_pattern_count: dict[str, int] = {}
-
-        for task in tasks:
-            if not self._task_in_window(task, recent_hours=recent_hours):
-                continue
-            status = str(task.get("status") or "").upper()
-            if status == "BLOCKED":
-                reason = str(task.get("queue_message") or "unknown")
-                blocked_reason_count[reason] = blocked_reason_count.get(reason, 0) + 1
-
-            task_id = str(task.get("task_id") or "")
-            for result in self._repo.get_results(task_id):
-                confidence = float(result.get("confidence", 0.0))
-                if confidence >= 0.85:
-                    confidence_buckets["ge_085"] += 1
-                elif confidence >= 0.60:
-                    confidence_buckets["between_060_085"] += 1
-                else:
-                    confidence_buckets["lt_060"] += 1
-                    strategy = str(result.get("strategy") or "unknown")
-                    low_confidence_pattern_count[strategy] = low_confidence_pattern_count.get(strategy, 0) + 1
-
-        blocked_reason_top = [
-            {"reason": k, "count": v}
-            for k, v in sorted(blocked_reason_count.items(), key=lambda kv: kv[1], reverse=True)[:5]
-        ]
-        low_confidence_pattern_top = [
-            {"pattern": k, "count": v}
-            for k, v in sorted(low_confidence_pattern_count.items(), key=lambda kv: kv[1], reverse=True)[:5]
-        ]
-        return {
-            "confidence_buckets": confidence_buckets,
-            "blocked_reason_top": blocked_reason_top,
-            "low_confidence_pattern_top": low_confidence_pattern_top,
-        }
+        return self._repo.runtime_risk_rollup(created_after=self._window_start_iso(recent_hours), top=5)
 
     def runtime_version_compare(self, *, baseline: str, candidate: str) -> dict[str, Any]:
         # MVP implementation: no strict ID coupling yet, return neutral delta if no comparable tasks.
@@ -961,7 +894,7 @@ class GovernanceService:
         stage_rank = {stage: idx for idx, stage in enumerate(stage_order)}
         unknown_stages: set[str] = set()
 
-        all_events = self._repo.list_observation_events(limit=10000)
+        all_events = self._repo.list_observation_events(created_after=self._window_start_iso(recent_hours), limit=10000)
         groups: dict[str, dict[str, Any]] = {}
         for evt in all_events:
             created_at = str(evt.get("created_at") or "")
@@ -1140,7 +1073,7 @@ class GovernanceService:
         safe_limit = max(1, min(int(limit), 1000))
         recent_hours = self._parse_window_hours(window)
 
-        events = self._repo.list_observation_events(limit=10000)
+        events = self._repo.list_observation_events(created_after=self._window_start_iso(recent_hours), limit=10000)
         items: list[dict[str, Any]] = []
         for evt in events:
             if str(evt.get("workpackage_id") or "") != target_workpackage:
@@ -1340,7 +1273,7 @@ class GovernanceService:
         target_version = str(version or "").strip()
         safe_limit = max(1, min(int(limit), 1000))
 
-        events = self._repo.list_observation_events(limit=10000)
+        events = self._repo.list_observation_events(created_after=self._window_start_iso(recent_hours), limit=10000)
         selected: list[dict[str, Any]] = []
         for evt in events:
             source = str(evt.get("source_service") or "").lower()
@@ -2234,9 +2167,9 @@ class GovernanceService:
             detail_ms = (perf_counter() - start_detail) * 1000.0
 
         archive = {
-            "retention_hot_days": 14,
-            "retention_warm_days": 90,
-            "retention_cold_days": 365,
+            "retention_hot_days": RETENTION_TIERS["hot"],
+            "retention_warm_days": RETENTION_TIERS["warm"],
+            "retention_cold_days": RETENTION_TIERS["cold"],
             "partition_key": "created_at",
         }
         metrics = {
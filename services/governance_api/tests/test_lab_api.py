@@ -72,10 +72,11 @@ def test_lab_optimize_creates_pending_change_request() -> None:
 
 def test_lab_fengtu_network_confirmation_flow() -> None:
     client = TestClient(app)
-    FengtuTrustedClient._network_confirmation_required = True
-    FengtuTrustedClient._last_network_error = "TimeoutError"
-    FengtuTrustedClient._network_confirmed_once = False
+    FengtuTrustedClient._breakers.clear()
     FengtuTrustedClient._last_confirm_by = ""
+    breaker = FengtuTrustedClient.breaker("address_real_check")
+    for _ in range(5):
+        breaker.record_failure("TimeoutError")
 
     status_before = client.get("/v1/governance/lab/trusted/fengtu/status")
     assert status_before.status_code == 200
@@ -83,6 +84,9 @@ def test_lab_fengtu_network_confirmation_flow() -> None:
     assert before_data["enabled"] is True
     assert before_data["confirmation_required"] is True
     assert before_data["last_network_error"] == "TimeoutError"
+    breakers = {item["name"]: item for item in before_data["breakers"]}
+    assert breakers["address_real_check"]["state"] == "open"
+    assert breakers["address_real_check"]["transitions"][-1]["to"] == "open"
 
     confirm = client.post(
         "/v1/governance/lab/trusted/fengtu/confirm-network",
@@ -92,8 +96,10 @@ def test_lab_fengtu_network_confirmation_flow() -> None:
     confirm_data = confirm.json()
     assert confirm_data["last_confirm_by"] == "huda"
 
-    # confirm action sets one-time resume token and keeps current state visible until next call.
-    assert FengtuTrustedClient._network_confirmed_once is True
+    # confirm action closes every breaker immediately.
+    assert confirm_data["confirmation_required"] is False
+    assert FengtuTrustedClient.breaker("address_real_check").state == "closed"
+    FengtuTrustedClient._breakers.clear()
 
 
 def test_lab_fengtu_conflicts_list_and_decision() -> None:
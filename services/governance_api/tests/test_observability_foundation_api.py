@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from uuid import uuid4
 
 os.environ.setdefault("OBSERVABILITY_ONCALL_TOKEN", "oncall-token-local")
 
@@ -44,6 +45,48 @@ def test_observability_events_and_trace_replay_contract() -> None:
     assert replay_payload["timeline"][0]["event_type"] == "task_submitted"
 
 
+def test_observability_events_and_trace_replay_keyset_pagination() -> None:
+    trace_id = f"trace_obs_pages_{uuid4().hex[:8]}"
+    for step in range(5):
+        REPOSITORY.record_observation_event(
+            source_service="governance_api",
+            event_type="page_step",
+            status="success",
+            trace_id=trace_id,
+            payload={"step": step},
+        )
+    # Newer, unrelated traffic must not push an older trace out of its own replay.
+    for _ in range(3):
+        REPOSITORY.record_observation_event(
+            source_service="governance_api", event_type="noise", status="success", trace_id=f"{trace_id}_noise"
+        )
+
+    client = TestClient(app)
+    steps: list[int] = []
+    cursor = ""
+    while True:
+        resp = client.get(f"/v1/governance/observability/traces/{trace_id}/replay", params={"limit": 2, "cursor": cursor})
+        assert resp.status_code == 200
+        payload = resp.json()
+        steps.extend(item["payload_json"]["step"] for item in payload["timeline"])
+        cursor = payload["next_cursor"]
+        if not cursor:
+            break
+    assert steps == [0, 1, 2, 3, 4]
+
+    first = client.get("/v1/governance/observability/events", params={"trace_id": trace_id, "limit": 3}).json()
+    assert [item["payload_json"]["step"] for item in first["items"]] == [4, 3, 2]
+    second = client.get(
+        "/v1/governance/observability/events",
+        params={"trace_id": trace_id, "limit": 3, "cursor": first["next_cursor"]},
+    ).json()
+    assert [item["payload_json"]["step"] for item in second["items"]] == [1, 0]
+    assert second["next_cursor"] == ""
+
+    bad = client.get("/v1/governance/observability/events", params={"cursor": "not-a-cursor"})
+    assert bad.status_code == 400
+
+
 def test_observability_snapshot_timeseries_and_alert_ack_contract() -> None:
     REPOSITORY.upsert_observation_metric(
         metric_name="task.success_rate",
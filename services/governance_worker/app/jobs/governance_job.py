@@ -11,16 +11,18 @@ from services.governance_worker.app.runtime.workpackage_executor import Workpack
 def run(task_payload: dict) -> dict:
     task_id = task_payload.get("task_id")
     trace_id = str(task_payload.get("trace_id") or f"trace_{task_id or 'unknown'}")
-    REPOSITORY.set_task_status(task_id, "RUNNING")
-    REPOSITORY.record_observation_event(
-        source_service="governance_worker",
-        event_type="task_running",
-        status="success",
-        trace_id=trace_id,
-        task_id=str(task_id or ""),
-        ruleset_id=str(task_payload.get("ruleset_id") or ""),
-        payload={"stage": "start"},
-    )
+    # Each state transition (status + audit/observation rows) is written as one unit of work.
+    with REPOSITORY.session():
+        REPOSITORY.set_task_status(task_id, "RUNNING")
+        REPOSITORY.record_observation_event(
+            source_service="governance_worker",
+            event_type="task_running",
+            status="success",
+            trace_id=trace_id,
+            task_id=str(task_id or ""),
+            ruleset_id=str(task_payload.get("ruleset_id") or ""),
+            payload={"stage": "start"},
+        )
     try:
         processed = ingest_run(task_payload)
         workpackage_id = str(processed.get("workpackage_id") or "").strip()
@@ -34,6 +36,10 @@ def run(task_payload: dict) -> dict:
         )
         if not published:
             raise RuntimeError(f"blocked: runtime workpackage record not found: {workpackage_id}@{version}")
+        # The bundle gets the stored ruleset row, so config_json (score_rules, trust settings)
+        # reaches the pipeline it runs; unknown ids still run with the built-in defaults.
+        ruleset_id = str(processed.get("ruleset_id") or "default")
+        ruleset = REPOSITORY.get_ruleset(ruleset_id) or {"ruleset_id": ruleset_id}
         executor = WorkpackageExecutor()
         execution = executor.execute(
             workpackage_id=workpackage_id,
@@ -43,60 +49,63 @@ def run(task_payload: dict) -> dict:
                 "trace_id": trace_id,
                 "records": processed.get("records", []),
             },
-            ruleset={"ruleset_id": processed.get("ruleset_id", "default")},
-        )
-        output = persist_results(processed, execution.runtime_result, execution.records)
-        REPOSITORY.record_observation_event(
-            source_service="governance_worker",
-            event_type="task_succeeded",
-            status="success",
-            trace_id=trace_id,
-            task_id=str(task_id or ""),
-            ruleset_id=str(task_payload.get("ruleset_id") or ""),
-            payload={
-                "result_status": output.get("status", ""),
-                "workpackage_id": workpackage_id,
-                "version": version,
-                "runtime_report_path": execution.report_path,
-            },
+            ruleset=ruleset,
         )
+        with REPOSITORY.session():
+            output = persist_results(processed, execution.runtime_result, execution.records)
+            REPOSITORY.record_observation_event(
+                source_service="governance_worker",
+                event_type="task_succeeded",
+                status="success",
+                trace_id=trace_id,
+                task_id=str(task_id or ""),
+                ruleset_id=str(task_payload.get("ruleset_id") or ""),
+                payload={
+                    "result_status": output.get("status", ""),
+                    "workpackage_id": workpackage_id,
+                    "version": version,
+                    "runtime_report_path": execution.report_path,
+                },
+            )
         return output
     except Exception as exc:
         message = str(exc)
         if "blocked:" in message:
             reason = message.split("blocked:", 1)[1].strip() or "unknown_blocked_reason"
-            REPOSITORY.set_task_status(task_id, "BLOCKED")
-            REPOSITORY.log_blocked_confirmation(
-                event_type="governance_job_blocked",
-                caller="governance_worker",
-                payload={
-                    "task_id": task_id,
-                    "reason": reason,
-                    "confirmation_user": "pending_owner",
-                    "confirmation_decision": "pending",
-                    "confirmation_timestamp": datetime.now(timezone.utc).isoformat(),
-                },
-            )
+            with REPOSITORY.session():
+                REPOSITORY.set_task_status(task_id, "BLOCKED")
+                REPOSITORY.log_blocked_confirmation(
+                    event_type="governance_job_blocked",
+                    caller="governance_worker",
+                    payload={
+                        "task_id": task_id,
+                        "reason": reason,
+                        "confirmation_user": "pending_owner",
+                        "confirmation_decision": "pending",
+                        "confirmation_timestamp": datetime.now(timezone.utc).isoformat(),
+                    },
+                )
+                REPOSITORY.record_observation_event(
+                    source_service="governance_worker",
+                    event_type="task_blocked",
+                    status="blocked",
+                    severity="error",
+                    trace_id=trace_id,
+                    task_id=str(task_id or ""),
+                    ruleset_id=str(task_payload.get("ruleset_id") or ""),
+                    payload={"reason": reason},
+                )
+            return {"task_id": task_id, "status": "BLOCKED", "block_reason": reason}
+        with REPOSITORY.session():
+            REPOSITORY.set_task_status(task_id, "FAILED")
             REPOSITORY.record_observation_event(
                 source_service="governance_worker",
-                event_type="task_blocked",
-                status="blocked",
+                event_type="task_failed",
+                status="error",
                 severity="error",
                 trace_id=trace_id,
                 task_id=str(task_id or ""),
                 ruleset_id=str(task_payload.get("ruleset_id") or ""),
-                payload={"reason": reason},
+                payload={"error": message[:400]},
             )
-            return {"task_id": task_id, "status": "BLOCKED", "block_reason": reason}
-        REPOSITORY.set_task_status(task_id, "FAILED")
-        REPOSITORY.record_observation_event(
-            source_service="governance_worker",
-            event_type="task_failed",
-            status="error",
-            severity="error",
-            trace_id=trace_id,
-            task_id=str(task_id or ""),
-            ruleset_id=str(task_payload.get("ruleset_id") or ""),
-            payload={"error": message[:400]},
-        )
         return {"task_id": task_id, "status": "FAILED"}
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+import os
+
+from services.governance_api.app.repositories.governance_repository import REPOSITORY
+
+
+def run(task_payload: dict) -> dict:
+    """Scheduled maintenance: pre-create upcoming partitions and expire those past retention."""
+    mode = str(task_payload.get("mode") or os.getenv("GOVERNANCE_PARTITION_EXPIRE_MODE") or "detach")
+    archive_dir = str(task_payload.get("archive_dir") or os.getenv("GOVERNANCE_PARTITION_ARCHIVE_DIR") or "")
+    archive_format = str(task_payload.get("archive_format") or os.getenv("GOVERNANCE_PARTITION_ARCHIVE_FORMAT") or "jsonl")
+    tables = REPOSITORY.maintain_partitions(mode=mode, archive_dir=archive_dir, archive_format=archive_format)
+    return {"status": "SUCCEEDED", "tables": tables}
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from services.governance_worker.app.jobs import governance_job
+from services.governance_worker.app.runtime.workpackage_executor import WorkpackageExecutor
+
+_ENTRYPOINT = """
+import json
+import os
+from pathlib import Path
+
+from packages.address_core.pipeline import run
+
+context = json.loads(os.environ["WORKPACKAGE_TASK_CONTEXT_JSON"])
+ruleset = json.loads(os.environ["WORKPACKAGE_RULESET_JSON"])
+records = [
+    {
+        "input": {"raw_id": item["raw_id"]},
+        "normalization": {"normalized_address": item["canon_text"], "confidence": item["confidence"]},
+        "record_decision": "REJECTED" if item["strategy"] == "human_required" else "ACCEPTED",
+    }
+    for item in run(context["records"], ruleset)
+]
+Path("output/runtime_output.json").write_text(json.dumps({"records": records}), encoding="utf-8")
+"""
+
+
+def _run_with_ruleset(monkeypatch, tmp_path: Path, ruleset: dict) -> list[dict]:
+    bundle = tmp_path / "wp_score_rules-v1.0.0"
+    bundle.mkdir(exist_ok=True)
+    (bundle / "workpackage.json").write_text("{}", encoding="utf-8")
+    (bundle / "entrypoint.py").write_text(_ENTRYPOINT, encoding="utf-8")
+    monkeypatch.setenv("PYTHONPATH", str(Path(__file__).resolve().parents[3]))
+    monkeypatch.setenv("ADDRESS_TRUSTED_FENGTU_ENABLED", "0")
+
+    captured: dict = {}
+
+    def _persist(processed, runtime_result, records):
+        captured["records"] = records
+        return {"status": "SUCCEEDED"}
+
+    monkeypatch.setattr(governance_job, "ingest_run", lambda payload: payload)
+    monkeypatch.setattr(governance_job, "WorkpackageExecutor", lambda: WorkpackageExecutor(bundle_root=tmp_path))
+    monkeypatch.setattr(governance_job, "persist_results", _persist)
+    monkeypatch.setattr(governance_job.REPOSITORY, "get_runtime_workpackage_record", lambda **_kwargs: {"status": "published"})
+    monkeypatch.setattr(governance_job.REPOSITORY, "get_ruleset", lambda ruleset_id: {"ruleset_id": ruleset_id, **ruleset})
+    monkeypatch.setattr(governance_job.REPOSITORY, "set_task_status", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(governance_job.REPOSITORY, "record_observation_event", lambda **_kwargs: None)
+
+    result = governance_job.run(
+        {
+            "task_id": "t-score-rules",
+            "ruleset_id": "ut_score_rules",
+            "workpackage_id": "wp_score_rules",
+            "version": "v1.0.0",
+            "records": [{"raw_id": "r1", "raw_text": "浙江省杭州市西湖区文三路90号"}],
+        }
+    )
+    assert result["status"] == "SUCCEEDED"
+    return captured["records"]
+
+
+def test_stored_score_rules_reach_workpackage_scoring(monkeypatch, tmp_path) -> None:
+    default = _run_with_ruleset(monkeypatch, tmp_path, {"config_json": {}})
+    assert default[0]["strategy"] == "match_dict"
+    assert default[0]["confidence"] > 0.62
+
+    override = _run_with_ruleset(
+        monkeypatch, tmp_path, {"config_json": {"score_rules": {"weights": {"field": 0.01}}}}
+    )
+    assert override[0]["strategy"] == "human_required"
+    assert override[0]["confidence"] < default[0]["confidence"]
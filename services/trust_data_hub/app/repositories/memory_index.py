@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import os
+import threading
+import unicodedata
+from typing import Any, Callable, Iterable, Optional
+
+
+def normalize_name(value: Any) -> str:
+    return unicodedata.normalize("NFKC", str(value or "")).strip().lower()
+
+
+# Texts a lookup term is matched against, per indexed table. Admin aliases are matched as one
+# joined string, like the original list scan did.
+SEARCH_TEXTS: dict[str, Callable[[dict[str, Any]], tuple[Any, ...]]] = {
+    "admin_division": lambda row: (row.get("name"), "".join(str(alias) for alias in row.get("name_aliases") or [])),
+    "road": lambda row: (row.get("name"), row.get("normalized_name")),
+    "poi": lambda row: (row.get("name"), row.get("normalized_name")),
+    "place": lambda row: (row.get("name"), row.get("normalized_name")),
+}
+
+
+# Texts a candidate's rank_score is computed from, and the field each lookup hint filters on.
+SCORE_TEXTS: dict[str, Callable[[dict[str, Any]], tuple[Any, ...]]] = {
+    "admin_division": lambda row: (row.get("name"), *(row.get("name_aliases") or [])),
+    "road": lambda row: (row.get("name"), row.get("normalized_name")),
+    "poi": lambda row: (row.get("name"), row.get("normalized_name")),
+}
+HINT_FIELDS = {"admin_division": "parent_adcode", "road": "admin_adcode", "poi": "admin_adcode"}
+
+
+def name_grams(text: str) -> set[str]:
+    """Index keys of a normalized name: its characters and character bigrams."""
+    if len(text) < 2:
+        return {text} if text else set()
+    return {text[idx : idx + 2] for idx in range(len(text) - 1)} | set(text)
+
+
+def term_grams(term: str) -> set[str]:
+    """Keys every name containing ``term`` is posted under."""
+    return {term} if len(term) == 1 else {term[idx : idx + 2] for idx in range(len(term) - 1)}
+
+
+def containment_score(term: str, *texts: Any) -> float:
+    # Same coverage rank as the SQL lookups: the share of the best matching text the term covers.
+    term = normalize_name(term)
+    normalized = [normalize_name(text) for text in texts]
+    scores = [len(term) / max(len(text), 1) for text in normalized if text and term in text]
+    return round(max(scores, default=0.0), 4)
+
+
+def ranked_matches(kind: str, rows: Iterable[dict[str, Any]], name: str, hint: Optional[str]) -> list[dict[str, Any]]:
+    """Copies of ``rows`` passing the hint filter with a ``rank_score``, best first."""
+    items = [
+        {**row, "rank_score": containment_score(name, *SCORE_TEXTS[kind](row))}
+        for row in rows
+        if not hint or hint == row.get(HINT_FIELDS[kind])
+    ]
+    return sorted(items, key=lambda item: -item["rank_score"])
+
+
+class SnapshotTableIndex:
+    """Immutable substring index over one table of one snapshot.
+
+    Rows are grouped by normalized name, and every distinct name is posted under its single
+    characters and character bigrams. A lookup reads the shortest posting list of the term's
+    grams and confirms the few candidate names with a plain ``in`` check.
+    """
+
+    __slots__ = ("rows", "_names", "_name_rows", "_postings")
+
+    def __init__(self, rows: Iterable[dict[str, Any]], texts: Callable[[dict[str, Any]], tuple[Any, ...]]) -> None:
+        self.rows: list[dict[str, Any]] = list(rows)
+        self._names: list[str] = []
+        self._name_rows: list[list[int]] = []
+        self._postings: dict[str, list[int]] = {}
+        name_ids: dict[str, int] = {}
+        for pos, row in enumerate(self.rows):
+            for text in {normalize_name(value) for value in texts(row)}:
+                if not text:
+                    continue
+                name_id = name_ids.get(text)
+                if name_id is None:
+                    name_id = name_ids[text] = len(self._names)
+                    self._names.append(text)
+                    self._name_rows.append([])
+                    for gram in name_grams(text):
+                        self._postings.setdefault(gram, []).append(name_id)
+                if not self._name_rows[name_id] or self._name_rows[name_id][-1] != pos:
+                    self._name_rows[name_id].append(pos)
+
+    def search(self, term: str) -> list[dict[str, Any]]:
+        """Rows with a text containing the normalized ``term``, in snapshot order."""
+        if not term:
+            return list(self.rows)
+        postings = []
+        for gram in term_grams(term):
+            posting = self._postings.get(gram)
+            if not posting:
+                return []
+            postings.append(posting)
+        candidates = min(postings, key=len)
+        positions: set[int] = set()
+        for name_id in candidates:
+            if term in self._names[name_id]:
+                positions.update(self._name_rows[name_id])
+        return [self.rows[pos] for pos in sorted(positions)]
+
+
+class TrustMemoryIndex:
+    """Trust lookups for deployments that run without the trust_data tables.
+
+    ``publish`` indexes one snapshot's tables and ``activate`` switches which snapshot of a
+    source is served; neither touches other sources. Per source the active snapshot and the
+    ``TRUST_SNAPSHOT_RETAIN`` most recently published ones stay indexed. Readers never take
+    the lock: every write replaces the namespace's tuple of served snapshots.
+    """
+
+    def __init__(self, retain: int | None = None) -> None:
+        self._retain = max(1, int(retain if retain is not None else str(os.getenv("TRUST_SNAPSHOT_RETAIN") or "3")))
+        self._lock = threading.Lock()
+        self._tables: dict[str, dict[str, SnapshotTableIndex]] = {}
+        self._published: dict[tuple[str, str], list[str]] = {}
+        self._active: dict[tuple[str, str], str] = {}
+        self._serving: dict[str, tuple[dict[str, SnapshotTableIndex], ...]] = {}
+
+    def publish(self, namespace: str, source_id: str, snapshot_id: str, tables: dict[str, list[dict[str, Any]]]) -> None:
+        built = {kind: SnapshotTableIndex(tables.get(kind) or [], texts) for kind, texts in SEARCH_TEXTS.items()}
+        with self._lock:
+            self._tables[snapshot_id] = built
+            published = [sid for sid in self._published.get((namespace, source_id), []) if sid != snapshot_id]
+            self._published[(namespace, source_id)] = [*published, snapshot_id][-self._retain :]
+            self._refresh(namespace)
+
+    def activate(self, namespace: str, source_id: str, snapshot_id: str) -> None:
+        with self._lock:
+            if self._active.get((namespace, source_id)) == snapshot_id:
+                return
+            self._active[(namespace, source_id)] = snapshot_id
+            self._refresh(namespace)
+
+    def _refresh(self, namespace: str) -> None:
+        keep = {sid for published in self._published.values() for sid in published} | set(self._active.values())
+        for snapshot_id in [sid for sid in self._tables if sid not in keep]:
+            del self._tables[snapshot_id]
+        self._serving[namespace] = tuple(
+            self._tables[sid] for (ns, _), sid in self._active.items() if ns == namespace and sid in self._tables
+        )
+
+    def search(self, namespace: str, kind: str, term: Any) -> list[dict[str, Any]]:
+        """Rows of the namespace's active snapshots whose name texts contain ``term``."""
+        normalized = normalize_name(term)
+        rows: list[dict[str, Any]] = []
+        for tables in self._serving.get(namespace, ()):
+            rows.extend(tables[kind].search(normalized))
+        return rows
@@ -4,6 +4,7 @@ import json
 import os
 from typing import Any, Optional
 
+from services.trust_data_hub.app.repositories.pg_engine import shared_engine
 from services.trust_data_hub.app.repositories.schema_bootstrap import ensure_trust_pg_schema
 
 class MetaDbPersister:
@@ -16,9 +17,7 @@ class MetaDbPersister:
         return bool(self._dsn and str(self._dsn).startswith("postgresql"))
 
     def _engine(self):
-        from sqlalchemy import create_engine
-
-        return create_engine(self._dsn)
+        return shared_engine(self._dsn)
 
     def upsert_source(self, namespace: str, source_id: str, payload: dict[str, Any]) -> None:
         if not self.enabled():
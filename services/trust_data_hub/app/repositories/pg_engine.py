@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import os
+import threading
+from typing import Any
+
+_ENGINES: dict[str, Any] = {}
+_ENGINES_LOCK = threading.Lock()
+
+
+def _env_int(name: str, default: int) -> int:
+    return int(str(os.getenv(name) or default))
+
+
+def _set_similarity_floor(dbapi_connection, _connection_record) -> None:
+    # Lookups narrow ``%`` matches with their own bound threshold, so the session-level
+    # pg_trgm threshold is only the floor. Before pg_trgm loads, this sets a placeholder the
+    # extension picks up.
+    floor = float(str(os.getenv("TRUST_QUERY_SIMILARITY_FLOOR") or "0.1"))
+    autocommit = dbapi_connection.autocommit
+    dbapi_connection.autocommit = True
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"SET pg_trgm.similarity_threshold = {floor}")
+    finally:
+        cursor.close()
+        dbapi_connection.autocommit = autocommit
+
+
+def shared_engine(dsn: str) -> Any:
+    """Process-wide pooled engine for ``dsn``, created on first use.
+
+    Trust lookups run per record, so persisters must not build a new engine (and a new
+    connection handshake) per call. Pool sizing follows ``TRUST_PG_POOL_SIZE``,
+    ``TRUST_PG_MAX_OVERFLOW`` and ``TRUST_PG_POOL_RECYCLE_SEC``. Each connection sets the
+    pg_trgm similarity floor ``TRUST_QUERY_SIMILARITY_FLOOR`` once. With the psycopg 3 driver,
+    statements run ``TRUST_PG_PREPARE_THRESHOLD`` times on a connection become server-side
+    prepared statements; SQLAlchemy's compiled-statement cache applies to every driver.
+    """
+    normalized = str(dsn).strip()
+    engine = _ENGINES.get(normalized)
+    if engine is not None:
+        return engine
+    with _ENGINES_LOCK:
+        engine = _ENGINES.get(normalized)
+        if engine is None:
+            from sqlalchemy import create_engine, event
+            from sqlalchemy.engine import make_url
+
+            connect_args: dict[str, Any] = {}
+            if make_url(normalized).get_driver_name() == "psycopg":
+                connect_args["prepare_threshold"] = max(0, _env_int("TRUST_PG_PREPARE_THRESHOLD", 1))
+            engine = create_engine(
+                normalized,
+                pool_pre_ping=True,
+                pool_size=max(1, _env_int("TRUST_PG_POOL_SIZE", 5)),
+                max_overflow=max(0, _env_int("TRUST_PG_MAX_OVERFLOW", 10)),
+                pool_recycle=_env_int("TRUST_PG_POOL_RECYCLE_SEC", 1800),
+                connect_args=connect_args,
+                future=True,
+            )
+            event.listen(engine, "connect", _set_similarity_floor)
+            _ENGINES[normalized] = engine
+    return engine
+
+
+def dispose_engines() -> None:
+    """Close every pooled connection, e.g. after fork or in tests that switch databases."""
+    with _ENGINES_LOCK:
+        engines = list(_ENGINES.values())
+        _ENGINES.clear()
+    for engine in engines:
+        engine.dispose()
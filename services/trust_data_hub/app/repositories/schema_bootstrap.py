@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import threading
 from pathlib import Path
 
@@ -64,6 +65,117 @@ def _ensure_table_relation(conn, schema_name: str, table_name: str, create_sql:
     conn.exec_driver_sql(create_sql)
 
 
+# trust_data tables that are list-partitioned by snapshot_id, one partition per published snapshot,
+# with their primary key columns.
+SNAPSHOT_PARTITIONED_TABLES: dict[str, tuple[str, ...]] = {
+    "admin_division": ("namespace_id", "adcode", "source_id", "snapshot_id"),
+    "road_index": ("namespace_id", "road_id", "source_id", "snapshot_id"),
+    "poi_index": ("namespace_id", "poi_id", "source_id", "snapshot_id"),
+    "place_name_index": ("namespace_id", "place_id", "source_id", "snapshot_id"),
+    "admin_division_alias": ("namespace_id", "adcode", "normalized_alias", "source_id", "snapshot_id"),
+}
+
+# Name columns that get pg_trgm GIN indexes for fuzzy lookups, when the extension is available.
+TRIGRAM_INDEXED_COLUMNS: dict[str, tuple[str, ...]] = {
+    "admin_division": ("name",),
+    "admin_division_alias": ("normalized_alias",),
+    "road_index": ("name", "normalized_name"),
+    "poi_index": ("name", "normalized_name"),
+}
+
+
+def snapshot_partition_name(table_name: str, snapshot_id: str) -> str:
+    """Unqualified name of the trust_data partition holding ``snapshot_id`` rows of ``table_name``."""
+    digest = hashlib.sha1(str(snapshot_id).encode("utf-8")).hexdigest()[:16]
+    return f"{table_name}_s_{digest}"
+
+
+def _partition_by_snapshot(conn, table_name: str) -> None:
+    # Earlier deployments created plain tables; move their rows into per-snapshot partitions.
+    if _get_relation_kind(conn, "trust_data", table_name) != "r":
+        return
+    legacy = f"{table_name}_unpartitioned"
+    conn.exec_driver_sql(f"ALTER TABLE trust_data.{table_name} RENAME TO {legacy}")
+    index_names = conn.exec_driver_sql(
+        "SELECT indexname FROM pg_indexes WHERE schemaname = 'trust_data' AND tablename = %s",
+        (legacy,),
+    ).fetchall()
+    for (index_name,) in index_names:
+        conn.exec_driver_sql(f"ALTER INDEX trust_data.{index_name} RENAME TO {index_name[:40]}_unpartitioned")
+    conn.exec_driver_sql(
+        f"""
+        CREATE TABLE trust_data.{table_name} (
+            LIKE trust_data.{legacy} INCLUDING DEFAULTS,
+            PRIMARY KEY ({", ".join(SNAPSHOT_PARTITIONED_TABLES[table_name])})
+        ) PARTITION BY LIST (snapshot_id)
+        """
+    )
+    snapshot_ids = conn.exec_driver_sql(f"SELECT DISTINCT snapshot_id FROM trust_data.{legacy}").fetchall()
+    for (snapshot_id,) in snapshot_ids:
+        partition = snapshot_partition_name(table_name, snapshot_id)
+        literal = str(snapshot_id).replace("'", "''")
+        conn.exec_driver_sql(
+            f"CREATE TABLE trust_data.{partition} PARTITION OF trust_data.{table_name} FOR VALUES IN ('{literal}')"
+        )
+        conn.exec_driver_sql(
+            f"INSERT INTO trust_data.{partition} SELECT * FROM trust_data.{legacy} WHERE snapshot_id = %s",
+            (snapshot_id,),
+        )
+    conn.exec_driver_sql(f"DROP TABLE trust_data.{legacy}")
+
+
+def _ensure_pg_trgm(conn) -> bool:
+    installed = conn.exec_driver_sql("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'").fetchone()
+    if installed:
+        return True
+    # Not every server ships contrib modules or lets this role create extensions.
+    savepoint = conn.begin_nested()
+    try:
+        conn.exec_driver_sql("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    except Exception:
+        savepoint.rollback()
+        return False
+    savepoint.commit()
+    return True
+
+
+def _backfill_admin_division_aliases(conn) -> None:
+    # Snapshots published before the alias side table existed only carry name_aliases JSON.
+    partitions = conn.exec_driver_sql(
+        """
+        SELECT c.relname
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = 'trust_data.admin_division'::regclass
+        """
+    ).fetchall()
+    for (partition,) in partitions:
+        row = conn.exec_driver_sql(f"SELECT snapshot_id FROM trust_data.{partition} LIMIT 1").fetchone()
+        if not row:
+            continue
+        snapshot_id = str(row[0])
+        alias_partition = snapshot_partition_name("admin_division_alias", snapshot_id)
+        if _get_relation_kind(conn, "trust_data", alias_partition):
+            continue
+        literal = snapshot_id.replace("'", "''")
+        conn.exec_driver_sql(
+            f"""
+            CREATE TABLE trust_data.{alias_partition}
+            PARTITION OF trust_data.admin_division_alias FOR VALUES IN ('{literal}')
+            """
+        )
+        conn.exec_driver_sql(
+            f"""
+            INSERT INTO trust_data.{alias_partition} (namespace_id, adcode, alias, normalized_alias, source_id, snapshot_id)
+            SELECT DISTINCT ON (d.namespace_id, d.adcode, lower(btrim(normalize(a.alias, NFKC))), d.source_id)
+                   d.namespace_id, d.adcode, a.alias, lower(btrim(normalize(a.alias, NFKC))), d.source_id, d.snapshot_id
+            FROM trust_data.{partition} d
+            CROSS JOIN LATERAL jsonb_array_elements_text(d.name_aliases) AS a(alias)
+            WHERE btrim(a.alias) <> ''
+            """
+        )
+
+
 def _reconcile_trust_meta_legacy(engine) -> None:
     # Legacy DB may have trust_meta.validation_replay_run without created_at.
     with engine.begin() as conn:
@@ -478,7 +590,7 @@ def _reconcile_trust_meta_legacy(engine) -> None:
                 division_id TEXT,
                 parent_id TEXT,
                 PRIMARY KEY (namespace_id, adcode, source_id, snapshot_id)
-            )
+            ) PARTITION BY LIST (snapshot_id)
             """,
         )
         _ensure_table_relation(
@@ -498,7 +610,7 @@ def _reconcile_trust_meta_legacy(engine) -> None:
                 alias_names JSONB NOT NULL DEFAULT '[]'::jsonb,
                 adcode TEXT,
                 PRIMARY KEY (namespace_id, road_id, source_id, snapshot_id)
-            )
+            ) PARTITION BY LIST (snapshot_id)
             """,
         )
         _ensure_table_relation(
@@ -520,7 +632,7 @@ def _reconcile_trust_meta_legacy(engine) -> None:
                 lon DOUBLE PRECISION,
                 lat DOUBLE PRECISION,
                 PRIMARY KEY (namespace_id, poi_id, source_id, snapshot_id)
-            )
+            ) PARTITION BY LIST (snapshot_id)
             """,
         )
         _ensure_table_relation(
@@ -543,7 +655,7 @@ def _reconcile_trust_meta_legacy(engine) -> None:
                 category TEXT,
                 adcode TEXT,
                 PRIMARY KEY (namespace_id, place_id, source_id, snapshot_id)
-            )
+            ) PARTITION BY LIST (snapshot_id)
             """,
         )
         _ensure_table_relation(
@@ -560,6 +672,22 @@ def _reconcile_trust_meta_legacy(engine) -> None:
             )
             """,
         )
+        _ensure_table_relation(
+            conn,
+            "trust_data",
+            "admin_division_alias",
+            """
+            CREATE TABLE IF NOT EXISTS trust_data.admin_division_alias (
+                namespace_id TEXT NOT NULL,
+                adcode TEXT NOT NULL,
+                alias TEXT NOT NULL,
+                normalized_alias TEXT NOT NULL,
+                source_id TEXT NOT NULL,
+                snapshot_id TEXT NOT NULL,
+                PRIMARY KEY (namespace_id, adcode, normalized_alias, source_id, snapshot_id)
+            ) PARTITION BY LIST (snapshot_id)
+            """,
+        )
         conn.exec_driver_sql("ALTER TABLE IF EXISTS trust_data.admin_division ADD COLUMN IF NOT EXISTS parent_adcode TEXT")
         conn.exec_driver_sql("ALTER TABLE IF EXISTS trust_data.admin_division ADD COLUMN IF NOT EXISTS name_aliases JSONB NOT NULL DEFAULT '[]'::jsonb")
         conn.exec_driver_sql("ALTER TABLE IF EXISTS trust_data.admin_division ADD COLUMN IF NOT EXISTS division_id TEXT")
@@ -581,6 +709,8 @@ def _reconcile_trust_meta_legacy(engine) -> None:
         conn.exec_driver_sql("ALTER TABLE IF EXISTS trust_data.place_name_index ADD COLUMN IF NOT EXISTS alias_names JSONB NOT NULL DEFAULT '[]'::jsonb")
         conn.exec_driver_sql("ALTER TABLE IF EXISTS trust_data.place_name_index ADD COLUMN IF NOT EXISTS category TEXT")
         conn.exec_driver_sql("ALTER TABLE IF EXISTS trust_data.place_name_index ADD COLUMN IF NOT EXISTS adcode TEXT")
+        for table_name in SNAPSHOT_PARTITIONED_TABLES:
+            _partition_by_snapshot(conn, table_name)
         if _is_base_table(conn, "trust_data", "admin_division"):
             conn.exec_driver_sql(
                 """
@@ -602,6 +732,16 @@ def _reconcile_trust_meta_legacy(engine) -> None:
                 ON trust_data.poi_index(namespace_id, normalized_name)
                 """
             )
+        _backfill_admin_division_aliases(conn)
+        if _ensure_pg_trgm(conn):
+            for table_name, columns in TRIGRAM_INDEXED_COLUMNS.items():
+                for column in columns:
+                    conn.exec_driver_sql(
+                        f"""
+                        CREATE INDEX IF NOT EXISTS idx_trust_data_{table_name}_{column}_trgm
+                        ON trust_data.{table_name} USING gin ({column} gin_trgm_ops)
+                        """
+                    )
 
 
 def ensure_trust_pg_schema(dsn: str | None) -> None:
@@ -614,11 +754,11 @@ def ensure_trust_pg_schema(dsn: str | None) -> None:
         if normalized in _BOOTSTRAPPED_DSN:
             return
 
-        from sqlalchemy import create_engine
+        from services.trust_data_hub.app.repositories.pg_engine import shared_engine
 
         root = Path(__file__).resolve().parents[4]
         sql_path = root / "database" / "trust_meta_schema.sql"
-        engine = create_engine(normalized, future=True)
+        engine = shared_engine(normalized)
         sql_text = sql_path.read_text(encoding="utf-8")
         for stmt in _split_sql_statements(sql_text):
             try:
@@ -0,0 +1,387 @@
+from __future__ import annotations
+
+import fcntl
+import hashlib
+import json
+import mmap
+import os
+import sys
+import threading
+from array import array
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+from services.trust_data_hub.app.repositories.memory_index import (
+    SEARCH_TEXTS,
+    name_grams,
+    normalize_name,
+    ranked_matches,
+    term_grams,
+)
+
+# File layout: magic, u32 little-endian header length, JSON header, then 8-byte aligned sections.
+# Per table the sections are sorted string tables (a byte blob plus u64 offsets) for the
+# distinct normalized names, their gram keys and the JSON rows, and CSR arrays (u64 offsets
+# into u32 ids) from names to rows and from grams to names.
+_MAGIC = b"TRUSTMM1"
+_FORMAT_VERSION = 1
+_MANIFEST = "active.json"
+_MANIFEST_LOCK = ".active.lock"
+_ARTIFACT_TABLES = ("admin_division", "road", "poi")
+
+
+def _path_key(value: str) -> str:
+    return hashlib.sha1(value.encode("utf-8")).hexdigest()[:16]
+
+
+def _json_default(value: Any) -> str:
+    return value.isoformat() if hasattr(value, "isoformat") else str(value)
+
+
+def _string_table(values: list[bytes]) -> tuple[bytes, array]:
+    offsets = array("Q", [0])
+    total = 0
+    for value in values:
+        total += len(value)
+        offsets.append(total)
+    return b"".join(values), offsets
+
+
+def _csr(groups: list[list[int]]) -> tuple[array, array]:
+    offsets = array("Q", [0])
+    ids = array("I")
+    for group in groups:
+        ids.extend(group)
+        offsets.append(len(ids))
+    return offsets, ids
+
+
+def _table_sections(kind: str, rows: list[dict[str, Any]]) -> dict[str, Any]:
+    texts = SEARCH_TEXTS[kind]
+    name_rows: dict[str, list[int]] = {}
+    for pos, row in enumerate(rows):
+        for text in sorted({normalize_name(value) for value in texts(row)} - {""}):
+            name_rows.setdefault(text, []).append(pos)
+    # UTF-8 byte order equals code point order, so both string tables binary-search on bytes.
+    names = sorted(name_rows, key=lambda text: text.encode("utf-8"))
+    gram_names: dict[str, list[int]] = {}
+    for name_id, text in enumerate(names):
+        for gram in name_grams(text):
+            gram_names.setdefault(gram, []).append(name_id)
+    grams = sorted(gram_names, key=lambda gram: gram.encode("utf-8"))
+
+    names_blob, names_offsets = _string_table([text.encode("utf-8") for text in names])
+    grams_blob, grams_offsets = _string_table([gram.encode("utf-8") for gram in grams])
+    rows_blob, rows_offsets = _string_table(
+        [json.dumps(row, ensure_ascii=False, separators=(",", ":"), default=_json_default).encode("utf-8") for row in rows]
+    )
+    name_rows_offsets, name_rows_ids = _csr([name_rows[text] for text in names])
+    postings_offsets, postings_ids = _csr([gram_names[gram] for gram in grams])
+    return {
+        "names": names_blob,
+        "names_offsets": names_offsets,
+        "name_rows_offsets": name_rows_offsets,
+        "name_rows": name_rows_ids,
+        "grams": grams_blob,
+        "grams_offsets": grams_offsets,
+        "postings_offsets": postings_offsets,
+        "postings": postings_ids,
+        "rows": rows_blob,
+        "rows_offsets": rows_offsets,
+    }
+
+
+def write_snapshot_artifact(
+    path: Path,
+    namespace: str,
+    source_id: str,
+    snapshot_id: str,
+    tables: dict[str, list[dict[str, Any]]],
+) -> Path:
+    """Write one snapshot's lookup tables to ``path``; the file is replaced atomically."""
+    sections: list[bytes] = []
+    layout: dict[str, dict[str, list[Any]]] = {}
+    position = 0
+    for kind in _ARTIFACT_TABLES:
+        layout[kind] = {}
+        for name, value in _table_sections(kind, tables.get(kind) or []).items():
+            body = value.tobytes() if isinstance(value, array) else value
+            typecode = value.typecode if isinstance(value, array) else "B"
+            layout[kind][name] = [position, len(body), typecode]
+            padding = -len(body) % 8
+            sections.append(body + b"\0" * padding)
+            position += len(body) + padding
+    header = json.dumps(
+        {
+            "format": _FORMAT_VERSION,
+            "byteorder": sys.byteorder,
+            "namespace": namespace,
+            "source_id": source_id,
+            "snapshot_id": snapshot_id,
+            "tables": layout,
+        },
+        separators=(",", ":"),
+    ).encode("utf-8")
+    preamble = _MAGIC + len(header).to_bytes(4, "little") + header
+    preamble += b"\0" * (-len(preamble) % 8)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with tmp.open("wb") as handle:
+        handle.write(preamble)
+        for body in sections:
+            handle.write(body)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(tmp, path)
+    return path
+
+
+class _TableView:
+    def __init__(self, view: memoryview, base: int, layout: dict[str, list[Any]]) -> None:
+        for name, (offset, length, typecode) in layout.items():
+            section = view[base + offset : base + offset + length]
+            setattr(self, name, section.cast(typecode) if typecode != "B" else section)
+
+    def _find_gram(self, gram: bytes) -> int:
+        lo, hi = 0, len(self.grams_offsets) - 1
+        while lo < hi:
+            mid = (lo + hi) // 2
+            probe = bytes(self.grams[self.grams_offsets[mid] : self.grams_offsets[mid + 1]])
+            if probe < gram:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(self.grams_offsets) - 1 and bytes(self.grams[self.grams_offsets[lo] : self.grams_offsets[lo + 1]]) == gram:
+            return lo
+        return -1
+
+    def _row(self, pos: int) -> dict[str, Any]:
+        return json.loads(bytes(self.rows[self.rows_offsets[pos] : self.rows_offsets[pos + 1]]))
+
+    def search(self, term: str) -> list[dict[str, Any]]:
+        if not term:
+            return [self._row(pos) for pos in range(len(self.rows_offsets) - 1)]
+        postings: list[memoryview] = []
+        for gram in term_grams(term):
+            gram_id = self._find_gram(gram.encode("utf-8"))
+            if gram_id < 0:
+                return []
+            postings.append(self.postings[self.postings_offsets[gram_id] : self.postings_offsets[gram_id + 1]])
+        needle = term.encode("utf-8")
+        positions: set[int] = set()
+        for name_id in min(postings, key=len):
+            # UTF-8 is self-synchronizing: a byte-level match is a character-level match.
+            if needle in bytes(self.names[self.names_offsets[name_id] : self.names_offsets[name_id + 1]]):
+                positions.update(self.name_rows[self.name_rows_offsets[name_id] : self.name_rows_offsets[name_id + 1]])
+        return [self._row(pos) for pos in sorted(positions)]
+
+
+class SnapshotArtifact:
+    """Read-only view of one snapshot artifact; sections stay in the shared page cache."""
+
+    def __init__(self, path: Path) -> None:
+        with Path(path).open("rb") as handle:
+            self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            stat = os.fstat(handle.fileno())
+        self.file_version = (stat.st_ino, stat.st_mtime_ns)
+        view = memoryview(self._mmap)
+        if bytes(view[: len(_MAGIC)]) != _MAGIC:
+            raise ValueError(f"not_a_trust_snapshot_artifact:{path}")
+        header_len = int.from_bytes(view[len(_MAGIC) : len(_MAGIC) + 4], "little")
+        start = len(_MAGIC) + 4
+        header = json.loads(bytes(view[start : start + header_len]))
+        if header.get("format") != _FORMAT_VERSION or header.get("byteorder") != sys.byteorder:
+            raise ValueError(f"unsupported_trust_snapshot_artifact:{path}")
+        base = start + header_len + (-(start + header_len) % 8)
+        self.namespace = str(header["namespace"])
+        self.source_id = str(header["source_id"])
+        self.snapshot_id = str(header["snapshot_id"])
+        self._tables = {kind: _TableView(view, base, layout) for kind, layout in header["tables"].items()}
+
+    def search(self, kind: str, term: Any) -> list[dict[str, Any]]:
+        return self._tables[kind].search(normalize_name(term))
+
+
+class SnapshotArtifactStore:
+    """Writes snapshot artifacts and the per-namespace manifest of active ones.
+
+    Enabled when ``TRUST_SNAPSHOT_ARTIFACT_DIR`` is set. ``publish`` writes
+    ``<dir>/<namespace key>/<source key>/<snapshot key>.trustmm``; ``activate`` points the
+    namespace's ``active.json`` at it and removes the source's artifacts beyond the active one
+    and the ``TRUST_SNAPSHOT_RETAIN`` newest others. Workers that still map a removed file keep
+    reading it until they reopen the manifest. Manifest updates hold a file lock next to the
+    manifest, so API processes sharing the directory do not overwrite each other's entries.
+    """
+
+    def __init__(self, directory: Optional[str] = None) -> None:
+        configured = directory if directory is not None else os.getenv("TRUST_SNAPSHOT_ARTIFACT_DIR")
+        self._dir = Path(configured) if str(configured or "").strip() else None
+        self._lock = threading.Lock()
+
+    def enabled(self) -> bool:
+        return self._dir is not None
+
+    def artifact_path(self, namespace: str, source_id: str, snapshot_id: str) -> Path:
+        assert self._dir is not None
+        return self._dir / _path_key(namespace) / _path_key(source_id) / f"{_path_key(snapshot_id)}.trustmm"
+
+    def publish(self, namespace: str, source_id: str, snapshot_id: str, tables: dict[str, list[dict[str, Any]]]) -> None:
+        if not self.enabled():
+            return
+        assert self._dir is not None
+        path = self.artifact_path(namespace, source_id, snapshot_id)
+        write_snapshot_artifact(path, namespace, source_id, snapshot_id, tables)
+        manifest_path = self._dir / _path_key(namespace) / _MANIFEST
+        manifest = _read_manifest(manifest_path) or {"sources": {}}
+        if manifest["sources"].get(source_id, {}).get("snapshot_id") == snapshot_id:
+            # Republished while active: bump the manifest so readers remap the new file.
+            os.utime(manifest_path)
+
+    def activate(
+        self,
+        namespace: str,
+        source_id: str,
+        snapshot_id: str,
+        rebuild: Optional[Callable[[], Optional[dict[str, list[dict[str, Any]]]]]] = None,
+    ) -> None:
+        """Point the namespace manifest at the source's ``snapshot_id`` artifact.
+
+        The on-disk manifest is compared, not what this process last wrote. A missing artifact
+        (published before the directory was configured, or retired since) is rebuilt from the
+        tables ``rebuild`` returns; without them the source's entry is removed so workers stop
+        serving the previously active snapshot.
+        """
+        if not self.enabled():
+            return
+        assert self._dir is not None
+        path = self.artifact_path(namespace, source_id, snapshot_id)
+        manifest_path = self._dir / _path_key(namespace) / _MANIFEST
+        relative = str(path.relative_to(manifest_path.parent))
+        current = (_read_manifest(manifest_path) or {"sources": {}})["sources"].get(source_id, {})
+        if current.get("path") == relative and path.exists():
+            return
+        with self._manifest_lock(manifest_path):
+            if not path.exists():
+                tables = rebuild() if rebuild is not None else None
+                if tables is not None:
+                    write_snapshot_artifact(path, namespace, source_id, snapshot_id, tables)
+            manifest = _read_manifest(manifest_path) or {"namespace": namespace, "sources": {}}
+            if path.exists():
+                manifest["sources"][source_id] = {"snapshot_id": snapshot_id, "path": relative}
+            elif manifest["sources"].pop(source_id, None) is None:
+                return
+            tmp = manifest_path.with_name(f".{_MANIFEST}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(manifest, ensure_ascii=False, sort_keys=True), encoding="utf-8")
+            os.replace(tmp, manifest_path)
+            if path.exists():
+                self._retire(path)
+
+    @contextmanager
+    def _manifest_lock(self, manifest_path: Path) -> Iterator[None]:
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock, (manifest_path.parent / _MANIFEST_LOCK).open("a") as handle:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+    def _retire(self, active: Path) -> None:
+        keep = max(1, int(str(os.getenv("TRUST_SNAPSHOT_RETAIN") or "3")))
+        others = sorted(
+            (item for item in active.parent.glob("*.trustmm") if item != active),
+            key=lambda item: item.stat().st_mtime_ns,
+            reverse=True,
+        )
+        for stale in others[keep:]:
+            stale.unlink(missing_ok=True)
+
+
+def _read_manifest(path: Path) -> Optional[dict[str, Any]]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+
+
+class MmapTrustProvider:
+    """Read-only trust provider over the active snapshot artifacts of a directory.
+
+    Implements the ``query_*`` calls of ``TrustRepository`` for worker processes: every process
+    maps the same files, so they share one page-cached copy and open in constant time. Each
+    lookup stats the namespace manifest and remaps when a promote replaced it. Ranking matches
+    the repository's in-memory fallback; ``min_similarity`` is accepted for interface parity.
+    """
+
+    def __init__(self, directory: Optional[str] = None) -> None:
+        configured = directory if directory is not None else os.getenv("TRUST_SNAPSHOT_ARTIFACT_DIR")
+        if not str(configured or "").strip():
+            raise ValueError("TRUST_SNAPSHOT_ARTIFACT_DIR must be set for MmapTrustProvider")
+        self._dir = Path(str(configured))
+        self._lock = threading.Lock()
+        self._loaded: dict[str, tuple[int, tuple[SnapshotArtifact, ...]]] = {}
+
+    def _artifacts(self, namespace: str) -> tuple[SnapshotArtifact, ...]:
+        manifest_path = self._dir / _path_key(namespace) / _MANIFEST
+        try:
+            version = manifest_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return ()
+        loaded = self._loaded.get(namespace)
+        if loaded and loaded[0] == version:
+            return loaded[1]
+        with self._lock:
+            loaded = self._loaded.get(namespace)
+            if loaded and loaded[0] == version:
+                return loaded[1]
+            current = {item.snapshot_id: item for item in (loaded[1] if loaded else ())}
+            manifest = _read_manifest(manifest_path) or {"sources": {}}
+            artifacts = []
+            for entry in manifest["sources"].values():
+                path = manifest_path.parent / entry["path"]
+                try:
+                    stat = os.stat(path)
+                    artifact = current.get(entry["snapshot_id"])
+                    if artifact is None or artifact.file_version != (stat.st_ino, stat.st_mtime_ns):
+                        artifact = SnapshotArtifact(path)
+                except FileNotFoundError:
+                    continue
+                artifacts.append(artifact)
+            self._loaded[namespace] = (version, tuple(artifacts))
+            return self._loaded[namespace][1]
+
+    def _search(self, namespace: str, kind: str, name: str) -> list[dict[str, Any]]:
+        rows: list[dict[str, Any]] = []
+        for artifact in self._artifacts(namespace):
+            rows.extend(artifact.search(kind, name))
+        return rows
+
+    def query_admin_division(
+        self,
+        namespace: str,
+        name: str,
+        parent_hint: Optional[str] = None,
+        min_similarity: Optional[float] = None,
+    ) -> list[dict[str, Any]]:
+        return ranked_matches("admin_division", self._search(namespace, "admin_division", name), name, parent_hint)
+
+    def query_road(
+        self,
+        namespace: str,
+        name: str,
+        adcode_hint: Optional[str] = None,
+        min_similarity: Optional[float] = None,
+    ) -> list[dict[str, Any]]:
+        return ranked_matches("road", self._search(namespace, "road", name), name, adcode_hint)
+
+    def query_poi(
+        self,
+        namespace: str,
+        name: str,
+        adcode_hint: Optional[str] = None,
+        top_k: int = 5,
+        min_similarity: Optional[float] = None,
+    ) -> list[dict[str, Any]]:
+        return ranked_matches("poi", self._search(namespace, "poi", name), name, adcode_hint)[:top_k]
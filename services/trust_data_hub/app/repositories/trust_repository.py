@@ -10,7 +10,9 @@ from uuid import uuid4
 
 from services.trust_data_hub.app.execution.fetchers import fetch_payload
 from services.trust_data_hub.app.execution.parsers import parse_raw_payload
+from services.trust_data_hub.app.repositories.memory_index import TrustMemoryIndex, ranked_matches
 from services.trust_data_hub.app.repositories.metadb_persister import MetaDbPersister
+from services.trust_data_hub.app.repositories.snapshot_artifact import SnapshotArtifactStore
 from services.trust_data_hub.app.repositories.trustdb_persister import TrustDbPersister
 
 VALIDATION_SCHEMA_VERSION = "trust.validation.v1"
@@ -28,6 +30,21 @@ def _source_key(namespace: str, source_id: str) -> str:
     return f"{namespace}::{source_id}"
 
 
+def _lookup_tables(namespace: str, snapshot: dict[str, Any]) -> dict[str, list[dict[str, Any]]]:
+    """A snapshot's payload as the lookup rows the memory index and artifacts serve."""
+    payload = snapshot.get("payload") or {}
+    owner = {"namespace": namespace, "source_id": snapshot["source_id"], "snapshot_id": snapshot["snapshot_id"]}
+    return {
+        "admin_division": [
+            {**row, "valid_from": snapshot["fetched_at"], "valid_to": None, **owner}
+            for row in payload.get("admin_division", [])
+        ],
+        "road": [{**row, **owner} for row in payload.get("roads", [])],
+        "poi": [{**row, **owner} for row in payload.get("pois", [])],
+        "place": [{**row, **owner} for row in payload.get("places", [])],
+    }
+
+
 FIXTURE_DATASETS: dict[str, dict[str, Any]] = {
     "admin_v1": {
         "admin_division": [
@@ -119,10 +136,7 @@ class _MemoryStore:
     published_snapshots: set[str] = field(default_factory=set)
     active_release: dict[str, dict[str, Any]] = field(default_factory=dict)
     audit_events: list[dict[str, Any]] = field(default_factory=list)
-    admin_division: list[dict[str, Any]] = field(default_factory=list)
-    road_index: list[dict[str, Any]] = field(default_factory=list)
-    poi_index: list[dict[str, Any]] = field(default_factory=list)
-    place_name_index: list[dict[str, Any]] = field(default_factory=list)
+    lookup_index: TrustMemoryIndex = field(default_factory=TrustMemoryIndex)
     validation_replay_runs: list[dict[str, Any]] = field(default_factory=list)
 
 
@@ -131,6 +145,7 @@ class TrustRepository:
         self._memory = _MemoryStore()
         self._metadb = MetaDbPersister()
         self._trustdb = TrustDbPersister()
+        self._artifacts = SnapshotArtifactStore()
         if not self._metadb.enabled():
             raise RuntimeError(
                 "TRUST_META_DATABASE_URL/DATABASE_URL must be postgresql:// in PG-only mode for Trust Data Hub."
@@ -140,6 +155,10 @@ class TrustRepository:
                 "TRUST_TRUSTDB_DSN/DATABASE_URL must be postgresql:// in PG-only mode for Trust Data Hub."
             )
 
+    def _memory_index_enabled(self) -> bool:
+        # The memory index serves deployments without trust_data tables; with them it is opt-in.
+        return not self._trustdb.enabled() or os.getenv("TRUST_MEMORY_INDEX_ENABLED", "0") == "1"
+
     def _append_audit(
         self,
         namespace: str,
@@ -437,38 +456,9 @@ class TrustRepository:
         source_id = snapshot["source_id"]
         payload = snapshot["payload"]
 
-        self._memory.admin_division = [
-            x for x in self._memory.admin_division if not (x["namespace"] == namespace and x["source_id"] == source_id)
-        ]
-        self._memory.road_index = [
-            x for x in self._memory.road_index if not (x["namespace"] == namespace and x["source_id"] == source_id)
-        ]
-        self._memory.poi_index = [
-            x for x in self._memory.poi_index if not (x["namespace"] == namespace and x["source_id"] == source_id)
-        ]
-        self._memory.place_name_index = [
-            x for x in self._memory.place_name_index if not (x["namespace"] == namespace and x["source_id"] == source_id)
-        ]
-
-        for row in payload.get("admin_division", []):
-            self._memory.admin_division.append(
-                {
-                    **row,
-                    "namespace": namespace,
-                    "valid_from": snapshot["fetched_at"],
-                    "valid_to": None,
-                    "source_id": source_id,
-                    "snapshot_id": snapshot_id,
-                }
-            )
-        for row in payload.get("roads", []):
-            self._memory.road_index.append({**row, "namespace": namespace, "source_id": source_id, "snapshot_id": snapshot_id})
-        for row in payload.get("pois", []):
-            self._memory.poi_index.append({**row, "namespace": namespace, "source_id": source_id, "snapshot_id": snapshot_id})
-        for row in payload.get("places", []):
-            self._memory.place_name_index.append(
-                {**row, "namespace": namespace, "source_id": source_id, "snapshot_id": snapshot_id}
-            )
+        lookup_tables = _lookup_tables(namespace, snapshot)
+        if self._memory_index_enabled():
+            self._memory.lookup_index.publish(namespace, source_id, snapshot_id, lookup_tables)
 
         storage_backend = "memory"
         if self._trustdb.enabled():
@@ -477,6 +467,11 @@ class TrustRepository:
                 storage_backend = "postgres"
             except Exception as exc:
                 raise RuntimeError(f"trustdb_persist_failed:{exc}") from exc
+        if self._artifacts.enabled():
+            try:
+                self._artifacts.publish(namespace, source_id, snapshot_id, lookup_tables)
+            except OSError as exc:
+                raise RuntimeError(f"snapshot_artifact_write_failed:{exc}") from exc
 
         self._memory.published_snapshots.add(snapshot_id)
         job = {
@@ -520,9 +515,9 @@ class TrustRepository:
             "activated_at": _utc_now().isoformat(),
             "activation_note": activation_note,
         }
-        self._memory.active_release[_source_key(namespace, source_id)] = row
         if self._metadb.enabled():
             self._metadb.upsert_active_release(namespace, source_id, row)
+        self._set_active_release(row)
         self._append_audit(
             namespace,
             activated_by,
@@ -564,62 +559,117 @@ class TrustRepository:
     def get_active_release(self, namespace: str, source_id: str) -> Optional[dict[str, Any]]:
         db_row = self._metadb.get_active_release(namespace, source_id)
         if db_row:
-            self._memory.active_release[_source_key(namespace, source_id)] = db_row
+            self._set_active_release({**db_row, "namespace": namespace, "source_id": source_id})
             return db_row
         row = self._memory.active_release.get(_source_key(namespace, source_id))
         return row
 
-    def _active_snapshot_ids(self, namespace: str) -> set[str]:
-        return {
-            item["active_snapshot_id"]
-            for item in self._memory.active_release.values()
-            if item.get("namespace") == namespace
-        }
+    def _set_active_release(self, row: dict[str, Any]) -> None:
+        key = _source_key(row["namespace"], row["source_id"])
+        previous = self._memory.active_release.get(key)
+        self._memory.active_release[key] = row
+        if not previous or previous.get("active_snapshot_id") != row["active_snapshot_id"]:
+            self._trustdb.invalidate_active(row["namespace"])
+        if self._memory_index_enabled():
+            self._memory.lookup_index.activate(row["namespace"], row["source_id"], row["active_snapshot_id"])
+        self._artifacts.activate(
+            row["namespace"],
+            row["source_id"],
+            row["active_snapshot_id"],
+            rebuild=lambda: self._snapshot_lookup_tables(row["namespace"], row["active_snapshot_id"]),
+        )
 
-    def query_admin_division(self, namespace: str, name: str, parent_hint: Optional[str] = None) -> list[dict[str, Any]]:
-        rows = self._trustdb.query_admin_division(namespace, name, parent_hint)
+    def _snapshot_lookup_tables(self, namespace: str, snapshot_id: str) -> Optional[dict[str, list[dict[str, Any]]]]:
+        snapshot = self.get_snapshot(namespace, snapshot_id)
+        return _lookup_tables(namespace, snapshot) if snapshot else None
+
+    def query_admin_division(
+        self,
+        namespace: str,
+        name: str,
+        parent_hint: Optional[str] = None,
+        min_similarity: Optional[float] = None,
+    ) -> list[dict[str, Any]]:
+        rows = self._trustdb.query_admin_division(namespace, name, parent_hint, min_similarity=min_similarity)
         if rows:
             return rows
-        active_ids = self._active_snapshot_ids(namespace)
-        items: list[dict[str, Any]] = []
-        for row in self._memory.admin_division:
-            if row["namespace"] != namespace or row["snapshot_id"] not in active_ids:
-                continue
-            if name in str(row.get("name") or "") or name in "".join(row.get("name_aliases") or []):
-                if parent_hint and parent_hint != row.get("parent_adcode"):
-                    continue
-                items.append(row)
-        return items
+        return self._memory_admin_division(namespace, name, parent_hint)
+
+    def _memory_admin_division(self, namespace: str, name: str, parent_hint: Optional[str]) -> list[dict[str, Any]]:
+        rows = self._memory.lookup_index.search(namespace, "admin_division", name)
+        return ranked_matches("admin_division", rows, name, parent_hint)
 
-    def query_road(self, namespace: str, name: str, adcode_hint: Optional[str] = None) -> list[dict[str, Any]]:
-        rows = self._trustdb.query_road(namespace, name, adcode_hint)
+    def query_road(
+        self,
+        namespace: str,
+        name: str,
+        adcode_hint: Optional[str] = None,
+        min_similarity: Optional[float] = None,
+    ) -> list[dict[str, Any]]:
+        rows = self._trustdb.query_road(namespace, name, adcode_hint, min_similarity=min_similarity)
         if rows:
             return rows
-        active_ids = self._active_snapshot_ids(namespace)
-        items: list[dict[str, Any]] = []
-        for row in self._memory.road_index:
-            if row["namespace"] != namespace or row["snapshot_id"] not in active_ids:
-                continue
-            if name in str(row.get("name") or "") or name in str(row.get("normalized_name") or ""):
-                if adcode_hint and adcode_hint != row.get("admin_adcode"):
-                    continue
-                items.append(row)
-        return items
+        return self._memory_road(namespace, name, adcode_hint)
 
-    def query_poi(self, namespace: str, name: str, adcode_hint: Optional[str] = None, top_k: int = 5) -> list[dict[str, Any]]:
-        rows = self._trustdb.query_poi(namespace, name, adcode_hint, top_k=top_k)
+    def _memory_road(self, namespace: str, name: str, adcode_hint: Optional[str]) -> list[dict[str, Any]]:
+        rows = self._memory.lookup_index.search(namespace, "road", name)
+        return ranked_matches("road", rows, name, adcode_hint)
+
+    def query_poi(
+        self,
+        namespace: str,
+        name: str,
+        adcode_hint: Optional[str] = None,
+        top_k: int = 5,
+        min_similarity: Optional[float] = None,
+    ) -> list[dict[str, Any]]:
+        rows = self._trustdb.query_poi(namespace, name, adcode_hint, top_k=top_k, min_similarity=min_similarity)
         if rows:
             return rows[:top_k]
-        active_ids = self._active_snapshot_ids(namespace)
-        items: list[dict[str, Any]] = []
-        for row in self._memory.poi_index:
-            if row["namespace"] != namespace or row["snapshot_id"] not in active_ids:
-                continue
-            if name in str(row.get("name") or "") or name in str(row.get("normalized_name") or ""):
-                if adcode_hint and adcode_hint != row.get("admin_adcode"):
-                    continue
-                items.append(row)
-        return items[:top_k]
+        return self._memory_poi(namespace, name, adcode_hint)[:top_k]
+
+    def _memory_poi(self, namespace: str, name: str, adcode_hint: Optional[str]) -> list[dict[str, Any]]:
+        rows = self._memory.lookup_index.search(namespace, "poi", name)
+        return ranked_matches("poi", rows, name, adcode_hint)
+
+    # Bulk variants resolve each distinct name once (one SQL round-trip for the batch)
+    # and return {name: candidates}, with the same per-name results as the single queries.
+    def query_admin_division_many(
+        self,
+        namespace: str,
+        names: list[str],
+        parent_hint: Optional[str] = None,
+        min_similarity: Optional[float] = None,
+    ) -> dict[str, list[dict[str, Any]]]:
+        found = self._trustdb.query_admin_division_many(namespace, names, parent_hint, min_similarity=min_similarity)
+        return {
+            name: found.get(name) or self._memory_admin_division(namespace, name, parent_hint)
+            for name in dict.fromkeys(names)
+        }
+
+    def query_road_many(
+        self,
+        namespace: str,
+        names: list[str],
+        adcode_hint: Optional[str] = None,
+        min_similarity: Optional[float] = None,
+    ) -> dict[str, list[dict[str, Any]]]:
+        found = self._trustdb.query_road_many(namespace, names, adcode_hint, min_similarity=min_similarity)
+        return {name: found.get(name) or self._memory_road(namespace, name, adcode_hint) for name in dict.fromkeys(names)}
+
+    def query_poi_many(
+        self,
+        namespace: str,
+        names: list[str],
+        adcode_hint: Optional[str] = None,
+        top_k: int = 5,
+        min_similarity: Optional[float] = None,
+    ) -> dict[str, list[dict[str, Any]]]:
+        found = self._trustdb.query_poi_many(namespace, names, adcode_hint, top_k=top_k, min_similarity=min_similarity)
+        return {
+            name: (found.get(name) or self._memory_poi(namespace, name, adcode_hint))[:top_k]
+            for name in dict.fromkeys(names)
+        }
 
     def _normalized_validation_inputs(self, payload: dict[str, Any]) -> dict[str, str]:
         return {
@@ -1,10 +1,23 @@
 from __future__ import annotations
 
+import io
 import json
 import os
-from typing import Any, Optional
+import threading
+import time
+import unicodedata
+from typing import Any, Callable, Optional
 
-from services.trust_data_hub.app.repositories.schema_bootstrap import ensure_trust_pg_schema
+from services.trust_data_hub.app.repositories.pg_engine import shared_engine
+from services.trust_data_hub.app.repositories.schema_bootstrap import (
+    SNAPSHOT_PARTITIONED_TABLES,
+    ensure_trust_pg_schema,
+    snapshot_partition_name,
+)
+
+# Lookups bind the namespace's active snapshot ids as a plain array so the planner prunes to the
+# active snapshot partitions instead of joining every partition against active_release.
+_ACTIVE_SNAPSHOTS = "CAST(:snapshots AS text[])"
 
 
 class TrustDbPersister:
@@ -15,6 +28,10 @@ class TrustDbPersister:
             or os.getenv("TRUST_META_DATABASE_URL")
         )
         ensure_trust_pg_schema(self._dsn)
+        self._trgm: Optional[bool] = None
+        self._active_lock = threading.Lock()
+        self._active: dict[str, tuple[float, tuple[str, ...]]] = {}
+        self._active_generation = 0
 
     def enabled(self) -> bool:
         return bool(self._dsn and str(self._dsn).startswith("postgresql"))
@@ -27,202 +44,305 @@ class TrustDbPersister:
         payload: dict[str, Any],
         fetched_at: str,
     ) -> None:
+        """Load ``payload`` as the trust_data partitions of ``snapshot_id``.
+
+        Rows are shaped in batches and streamed with COPY into standalone tables; primary keys and
+        the parent's indexes are built after the load, then each table is attached as the
+        snapshot's partition. Readers only see the rows once ``promote_active`` points the active
+        release at the snapshot. Older published snapshots of the source beyond
+        ``TRUST_SNAPSHOT_RETAIN`` are retired afterwards.
+        """
         if not self.enabled():
             return
 
-        from sqlalchemy import create_engine, text
+        from sqlalchemy import text
 
-        engine = create_engine(self._dsn)
-        admin_rows = list(payload.get("admin_division") or [])
-        road_rows = list(payload.get("roads") or [])
-        poi_rows = list(payload.get("pois") or [])
-        place_rows = list(payload.get("places") or [])
+        engine = shared_engine(self._dsn)
+        page_size = max(1, int(str(os.getenv("TRUST_BULK_PAGE_SIZE") or "5000")))
+        literal = str(snapshot_id).replace("'", "''")
+        loaded: list[tuple[str, str]] = []
+        with engine.connect() as conn:
+            try:
+                for table, (payload_key, columns, shape) in _SNAPSHOT_TABLES.items():
+                    stage = f"{snapshot_partition_name(table, snapshot_id)}_load"
+                    with conn.begin():
+                        conn.execute(text(f"DROP TABLE IF EXISTS trust_data.{stage}"))
+                        conn.execute(text(f"CREATE TABLE trust_data.{stage} (LIKE trust_data.{table} INCLUDING DEFAULTS)"))
+                        loaded.append((table, stage))
+                        rows = list(payload.get(payload_key) or [])
+                        for offset in range(0, len(rows), page_size):
+                            batch = shape(rows[offset : offset + page_size], namespace, source_id, snapshot_id, fetched_at)
+                            _copy_rows(conn, f"trust_data.{stage}", columns, batch)
+                        # Index after the load; the CHECK lets ATTACH skip its validation scan.
+                        conn.execute(
+                            text(f"ALTER TABLE trust_data.{stage} ADD PRIMARY KEY ({', '.join(SNAPSHOT_PARTITIONED_TABLES[table])})")
+                        )
+                        for index_sql in _partition_index_sql(conn, table, stage):
+                            conn.execute(text(index_sql))
+                        conn.execute(
+                            text(f"ALTER TABLE trust_data.{stage} ADD CONSTRAINT {stage}_snapshot CHECK (snapshot_id = '{literal}')")
+                        )
+                        conn.execute(text(f"ANALYZE trust_data.{stage}"))
+                with conn.begin():
+                    for table, stage in loaded:
+                        partition = snapshot_partition_name(table, snapshot_id)
+                        # Re-publishing a snapshot replaces its partition.
+                        conn.execute(text(f"DROP TABLE IF EXISTS trust_data.{partition}"))
+                        conn.execute(text(f"ALTER TABLE trust_data.{stage} RENAME TO {partition}"))
+                        conn.execute(
+                            text(f"ALTER TABLE trust_data.{table} ATTACH PARTITION trust_data.{partition} FOR VALUES IN ('{literal}')")
+                        )
+                        conn.execute(text(f"ALTER TABLE trust_data.{partition} DROP CONSTRAINT {stage}_snapshot"))
+                    loaded = []
+            finally:
+                if loaded and not conn.closed and not conn.invalidated:
+                    with conn.begin():
+                        for _, stage in loaded:
+                            conn.execute(text(f"DROP TABLE IF EXISTS trust_data.{stage}"))
+        self.retire_snapshots(namespace, source_id)
 
-        with engine.begin() as conn:
-            conn.execute(
-                text("DELETE FROM trust_data.admin_division WHERE namespace_id=:ns AND source_id=:sid"),
-                {"ns": namespace, "sid": source_id},
-            )
-            conn.execute(
-                text("DELETE FROM trust_data.road_index WHERE namespace_id=:ns AND source_id=:sid"),
-                {"ns": namespace, "sid": source_id},
-            )
-            conn.execute(
-                text("DELETE FROM trust_data.poi_index WHERE namespace_id=:ns AND source_id=:sid"),
-                {"ns": namespace, "sid": source_id},
-            )
-            conn.execute(
-                text("DELETE FROM trust_data.place_name_index WHERE namespace_id=:ns AND source_id=:sid"),
-                {"ns": namespace, "sid": source_id},
-            )
+    def retire_snapshots(self, namespace: str, source_id: str, keep: Optional[int] = None) -> list[str]:
+        """Detach and drop partitions of the source's older published snapshots.
 
-            for row in admin_rows:
-                conn.execute(
-                    text(
-                        """
-                        INSERT INTO trust_data.admin_division
-                        (namespace_id, adcode, name, level, parent_adcode, name_aliases, valid_from, valid_to, source_id, snapshot_id,
-                         division_id, parent_id)
-                        VALUES
-                        (:ns, :adcode, :name, :level, :parent_adcode, CAST(:name_aliases AS jsonb), :valid_from, :valid_to, :source_id, :snapshot_id,
-                         :division_id, :parent_id)
-                        """
-                    ),
-                    {
-                        "ns": namespace,
-                        "adcode": row.get("adcode"),
-                        "name": row.get("name"),
-                        "level": row.get("level"),
-                        "parent_adcode": row.get("parent_adcode"),
-                        "name_aliases": json.dumps(row.get("name_aliases") or [], ensure_ascii=False),
-                        "valid_from": fetched_at,
-                        "valid_to": None,
-                        "source_id": source_id,
-                        "snapshot_id": snapshot_id,
-                        "division_id": row.get("adcode"),
-                        "parent_id": row.get("parent_adcode"),
-                    },
-                )
-
-            for row in road_rows:
-                conn.execute(
-                    text(
-                        """
-                        INSERT INTO trust_data.road_index
-                        (namespace_id, road_id, name, normalized_name, admin_adcode, geometry_ref, source_id, snapshot_id, alias_names, adcode)
-                        VALUES
-                        (:ns, :road_id, :name, :normalized_name, :admin_adcode, :geometry_ref, :source_id, :snapshot_id, CAST(:alias_names AS jsonb), :adcode)
-                        """
-                    ),
-                    {
-                        "ns": namespace,
-                        "road_id": row.get("road_id"),
-                        "name": row.get("name"),
-                        "normalized_name": row.get("normalized_name"),
-                        "admin_adcode": row.get("admin_adcode"),
-                        "geometry_ref": row.get("geometry_ref"),
-                        "source_id": source_id,
-                        "snapshot_id": snapshot_id,
-                        "alias_names": json.dumps(row.get("alias_names") or [], ensure_ascii=False),
-                        "adcode": row.get("admin_adcode"),
-                    },
-                )
-
-            for row in poi_rows:
-                centroid = str(row.get("centroid") or "")
-                lon = None
-                lat = None
-                if "," in centroid:
-                    parts = centroid.split(",", 1)
-                    try:
-                        lon = float(parts[0].strip())
-                        lat = float(parts[1].strip())
-                    except Exception:
-                        lon = None
-                        lat = None
-                conn.execute(
-                    text(
-                        """
-                        INSERT INTO trust_data.poi_index
-                        (namespace_id, poi_id, name, normalized_name, category, admin_adcode, centroid, source_id, snapshot_id, adcode, lon, lat)
-                        VALUES
-                        (:ns, :poi_id, :name, :normalized_name, :category, :admin_adcode, :centroid, :source_id, :snapshot_id, :adcode, :lon, :lat)
-                        """
-                    ),
-                    {
-                        "ns": namespace,
-                        "poi_id": row.get("poi_id"),
-                        "name": row.get("name"),
-                        "normalized_name": row.get("normalized_name"),
-                        "category": row.get("category"),
-                        "admin_adcode": row.get("admin_adcode"),
-                        "centroid": row.get("centroid"),
-                        "source_id": source_id,
-                        "snapshot_id": snapshot_id,
-                        "adcode": row.get("admin_adcode"),
-                        "lon": lon,
-                        "lat": lat,
-                    },
-                )
-
-            for row in place_rows:
+        Only published snapshots (those with attached partitions) count. The active snapshot,
+        the release it replaced, snapshots published after it (still pending promotion) and the
+        ``keep`` most recently fetched others stay attached (``TRUST_SNAPSHOT_RETAIN``,
+        default 3). Returns the retired snapshot ids.
+        """
+        if not self.enabled():
+            return []
+        from sqlalchemy import text
+
+        keep = max(1, int(keep if keep is not None else str(os.getenv("TRUST_SNAPSHOT_RETAIN") or "3")))
+        engine = shared_engine(self._dsn)
+        params = {"ns": namespace, "sid": source_id}
+        with engine.connect() as conn:
+            snapshots = conn.execute(
+                text(
+                    """
+                    SELECT snapshot_id FROM trust_meta.source_snapshot
+                    WHERE namespace_id = :ns AND source_id = :sid
+                    ORDER BY fetched_at DESC, snapshot_id DESC
+                    """
+                ),
+                params,
+            ).scalars().all()
+            active = conn.execute(
+                text("SELECT active_snapshot_id FROM trust_meta.active_release WHERE namespace_id = :ns AND source_id = :sid"),
+                params,
+            ).scalar()
+            previous = conn.execute(
+                text(
+                    """
+                    SELECT target_ref FROM trust_meta.audit_event
+                    WHERE namespace_id = :ns AND action = 'activate' AND event_json->>'source_id' = :sid
+                      AND target_ref IS DISTINCT FROM CAST(:active AS text)
+                    ORDER BY created_at DESC
+                    LIMIT 1
+                    """
+                ),
+                {**params, "active": active},
+            ).scalar()
+            attached = set(
                 conn.execute(
                     text(
                         """
-                        INSERT INTO trust_data.place_name_index
-                        (namespace_id, place_id, name, normalized_name, type, admin_adcode, centroid, confidence_hint, source_id, snapshot_id, alias_names, category, adcode)
-                        VALUES
-                        (:ns, :place_id, :name, :normalized_name, :type, :admin_adcode, :centroid, :confidence_hint, :source_id, :snapshot_id, CAST(:alias_names AS jsonb), :category, :adcode)
+                        SELECT c.relname
+                        FROM pg_inherits i
+                        JOIN pg_class c ON c.oid = i.inhrelid
+                        WHERE i.inhparent = ANY(CAST(:parents AS regclass[]))
                         """
                     ),
-                    {
-                        "ns": namespace,
-                        "place_id": row.get("place_id"),
-                        "name": row.get("name"),
-                        "normalized_name": row.get("normalized_name"),
-                        "type": row.get("type"),
-                        "admin_adcode": row.get("admin_adcode"),
-                        "centroid": row.get("centroid"),
-                        "confidence_hint": row.get("confidence_hint"),
-                        "source_id": source_id,
-                        "snapshot_id": snapshot_id,
-                        "alias_names": json.dumps(row.get("alias_names") or [], ensure_ascii=False),
-                        "category": row.get("type"),
-                        "adcode": row.get("admin_adcode"),
-                    },
-                )
-
-    def query_admin_division(self, namespace: str, name: str, parent_hint: Optional[str] = None) -> list[dict[str, Any]]:
+                    {"parents": [f"trust_data.{table}" for table in SNAPSHOT_PARTITIONED_TABLES]},
+                ).scalars().all()
+            )
+            published = [
+                snapshot_id
+                for snapshot_id in snapshots
+                if any(snapshot_partition_name(table, snapshot_id) in attached for table in SNAPSHOT_PARTITIONED_TABLES)
+            ]
+            # Newest first: everything ahead of the active snapshot awaits promotion.
+            pending = published[: published.index(active)] if active in published else published
+            protected = {active, previous, *pending}
+            candidates = [snapshot_id for snapshot_id in published if snapshot_id != active][keep:]
+            candidates = [snapshot_id for snapshot_id in candidates if snapshot_id not in protected]
+            conn.rollback()
+            retired: list[str] = []
+            # DETACH ... CONCURRENTLY cannot run inside a transaction block; it never blocks readers.
+            autocommit = conn.execution_options(isolation_level="AUTOCOMMIT")
+            for snapshot_id in candidates:
+                partitions = [
+                    (table, snapshot_partition_name(table, snapshot_id))
+                    for table in SNAPSHOT_PARTITIONED_TABLES
+                    if snapshot_partition_name(table, snapshot_id) in attached
+                ]
+                for table, partition in partitions:
+                    autocommit.execute(text(f"ALTER TABLE trust_data.{table} DETACH PARTITION trust_data.{partition} CONCURRENTLY"))
+                    autocommit.execute(text(f"DROP TABLE trust_data.{partition}"))
+                if partitions:
+                    retired.append(snapshot_id)
+        return retired
+
+    def _trgm_enabled(self) -> bool:
         if not self.enabled():
-            return []
-        from sqlalchemy import create_engine, text
+            return False
+        if self._trgm is None:
+            from sqlalchemy import text
+
+            with shared_engine(self._dsn).connect() as conn:
+                self._trgm = bool(conn.execute(text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")).first())
+        return self._trgm
 
-        engine = create_engine(self._dsn)
-        sql = """
+    def _name_match(self, columns: tuple[str, ...], term: str) -> tuple[str, str]:
+        """Match predicate and rank score of ``term`` against name ``columns``.
+
+        Substring matches rank by how much of the name the term covers. With pg_trgm, rows also
+        match on trigram similarity and rank by the better of the two; coverage keeps CJK names
+        ranked on servers whose locale yields no trigrams for them. ``%`` keeps the match
+        index-backed at the connection's floor threshold (see ``pg_engine``) and the bound
+        ``:min_similarity`` applies the lookup's own threshold.
+        """
+        like = f"'%' || {term} || '%'"
+        scores = [
+            f"CASE WHEN {column} ILIKE {like} "
+            f"THEN CAST(char_length({term}) AS double precision) / GREATEST(char_length({column}), 1) ELSE 0 END"
+            for column in columns
+        ]
+        if self._trgm_enabled():
+            match = " OR ".join(
+                f"{column} ILIKE {like} OR ({column} % {term} AND similarity({column}, {term}) >= :min_similarity)"
+                for column in columns
+            )
+            scores += [f"similarity({column}, {term})" for column in columns]
+        else:
+            match = " OR ".join(f"{column} ILIKE {like}" for column in columns)
+        return f"({match})", f"GREATEST({', '.join(scores)})"
+
+    def _admin_match(self, term: str) -> tuple[str, str]:
+        name_match, name_score = self._name_match(("d.name",), term)
+        alias_match, alias_score = self._name_match(("a.normalized_alias",), term)
+        aliases = f"""
+            FROM trust_data.admin_division_alias a
+            WHERE a.namespace_id = d.namespace_id
+              AND a.snapshot_id = ANY({_ACTIVE_SNAPSHOTS})
+              AND a.snapshot_id = d.snapshot_id
+              AND a.adcode = d.adcode
+              AND {alias_match}
+        """
+        match = f"({name_match} OR EXISTS (SELECT 1 {aliases}))"
+        score = f"GREATEST({name_score}, COALESCE((SELECT MAX({alias_score}) {aliases}), 0))"
+        return match, score
+
+    @staticmethod
+    def _rank_column(score: str) -> str:
+        return f"CAST(ROUND(CAST({score} AS numeric), 4) AS double precision) AS rank_score"
+
+    def invalidate_active(self, namespace: str) -> None:
+        """Forget the cached active snapshot ids of ``namespace``, e.g. after a promote."""
+        with self._active_lock:
+            self._active.pop(namespace, None)
+            self._active_generation += 1
+
+    def _active_snapshots(self, conn: Any, namespace: str) -> tuple[str, ...]:
+        # Promotes in this process invalidate the entry; ones made by other processes are picked
+        # up once it expires (TRUST_ACTIVE_SNAPSHOT_TTL_SEC).
+        cached = self._active.get(namespace)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        from sqlalchemy import text
+
+        ttl = float(str(os.getenv("TRUST_ACTIVE_SNAPSHOT_TTL_SEC") or "5"))
+        generation = self._active_generation
+        snapshots = tuple(
+            conn.execute(
+                text("SELECT active_snapshot_id FROM trust_meta.active_release WHERE namespace_id = :ns"),
+                {"ns": namespace},
+            ).scalars().all()
+        )
+        with self._active_lock:
+            # Ids read before an invalidation may predate the promote; serve them, don't cache them.
+            if generation == self._active_generation:
+                self._active[namespace] = (time.monotonic() + ttl, snapshots)
+        return snapshots
+
+    def _query_active(
+        self,
+        namespace: str,
+        sql: str,
+        params: dict[str, Any],
+        min_similarity: Optional[float] = None,
+    ) -> list[dict[str, Any]]:
+        """Run a lookup against the namespace's active snapshot partitions (bound as ``:snapshots``).
+
+        ``min_similarity`` is the lookup's pg_trgm similarity threshold (default
+        ``TRUST_QUERY_SIMILARITY_THRESHOLD``, 0.3); values below the connection floor
+        ``TRUST_QUERY_SIMILARITY_FLOOR`` match like the floor.
+        """
+        from sqlalchemy import text
+
+        threshold = (
+            float(min_similarity)
+            if min_similarity is not None
+            else float(str(os.getenv("TRUST_QUERY_SIMILARITY_THRESHOLD") or "0.3"))
+        )
+        with shared_engine(self._dsn).connect() as conn:
+            snapshots = self._active_snapshots(conn, namespace)
+            if not snapshots:
+                return []
+            rows = conn.execute(
+                text(sql), {**params, "snapshots": list(snapshots), "min_similarity": threshold}
+            ).mappings().all()
+        return [dict(r) for r in rows]
+
+    def query_admin_division(
+        self,
+        namespace: str,
+        name: str,
+        parent_hint: Optional[str] = None,
+        min_similarity: Optional[float] = None,
+    ) -> list[dict[str, Any]]:
+        if not self.enabled():
+            return []
+        match, score = self._admin_match(":q")
+        sql = f"""
             SELECT d.adcode, d.name, d.level, d.parent_adcode, d.name_aliases,
-                   d.source_id, d.snapshot_id
+                   d.source_id, d.snapshot_id, {self._rank_column(score)}
             FROM trust_data.admin_division d
-            JOIN trust_meta.active_release ar
-              ON ar.namespace_id = d.namespace_id
-             AND ar.source_id = d.source_id
-             AND ar.active_snapshot_id = d.snapshot_id
             WHERE d.namespace_id = :ns
-              AND (d.name ILIKE :kw OR CAST(d.name_aliases AS text) ILIKE :kw)
+              AND d.snapshot_id = ANY({_ACTIVE_SNAPSHOTS})
+              AND {match}
         """
-        params: dict[str, Any] = {"ns": namespace, "kw": f"%{name}%"}
+        params: dict[str, Any] = {"ns": namespace, "q": name}
         if parent_hint:
             sql += " AND d.parent_adcode = :parent_hint"
             params["parent_hint"] = parent_hint
-        sql += " ORDER BY d.level, d.name LIMIT 50"
-        with engine.begin() as conn:
-            rows = conn.execute(text(sql), params).mappings().all()
-        return [dict(r) for r in rows]
+        sql += " ORDER BY rank_score DESC, d.level, d.name LIMIT 50"
+        return self._query_active(namespace, sql, params, min_similarity)
 
-    def query_road(self, namespace: str, name: str, adcode_hint: Optional[str] = None) -> list[dict[str, Any]]:
+    def query_road(
+        self,
+        namespace: str,
+        name: str,
+        adcode_hint: Optional[str] = None,
+        min_similarity: Optional[float] = None,
+    ) -> list[dict[str, Any]]:
         if not self.enabled():
             return []
-        from sqlalchemy import create_engine, text
-
-        engine = create_engine(self._dsn)
-        sql = """
+        match, score = self._name_match(("r.name", "r.normalized_name"), ":q")
+        sql = f"""
             SELECT r.road_id, r.name, r.normalized_name, r.admin_adcode, r.geometry_ref,
-                   r.source_id, r.snapshot_id
+                   r.source_id, r.snapshot_id, {self._rank_column(score)}
             FROM trust_data.road_index r
-            JOIN trust_meta.active_release ar
-              ON ar.namespace_id = r.namespace_id
-             AND ar.source_id = r.source_id
-             AND ar.active_snapshot_id = r.snapshot_id
             WHERE r.namespace_id = :ns
-              AND (r.name ILIKE :kw OR r.normalized_name ILIKE :kw)
+              AND r.snapshot_id = ANY({_ACTIVE_SNAPSHOTS})
+              AND {match}
         """
-        params: dict[str, Any] = {"ns": namespace, "kw": f"%{name}%"}
+        params: dict[str, Any] = {"ns": namespace, "q": name}
         if adcode_hint:
             sql += " AND r.admin_adcode = :adcode_hint"
             params["adcode_hint"] = adcode_hint
-        sql += " ORDER BY r.name LIMIT 50"
-        with engine.begin() as conn:
-            rows = conn.execute(text(sql), params).mappings().all()
-        return [dict(r) for r in rows]
+        sql += " ORDER BY rank_score DESC, r.name LIMIT 50"
+        return self._query_active(namespace, sql, params, min_similarity)
 
     def query_poi(
         self,
@@ -230,29 +350,320 @@ class TrustDbPersister:
         name: str,
         adcode_hint: Optional[str] = None,
         top_k: int = 5,
+        min_similarity: Optional[float] = None,
     ) -> list[dict[str, Any]]:
         if not self.enabled():
             return []
-        from sqlalchemy import create_engine, text
-
-        engine = create_engine(self._dsn)
-        sql = """
+        match, score = self._name_match(("p.name", "p.normalized_name"), ":q")
+        sql = f"""
             SELECT p.poi_id, p.name, p.normalized_name, p.category, p.admin_adcode, p.centroid,
-                   p.source_id, p.snapshot_id
+                   p.source_id, p.snapshot_id, {self._rank_column(score)}
             FROM trust_data.poi_index p
-            JOIN trust_meta.active_release ar
-              ON ar.namespace_id = p.namespace_id
-             AND ar.source_id = p.source_id
-             AND ar.active_snapshot_id = p.snapshot_id
             WHERE p.namespace_id = :ns
-              AND (p.name ILIKE :kw OR p.normalized_name ILIKE :kw)
+              AND p.snapshot_id = ANY({_ACTIVE_SNAPSHOTS})
+              AND {match}
         """
-        params: dict[str, Any] = {"ns": namespace, "kw": f"%{name}%"}
+        params: dict[str, Any] = {"ns": namespace, "q": name}
         if adcode_hint:
             sql += " AND p.admin_adcode = :adcode_hint"
             params["adcode_hint"] = adcode_hint
-        sql += " ORDER BY p.name LIMIT :top_k"
+        sql += " ORDER BY rank_score DESC, p.name LIMIT :top_k"
         params["top_k"] = max(1, int(top_k))
-        with engine.begin() as conn:
-            rows = conn.execute(text(sql), params).mappings().all()
-        return [dict(r) for r in rows]
+        return self._query_active(namespace, sql, params, min_similarity)
+
+    def _query_many(
+        self,
+        *,
+        select_sql: str,
+        match_sql: str,
+        order_sql: str,
+        names: list[str],
+        params: dict[str, Any],
+        limit: int,
+        min_similarity: Optional[float] = None,
+    ) -> dict[str, list[dict[str, Any]]]:
+        # One lookup query for all names: each distinct name is a row of the keyword CTE and
+        # keeps its own top-N via row_number(), mirroring the single-name queries.
+        distinct_names = list(dict.fromkeys(name for name in names if name))
+        results: dict[str, list[dict[str, Any]]] = {name: [] for name in distinct_names}
+        if not self.enabled() or not distinct_names:
+            return results
+        sql = f"""
+            WITH q AS (
+                SELECT DISTINCT unnest(CAST(:names AS text[])) AS query_name
+            )
+            SELECT ranked.*
+            FROM (
+                SELECT q.query_name, {select_sql},
+                       row_number() OVER (PARTITION BY q.query_name ORDER BY {order_sql}) AS query_rank
+                FROM q
+                {match_sql}
+            ) ranked
+            WHERE ranked.query_rank <= :row_limit
+            ORDER BY ranked.query_name, ranked.query_rank
+        """
+        rows = self._query_active(
+            params["ns"], sql, {**params, "names": distinct_names, "row_limit": limit}, min_similarity
+        )
+        for row in rows:
+            query_name = row.pop("query_name")
+            row.pop("query_rank", None)
+            results[query_name].append(row)
+        return results
+
+    def query_admin_division_many(
+        self,
+        namespace: str,
+        names: list[str],
+        parent_hint: Optional[str] = None,
+        min_similarity: Optional[float] = None,
+    ) -> dict[str, list[dict[str, Any]]]:
+        match, score = self._admin_match("q.query_name")
+        match_sql = f"""
+                JOIN trust_data.admin_division d
+                  ON d.namespace_id = :ns
+                 AND d.snapshot_id = ANY({_ACTIVE_SNAPSHOTS})
+                 AND {match}
+        """
+        params: dict[str, Any] = {"ns": namespace}
+        if parent_hint:
+            match_sql += " WHERE d.parent_adcode = :parent_hint"
+            params["parent_hint"] = parent_hint
+        return self._query_many(
+            select_sql=(
+                "d.adcode, d.name, d.level, d.parent_adcode, d.name_aliases, d.source_id, d.snapshot_id, "
+                + self._rank_column(score)
+            ),
+            match_sql=match_sql,
+            order_sql=f"{score} DESC, d.level, d.name",
+            names=names,
+            params=params,
+            limit=50,
+            min_similarity=min_similarity,
+        )
+
+    def query_road_many(
+        self,
+        namespace: str,
+        names: list[str],
+        adcode_hint: Optional[str] = None,
+        min_similarity: Optional[float] = None,
+    ) -> dict[str, list[dict[str, Any]]]:
+        match, score = self._name_match(("r.name", "r.normalized_name"), "q.query_name")
+        match_sql = f"""
+                JOIN trust_data.road_index r
+                  ON r.namespace_id = :ns
+                 AND r.snapshot_id = ANY({_ACTIVE_SNAPSHOTS})
+                 AND {match}
+        """
+        params: dict[str, Any] = {"ns": namespace}
+        if adcode_hint:
+            match_sql += " WHERE r.admin_adcode = :adcode_hint"
+            params["adcode_hint"] = adcode_hint
+        return self._query_many(
+            select_sql=(
+                "r.road_id, r.name, r.normalized_name, r.admin_adcode, r.geometry_ref, r.source_id, r.snapshot_id, "
+                + self._rank_column(score)
+            ),
+            match_sql=match_sql,
+            order_sql=f"{score} DESC, r.name",
+            names=names,
+            params=params,
+            limit=50,
+            min_similarity=min_similarity,
+        )
+
+    def query_poi_many(
+        self,
+        namespace: str,
+        names: list[str],
+        adcode_hint: Optional[str] = None,
+        top_k: int = 5,
+        min_similarity: Optional[float] = None,
+    ) -> dict[str, list[dict[str, Any]]]:
+        match, score = self._name_match(("p.name", "p.normalized_name"), "q.query_name")
+        match_sql = f"""
+                JOIN trust_data.poi_index p
+                  ON p.namespace_id = :ns
+                 AND p.snapshot_id = ANY({_ACTIVE_SNAPSHOTS})
+                 AND {match}
+        """
+        params: dict[str, Any] = {"ns": namespace}
+        if adcode_hint:
+            match_sql += " WHERE p.admin_adcode = :adcode_hint"
+            params["adcode_hint"] = adcode_hint
+        return self._query_many(
+            select_sql=(
+                "p.poi_id, p.name, p.normalized_name, p.category, p.admin_adcode, p.centroid, p.source_id, p.snapshot_id, "
+                + self._rank_column(score)
+            ),
+            match_sql=match_sql,
+            order_sql=f"{score} DESC, p.name",
+            names=names,
+            params=params,
+            limit=max(1, int(top_k)),
+            min_similarity=min_similarity,
+        )
+
+
+def _parse_centroid(centroid: str) -> tuple[Optional[float], Optional[float]]:
+    if "," not in centroid:
+        return None, None
+    lon, lat = centroid.split(",", 1)
+    try:
+        return float(lon.strip()), float(lat.strip())
+    except ValueError:
+        return None, None
+
+
+def _json_list(value: Any) -> str:
+    return json.dumps(value or [], ensure_ascii=False)
+
+
+# Row shaping runs once per COPY batch; every shaper returns tuples in its table's column order.
+def _shape_admin(rows: list[dict[str, Any]], ns: str, source_id: str, snapshot_id: str, fetched_at: str) -> list[tuple]:
+    return [
+        (
+            ns, row.get("adcode"), row.get("name"), row.get("level"), row.get("parent_adcode"),
+            _json_list(row.get("name_aliases")), fetched_at, None, source_id, snapshot_id,
+            row.get("adcode"), row.get("parent_adcode"),
+        )
+        for row in rows
+    ]
+
+
+def _normalize_alias(alias: Any) -> str:
+    return unicodedata.normalize("NFKC", str(alias or "")).strip().lower()
+
+
+def _shape_admin_alias(rows: list[dict[str, Any]], ns: str, source_id: str, snapshot_id: str, fetched_at: str) -> list[tuple]:
+    shaped = []
+    for row in rows:
+        seen: set[str] = set()
+        for alias in row.get("name_aliases") or []:
+            normalized = _normalize_alias(alias)
+            if normalized and normalized not in seen:
+                seen.add(normalized)
+                shaped.append((ns, row.get("adcode"), str(alias), normalized, source_id, snapshot_id))
+    return shaped
+
+
+def _shape_road(rows: list[dict[str, Any]], ns: str, source_id: str, snapshot_id: str, fetched_at: str) -> list[tuple]:
+    return [
+        (
+            ns, row.get("road_id"), row.get("name"), row.get("normalized_name"), row.get("admin_adcode"),
+            row.get("geometry_ref"), source_id, snapshot_id, _json_list(row.get("alias_names")), row.get("admin_adcode"),
+        )
+        for row in rows
+    ]
+
+
+def _shape_poi(rows: list[dict[str, Any]], ns: str, source_id: str, snapshot_id: str, fetched_at: str) -> list[tuple]:
+    shaped = []
+    for row in rows:
+        lon, lat = _parse_centroid(str(row.get("centroid") or ""))
+        shaped.append(
+            (
+                ns, row.get("poi_id"), row.get("name"), row.get("normalized_name"), row.get("category"),
+                row.get("admin_adcode"), row.get("centroid"), source_id, snapshot_id, row.get("admin_adcode"), lon, lat,
+            )
+        )
+    return shaped
+
+
+def _shape_place(rows: list[dict[str, Any]], ns: str, source_id: str, snapshot_id: str, fetched_at: str) -> list[tuple]:
+    return [
+        (
+            ns, row.get("place_id"), row.get("name"), row.get("normalized_name"), row.get("type"),
+            row.get("admin_adcode"), row.get("centroid"), row.get("confidence_hint"), source_id, snapshot_id,
+            _json_list(row.get("alias_names")), row.get("type"), row.get("admin_adcode"),
+        )
+        for row in rows
+    ]
+
+
+_SNAPSHOT_TABLES: dict[str, tuple[str, tuple[str, ...], Callable[..., list[tuple]]]] = {
+    "admin_division": (
+        "admin_division",
+        ("namespace_id", "adcode", "name", "level", "parent_adcode", "name_aliases", "valid_from", "valid_to",
+         "source_id", "snapshot_id", "division_id", "parent_id"),
+        _shape_admin,
+    ),
+    "admin_division_alias": (
+        "admin_division",
+        ("namespace_id", "adcode", "alias", "normalized_alias", "source_id", "snapshot_id"),
+        _shape_admin_alias,
+    ),
+    "road_index": (
+        "roads",
+        ("namespace_id", "road_id", "name", "normalized_name", "admin_adcode", "geometry_ref", "source_id",
+         "snapshot_id", "alias_names", "adcode"),
+        _shape_road,
+    ),
+    "poi_index": (
+        "pois",
+        ("namespace_id", "poi_id", "name", "normalized_name", "category", "admin_adcode", "centroid", "source_id",
+         "snapshot_id", "adcode", "lon", "lat"),
+        _shape_poi,
+    ),
+    "place_name_index": (
+        "places",
+        ("namespace_id", "place_id", "name", "normalized_name", "type", "admin_adcode", "centroid", "confidence_hint",
+         "source_id", "snapshot_id", "alias_names", "category", "adcode"),
+        _shape_place,
+    ),
+}
+
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _copy_text(rows: list[tuple]) -> str:
+    """Encode rows in COPY text format (tab separated, ``\\N`` for NULL)."""
+    return "".join(
+        "\t".join("\\N" if value is None else str(value).translate(_COPY_ESCAPES) for value in row) + "\n"
+        for row in rows
+    )
+
+
+def _partition_index_sql(conn: Any, table: str, stage: str) -> list[str]:
+    """The parent's secondary indexes, re-targeted at ``stage`` so ATTACH can adopt them."""
+    from sqlalchemy import text
+
+    rows = conn.execute(
+        text(
+            """
+            SELECT ic.relname AS indexname, pg_get_indexdef(ix.indexrelid) AS indexdef
+            FROM pg_index ix
+            JOIN pg_class ic ON ic.oid = ix.indexrelid
+            WHERE ix.indrelid = CAST(:table AS regclass)
+              AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = ix.indexrelid)
+            """
+        ),
+        {"table": f"trust_data.{table}"},
+    ).all()
+    return [
+        str(row.indexdef)
+        .replace(f"INDEX {row.indexname} ON ONLY trust_data.{table} ", f"INDEX ON trust_data.{stage} ", 1)
+        for row in rows
+    ]
+
+
+def _copy_rows(conn: Any, table: str, columns: tuple[str, ...], rows: list[tuple]) -> None:
+    if not rows:
+        return
+    copy_sql = f"COPY {table} ({', '.join(columns)}) FROM STDIN"
+    driver = conn.dialect.driver
+    if driver == "psycopg":
+        with conn.connection.driver_connection.cursor() as cursor:
+            with cursor.copy(copy_sql) as copy:
+                copy.write(_copy_text(rows))
+    elif driver == "psycopg2":
+        with conn.connection.driver_connection.cursor() as cursor:
+            cursor.copy_expert(copy_sql, io.StringIO(_copy_text(rows)))
+    else:
+        from sqlalchemy import text
+
+        conn.execute(
+            text(f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(':' + name for name in columns)})"),
+            [dict(zip(columns, row)) for row in rows],
+        )
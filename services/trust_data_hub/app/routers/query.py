@@ -9,14 +9,25 @@ from services.trust_data_hub.app.repositories.trust_repository import trust_repo
 router = APIRouter()
 
 
+# Candidates carry a rank_score and come best first; min_similarity tunes the pg_trgm fuzzy match.
 @router.get("/namespaces/{namespace}/admin-division")
-def query_admin_division(namespace: str, name: str = Query(...), parent_hint: Optional[str] = Query(default=None)) -> dict:
-    return {"candidates": trust_repository.query_admin_division(namespace, name, parent_hint)}
+def query_admin_division(
+    namespace: str,
+    name: str = Query(...),
+    parent_hint: Optional[str] = Query(default=None),
+    min_similarity: Optional[float] = Query(default=None, ge=0.0, le=1.0),
+) -> dict:
+    return {"candidates": trust_repository.query_admin_division(namespace, name, parent_hint, min_similarity)}
 
 
 @router.get("/namespaces/{namespace}/road")
-def query_road(namespace: str, name: str = Query(...), adcode_hint: Optional[str] = Query(default=None)) -> dict:
-    return {"candidates": trust_repository.query_road(namespace, name, adcode_hint)}
+def query_road(
+    namespace: str,
+    name: str = Query(...),
+    adcode_hint: Optional[str] = Query(default=None),
+    min_similarity: Optional[float] = Query(default=None, ge=0.0, le=1.0),
+) -> dict:
+    return {"candidates": trust_repository.query_road(namespace, name, adcode_hint, min_similarity)}
 
 
 @router.get("/namespaces/{namespace}/poi")
@@ -25,5 +36,6 @@ def query_poi(
     name: str = Query(...),
     adcode_hint: Optional[str] = Query(default=None),
     top_k: int = Query(default=5),
+    min_similarity: Optional[float] = Query(default=None, ge=0.0, le=1.0),
 ) -> dict:
-    return {"candidates": trust_repository.query_poi(namespace, name, adcode_hint, top_k)}
+    return {"candidates": trust_repository.query_poi(namespace, name, adcode_hint, top_k, min_similarity)}
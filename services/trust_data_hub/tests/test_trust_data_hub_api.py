@@ -1,7 +1,16 @@
+import os
+from uuid import uuid4
+
 from fastapi.testclient import TestClient
 
+from packages.trust_hub import TrustHub
 from services.trust_data_hub.app.main import app
+from services.trust_data_hub.app.repositories.memory_index import TrustMemoryIndex
+from services.trust_data_hub.app.repositories.metadb_persister import MetaDbPersister
+from services.trust_data_hub.app.repositories.pg_engine import shared_engine
+from services.trust_data_hub.app.repositories.snapshot_artifact import MmapTrustProvider, SnapshotArtifactStore
 from services.trust_data_hub.app.repositories.trust_repository import trust_repository
+from services.trust_data_hub.app.repositories.trustdb_persister import TrustDbPersister
 
 
 client = TestClient(app)
@@ -437,3 +446,391 @@ def test_replay_persistence_and_governance_mapping_contract(monkeypatch) -> None
     runs = runs_resp.json()["runs"]
     assert runs
     assert any(item["snapshot_id"] == snapshot_id for item in runs)
+
+
+def test_bulk_queries_match_single_name_queries() -> None:
+    namespace = "system.trust.bulk"
+    source_id = "src-admin-bulk-001"
+    _register_source(namespace, source_id, dataset_variant="admin_v1")
+    snapshot_id = client.post(f"/v1/trust/ops/namespaces/{namespace}/sources/{source_id}/fetch-now").json()["snapshot_id"]
+    client.post(f"/v1/trust/ops/namespaces/{namespace}/snapshots/{snapshot_id}/validate")
+    client.post(f"/v1/trust/ops/namespaces/{namespace}/snapshots/{snapshot_id}/publish")
+    client.post(
+        f"/v1/trust/ops/namespaces/{namespace}/sources/{source_id}/promote",
+        json={"snapshot_id": snapshot_id, "activated_by": "tester", "activation_note": "bulk"},
+    )
+
+    names = ["杭州市", "西湖区", "杭州市", "不存在区"]
+    admin = trust_repository.query_admin_division_many(namespace, names)
+    assert list(admin) == ["杭州市", "西湖区", "不存在区"]
+    for name, rows in admin.items():
+        assert rows == trust_repository.query_admin_division(namespace, name)
+    assert admin["杭州市"]
+    assert admin["不存在区"] == []
+
+    roads = trust_repository.query_road_many(namespace, ["文三路"])
+    assert roads == {"文三路": trust_repository.query_road(namespace, "文三路")}
+    pois = trust_repository.query_poi_many(namespace, ["西溪"], top_k=1)
+    assert pois == {"西溪": trust_repository.query_poi(namespace, "西溪", top_k=1)}
+
+
+def test_persisters_share_one_pooled_engine() -> None:
+    meta = MetaDbPersister()
+    trustdb = TrustDbPersister()
+    if not (meta.enabled() and trustdb.enabled()):
+        return
+    engine = meta._engine()
+    assert engine is MetaDbPersister()._engine()
+    before = engine.pool.checkedin() + engine.pool.checkedout()
+    for _ in range(5):
+        trustdb.query_road("system.trust.bulk", "文三路")
+    assert engine.pool.checkedout() == 0
+    assert engine.pool.checkedin() + engine.pool.checkedout() <= max(before, 1)
+
+
+def test_persist_snapshot_loads_one_partition_per_snapshot() -> None:
+    persister = TrustDbPersister()
+    if not persister.enabled():
+        return
+    namespace = "system.trust.bulkload"
+    source_id = "src-bulkload-001"
+    payload = {
+        "roads": [{"road_id": "r-1", "name": "文三路\t东段", "normalized_name": "文三路", "alias_names": ["a\\b"]}],
+        "pois": [
+            {"poi_id": "p-1", "name": "西溪\n银泰", "normalized_name": "西溪银泰", "centroid": "120.083,30.286"},
+            {"poi_id": "p-2", "name": "无坐标", "normalized_name": "无坐标", "centroid": "bad"},
+        ],
+    }
+    persister.persist_snapshot(namespace, source_id, "snap-a", payload, "2026-01-01T00:00:00+00:00")
+    persister.persist_snapshot(namespace, source_id, "snap-b", payload, "2026-01-02T00:00:00+00:00")
+    persister.persist_snapshot(namespace, source_id, "snap-b", payload, "2026-01-02T00:00:00+00:00")
+
+    from sqlalchemy import text
+
+    from services.trust_data_hub.app.repositories.pg_engine import shared_engine
+    from services.trust_data_hub.app.repositories.schema_bootstrap import snapshot_partition_name
+
+    with shared_engine(persister._dsn).begin() as conn:
+        pois = conn.execute(
+            text(f"SELECT poi_id, name, snapshot_id, lon, lat FROM trust_data.{snapshot_partition_name('poi_index', 'snap-b')} ORDER BY poi_id")
+        ).all()
+        roads = conn.execute(
+            text(f"SELECT name, alias_names FROM trust_data.{snapshot_partition_name('road_index', 'snap-b')}")
+        ).all()
+        per_snapshot = conn.execute(
+            text("SELECT snapshot_id, COUNT(*) FROM trust_data.poi_index WHERE namespace_id=:ns GROUP BY snapshot_id ORDER BY 1"),
+            {"ns": namespace},
+        ).all()
+    assert [tuple(row) for row in pois] == [
+        ("p-1", "西溪\n银泰", "snap-b", 120.083, 30.286),
+        ("p-2", "无坐标", "snap-b", None, None),
+    ]
+    assert [tuple(row) for row in roads] == [("文三路\t东段", ["a\\b"])]
+    assert [tuple(row) for row in per_snapshot] == [("snap-a", 2), ("snap-b", 2)]
+
+
+def test_promote_flips_active_partition_and_retires_old_snapshots() -> None:
+    namespace = "system.trust.partition"
+    source_id = f"src-partition-{uuid4().hex[:8]}"
+    _register_source(namespace, source_id)
+    snapshot_ids = []
+    for _ in range(4):
+        snapshot_id = client.post(f"/v1/trust/ops/namespaces/{namespace}/sources/{source_id}/fetch-now").json()["snapshot_id"]
+        client.post(f"/v1/trust/ops/namespaces/{namespace}/snapshots/{snapshot_id}/validate")
+        assert client.post(f"/v1/trust/ops/namespaces/{namespace}/snapshots/{snapshot_id}/publish").status_code == 200
+        snapshot_ids.append(snapshot_id)
+
+    def _promote(snapshot_id: str) -> None:
+        resp = client.post(
+            f"/v1/trust/ops/namespaces/{namespace}/sources/{source_id}/promote",
+            json={"snapshot_id": snapshot_id, "activated_by": "tester", "activation_note": "flip", "confirm_high_diff": True},
+        )
+        assert resp.status_code == 200
+
+    _promote(snapshot_ids[0])
+    assert {row["snapshot_id"] for row in trust_repository._trustdb.query_road(namespace, "文三路")} == {snapshot_ids[0]}
+    _promote(snapshot_ids[2])
+    assert {row["snapshot_id"] for row in trust_repository._trustdb.query_road(namespace, "文三路")} == {snapshot_ids[2]}
+
+    # snapshot 3 awaits promotion and snapshot 0 is the rollback target; only 1 goes.
+    assert trust_repository._trustdb.retire_snapshots(namespace, source_id, keep=1) == [snapshot_ids[1]]
+    assert trust_repository._trustdb.retire_snapshots(namespace, source_id, keep=1) == []
+    _promote(snapshot_ids[3])
+    assert {row["snapshot_id"] for row in trust_repository._trustdb.query_road(namespace, "文三路")} == {snapshot_ids[3]}
+    _promote(snapshot_ids[0])
+    assert {row["snapshot_id"] for row in trust_repository._trustdb.query_road(namespace, "文三路")} == {snapshot_ids[0]}
+
+
+def test_admin_division_listing_shows_only_active_snapshots(tmp_path) -> None:
+    namespace = f"system.trust.listing-{uuid4().hex[:8]}"
+    source_id = "src-listing"
+    _register_source(namespace, source_id)
+    snapshot_ids = []
+    for _ in range(2):
+        snapshot_id = client.post(f"/v1/trust/ops/namespaces/{namespace}/sources/{source_id}/fetch-now").json()["snapshot_id"]
+        client.post(f"/v1/trust/ops/namespaces/{namespace}/snapshots/{snapshot_id}/validate")
+        client.post(f"/v1/trust/ops/namespaces/{namespace}/snapshots/{snapshot_id}/publish")
+        snapshot_ids.append(snapshot_id)
+    client.post(
+        f"/v1/trust/ops/namespaces/{namespace}/sources/{source_id}/promote",
+        json={"snapshot_id": snapshot_ids[0], "activated_by": "tester", "activation_note": "listing"},
+    )
+
+    hub = TrustHub(storage_path=tmp_path / "trust_hub.json", database_url=os.environ["DATABASE_URL"])
+    rows = hub.list_trust_data_admin_division(namespace, limit=1000)
+    assert rows
+    assert {row["snapshot_id"] for row in rows} == {snapshot_ids[0]}
+    assert len({row["division_id"] for row in rows}) == len(rows)
+
+
+def test_retire_keeps_published_snapshots_awaiting_promotion() -> None:
+    namespace = "system.trust.partition-pending"
+    source_id = f"src-partition-pending-{uuid4().hex[:8]}"
+    _register_source(namespace, source_id)
+
+    def _publish() -> str:
+        snapshot_id = client.post(f"/v1/trust/ops/namespaces/{namespace}/sources/{source_id}/fetch-now").json()["snapshot_id"]
+        client.post(f"/v1/trust/ops/namespaces/{namespace}/snapshots/{snapshot_id}/validate")
+        assert client.post(f"/v1/trust/ops/namespaces/{namespace}/snapshots/{snapshot_id}/publish").status_code == 200
+        return snapshot_id
+
+    active = _publish()
+    client.post(
+        f"/v1/trust/ops/namespaces/{namespace}/sources/{source_id}/promote",
+        json={"snapshot_id": active, "activated_by": "tester", "activation_note": "pending"},
+    )
+    pending = _publish()
+    # Fetched but never published: these must not push the pending snapshot out of retention.
+    for _ in range(3):
+        client.post(f"/v1/trust/ops/namespaces/{namespace}/sources/{source_id}/fetch-now")
+
+    assert trust_repository._trustdb.retire_snapshots(namespace, source_id, keep=1) == []
+    resp = client.post(
+        f"/v1/trust/ops/namespaces/{namespace}/sources/{source_id}/promote",
+        json={"snapshot_id": pending, "activated_by": "tester", "activation_note": "pending", "confirm_high_diff": True},
+    )
+    assert resp.status_code == 200
+    assert {row["snapshot_id"] for row in trust_repository._trustdb.query_road(namespace, "文三路")} == {pending}
+
+
+def test_lookups_cache_active_snapshots_until_promote() -> None:
+    from sqlalchemy import event
+
+    namespace = "system.trust.active-cache"
+    source_id = f"src-active-cache-{uuid4().hex[:8]}"
+    _register_source(namespace, source_id)
+    snapshot_ids = []
+    for _ in range(2):
+        snapshot_id = client.post(f"/v1/trust/ops/namespaces/{namespace}/sources/{source_id}/fetch-now").json()["snapshot_id"]
+        client.post(f"/v1/trust/ops/namespaces/{namespace}/snapshots/{snapshot_id}/validate")
+        client.post(f"/v1/trust/ops/namespaces/{namespace}/snapshots/{snapshot_id}/publish")
+        snapshot_ids.append(snapshot_id)
+        client.post(
+            f"/v1/trust/ops/namespaces/{namespace}/sources/{source_id}/promote",
+            json={"snapshot_id": snapshot_id, "activated_by": "tester", "activation_note": "cache", "confirm_high_diff": True},
+        )
+
+    statements: list[str] = []
+
+    def _record(_conn, _cursor, statement, *_args) -> None:
+        statements.append(statement)
+
+    trustdb = trust_repository._trustdb
+    engine = shared_engine(trustdb._dsn)
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        for _ in range(3):
+            assert {row["snapshot_id"] for row in trustdb.query_road(namespace, "文三路")} == {snapshot_ids[1]}
+        assert trustdb.query_road_many(namespace, ["文三路"])["文三路"]
+        assert len([sql for sql in statements if "trust_meta.active_release" in sql]) <= 1
+        assert not [sql for sql in statements if "set_config" in sql]
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    client.post(
+        f"/v1/trust/ops/namespaces/{namespace}/sources/{source_id}/promote",
+        json={"snapshot_id": snapshot_ids[0], "activated_by": "tester", "activation_note": "back", "confirm_high_diff": True},
+    )
+    assert {row["snapshot_id"] for row in trustdb.query_road(namespace, "文三路")} == {snapshot_ids[0]}
+
+
+def test_query_api_ranks_candidates_and_matches_alias_table() -> None:
+    namespace = "system.trust.rank"
+    source_id = f"src-rank-{uuid4().hex[:8]}"
+    _register_source(namespace, source_id)
+    snapshot_id = client.post(f"/v1/trust/ops/namespaces/{namespace}/sources/{source_id}/fetch-now").json()["snapshot_id"]
+    client.post(f"/v1/trust/ops/namespaces/{namespace}/snapshots/{snapshot_id}/validate")
+    client.post(f"/v1/trust/ops/namespaces/{namespace}/snapshots/{snapshot_id}/publish")
+    client.post(
+        f"/v1/trust/ops/namespaces/{namespace}/sources/{source_id}/promote",
+        json={"snapshot_id": snapshot_id, "activated_by": "tester", "activation_note": "rank"},
+    )
+
+    # Republish the active snapshot with names whose rank order differs from the level order.
+    trust_repository._trustdb.persist_snapshot(
+        namespace,
+        source_id,
+        snapshot_id,
+        {
+            "admin_division": [
+                {"adcode": "330100", "name": "西湖风景名胜区", "level": "city", "name_aliases": ["Ｈangzhou West Lake"]},
+                {"adcode": "330106", "name": "西湖区", "level": "district", "name_aliases": []},
+            ]
+        },
+        "2026-01-01T00:00:00+00:00",
+    )
+
+    candidates = client.get(f"/v1/trust/query/namespaces/{namespace}/admin-division", params={"name": "西湖"}).json()["candidates"]
+    assert [item["adcode"] for item in candidates] == ["330106", "330100"]
+    assert candidates[0]["rank_score"] > candidates[1]["rank_score"] > 0
+
+    # Only the NFKC/lower-cased alias side table holds "hangzhou west lake".
+    candidates = client.get(
+        f"/v1/trust/query/namespaces/{namespace}/admin-division", params={"name": "hangzhou", "min_similarity": 0.2}
+    ).json()["candidates"]
+    assert [item["adcode"] for item in candidates] == ["330100"]
+    assert trust_repository.query_admin_division_many(namespace, ["西湖", "hangzhou"]) == {
+        "西湖": trust_repository.query_admin_division(namespace, "西湖"),
+        "hangzhou": trust_repository.query_admin_division(namespace, "hangzhou"),
+    }
+
+    bad = client.get(f"/v1/trust/query/namespaces/{namespace}/road", params={"name": "文三路", "min_similarity": 2})
+    assert bad.status_code == 422
+
+
+def test_memory_lookup_index_matches_substrings_of_active_snapshots() -> None:
+    index = TrustMemoryIndex()
+    roads = [
+        {"road_id": "r-1", "name": "文三路", "normalized_name": "文三路", "admin_adcode": "330106"},
+        {"road_id": "r-2", "name": "文一西路", "normalized_name": "文一西路", "admin_adcode": "330110"},
+        {"road_id": "r-3", "name": "Ｗest Lake Rd", "normalized_name": "", "admin_adcode": "330106"},
+    ]
+    index.publish("ns.a", "src-1", "snap-1", {"road": roads})
+    assert index.search("ns.a", "road", "路") == []
+
+    index.activate("ns.a", "src-1", "snap-1")
+    assert [row["road_id"] for row in index.search("ns.a", "road", "路")] == ["r-1", "r-2"]
+    assert [row["road_id"] for row in index.search("ns.a", "road", "文一西")] == ["r-2"]
+    assert [row["road_id"] for row in index.search("ns.a", "road", " west lake ")] == ["r-3"]
+    assert index.search("ns.a", "road", "文西") == []
+    assert len(index.search("ns.a", "road", "")) == 3
+    assert index.search("ns.b", "road", "路") == []
+
+    # A newly published snapshot is only served once it is activated.
+    index.publish("ns.a", "src-1", "snap-2", {"road": roads[:1]})
+    assert len(index.search("ns.a", "road", "路")) == 2
+    index.activate("ns.a", "src-1", "snap-2")
+    assert [row["road_id"] for row in index.search("ns.a", "road", "路")] == ["r-1"]
+
+
+def test_repository_memory_fallback_follows_promotions(monkeypatch) -> None:
+    monkeypatch.setenv("TRUST_MEMORY_INDEX_ENABLED", "1")
+    namespace = "system.trust.memory"
+    source_id = f"src-memory-{uuid4().hex[:8]}"
+    _register_source(namespace, source_id)
+    snapshot_ids = []
+    for _ in range(2):
+        snapshot_id = client.post(f"/v1/trust/ops/namespaces/{namespace}/sources/{source_id}/fetch-now").json()["snapshot_id"]
+        client.post(f"/v1/trust/ops/namespaces/{namespace}/snapshots/{snapshot_id}/validate")
+        assert client.post(f"/v1/trust/ops/namespaces/{namespace}/snapshots/{snapshot_id}/publish").status_code == 200
+        snapshot_ids.append(snapshot_id)
+
+    for snapshot_id in snapshot_ids:
+        resp = client.post(
+            f"/v1/trust/ops/namespaces/{namespace}/sources/{source_id}/promote",
+            json={"snapshot_id": snapshot_id, "activated_by": "tester", "activation_note": "memory", "confirm_high_diff": True},
+        )
+        assert resp.status_code == 200
+        roads = trust_repository._memory_road(namespace, "三路", "330106")
+        assert [(row["road_id"], row["snapshot_id"]) for row in roads] == [("r-330106-001", snapshot_id)]
+        assert roads[0]["rank_score"] == round(2 / 3, 4)
+        admins = trust_repository._memory_admin_division(namespace, "杭州", None)
+        assert [row["adcode"] for row in admins] == ["330100"]
+        assert trust_repository._memory_poi(namespace, "银泰", "330110") == []
+
+
+def test_memory_index_is_opt_in_alongside_postgres(monkeypatch) -> None:
+    monkeypatch.delenv("TRUST_MEMORY_INDEX_ENABLED", raising=False)
+    monkeypatch.setattr(trust_repository._memory, "lookup_index", TrustMemoryIndex())
+    namespace = "system.trust.memory-off"
+    source_id = f"src-memory-off-{uuid4().hex[:8]}"
+    _register_source(namespace, source_id)
+    snapshot_id = client.post(f"/v1/trust/ops/namespaces/{namespace}/sources/{source_id}/fetch-now").json()["snapshot_id"]
+    client.post(f"/v1/trust/ops/namespaces/{namespace}/snapshots/{snapshot_id}/validate")
+    assert client.post(f"/v1/trust/ops/namespaces/{namespace}/snapshots/{snapshot_id}/publish").status_code == 200
+    client.post(
+        f"/v1/trust/ops/namespaces/{namespace}/sources/{source_id}/promote",
+        json={"snapshot_id": snapshot_id, "activated_by": "tester", "activation_note": "memory-off"},
+    )
+
+    assert trust_repository._memory.lookup_index._tables == {}
+    assert {row["snapshot_id"] for row in trust_repository.query_road(namespace, "文三路")} == {snapshot_id}
+
+
+def test_mmap_provider_serves_promoted_snapshot_artifacts(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("TRUST_MEMORY_INDEX_ENABLED", "1")
+    monkeypatch.setattr(trust_repository, "_artifacts", SnapshotArtifactStore(str(tmp_path)))
+    namespace = "system.trust.mmap"
+    source_id = f"src-mmap-{uuid4().hex[:8]}"
+    _register_source(namespace, source_id)
+    provider = MmapTrustProvider(str(tmp_path))
+
+    for _ in range(2):
+        snapshot_id = client.post(f"/v1/trust/ops/namespaces/{namespace}/sources/{source_id}/fetch-now").json()["snapshot_id"]
+        client.post(f"/v1/trust/ops/namespaces/{namespace}/snapshots/{snapshot_id}/validate")
+        assert client.post(f"/v1/trust/ops/namespaces/{namespace}/snapshots/{snapshot_id}/publish").status_code == 200
+        # Published but not promoted: workers keep serving the previous artifact.
+        assert snapshot_id not in {row["snapshot_id"] for row in provider.query_road(namespace, "文三路")}
+        resp = client.post(
+            f"/v1/trust/ops/namespaces/{namespace}/sources/{source_id}/promote",
+            json={"snapshot_id": snapshot_id, "activated_by": "tester", "activation_note": "mmap", "confirm_high_diff": True},
+        )
+        assert resp.status_code == 200
+
+        assert provider.query_road(namespace, "三路", adcode_hint="330106") == trust_repository._memory_road(namespace, "三路", "330106")
+        admins = trust_repository._memory_admin_division(namespace, "杭州", None)
+        assert provider.query_admin_division(namespace, "杭州") == [{**row, "valid_from": row["valid_from"].isoformat()} for row in admins]
+        assert provider.query_poi(namespace, "银泰", top_k=1) == trust_repository._memory_poi(namespace, "银泰", None)[:1]
+        assert {row["snapshot_id"] for row in provider.query_poi(namespace, "西溪")} == {snapshot_id}
+
+    assert provider.query_road(namespace, "不存在") == []
+    assert provider.query_road("system.trust.unknown", "文三路") == []
+
+
+def test_promote_rebuilds_a_retired_snapshot_artifact(monkeypatch, tmp_path) -> None:
+    store = SnapshotArtifactStore(str(tmp_path))
+    monkeypatch.setattr(trust_repository, "_artifacts", store)
+    namespace = "system.trust.mmap-rebuild"
+    source_id = f"src-mmap-rebuild-{uuid4().hex[:8]}"
+    _register_source(namespace, source_id)
+    provider = MmapTrustProvider(str(tmp_path))
+
+    def _promote(snapshot_id: str) -> None:
+        resp = client.post(
+            f"/v1/trust/ops/namespaces/{namespace}/sources/{source_id}/promote",
+            json={"snapshot_id": snapshot_id, "activated_by": "tester", "activation_note": "mmap", "confirm_high_diff": True},
+        )
+        assert resp.status_code == 200
+
+    snapshot_ids = []
+    for _ in range(2):
+        snapshot_id = client.post(f"/v1/trust/ops/namespaces/{namespace}/sources/{source_id}/fetch-now").json()["snapshot_id"]
+        client.post(f"/v1/trust/ops/namespaces/{namespace}/snapshots/{snapshot_id}/validate")
+        client.post(f"/v1/trust/ops/namespaces/{namespace}/snapshots/{snapshot_id}/publish")
+        snapshot_ids.append(snapshot_id)
+    _promote(snapshot_ids[0])
+    _promote(snapshot_ids[1])
+
+    # Retired artifact: rolling back rewrites it instead of leaving workers on snapshot 1.
+    store.artifact_path(namespace, source_id, snapshot_ids[0]).unlink()
+    _promote(snapshot_ids[0])
+    assert {row["snapshot_id"] for row in provider.query_road(namespace, "文三路")} == {snapshot_ids[0]}
+
+    # Another process rewrote the manifest: this one still re-points it on promote.
+    store.activate(namespace, source_id, snapshot_ids[1])
+    _promote(snapshot_ids[0])
+    assert {row["snapshot_id"] for row in provider.query_road(namespace, "文三路")} == {snapshot_ids[0]}
+
+    # Nothing to rebuild from: the entry goes, so workers stop serving the old snapshot.
+    store.activate(namespace, source_id, "snap-missing")
+    assert provider.query_road(namespace, "文三路") == []